@@ -0,0 +1,117 @@
+# core/assets/catalog.py
+"""
+Índices imutáveis sobre o catálogo de pratos (`core.assets.dishes`).
+
+O catálogo é estático durante a partida, então todos os índices e campos
+derivados são montados UMA vez na importação:
+
+- `by_key`         : chave → Dish (lookup O(1))
+- `by_ingredient`  : chave do ingrediente → pratos que o usam
+- `by_effect`      : chave de efeito de habilidade → pratos que o possuem
+- `by_stars`       : estrelas (1..5) → pratos
+- `by_price_tier`  : "$".."$$$$$" → pratos
+- `stats`          : chave → DishStats (tempo de preparo efetivo e efeitos agregados)
+
+Use a instância global `CATALOG`.
+"""
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from core.assets.dishes import DISHES, INGREDIENTS, Dish, Ingredient
+
+
+@dataclass(frozen=True)
+class DishStats:
+    """Campos derivados de um prato, pré-calculados a partir das habilidades."""
+    effective_prep_time: float
+    effects: Mapping[str, float]   # efeitos agregados de todas as habilidades
+
+
+def aggregate_effects(dish: Dish) -> Dict[str, float]:
+    """
+    Agrega os payloads `effect` de todas as habilidades do prato.
+
+    Chaves terminadas em `_mult` são multiplicadas; as demais são somadas
+    (ex.: dois `patience_add` de +1 viram +2).
+    """
+    out: Dict[str, float] = {}
+    for ab in (dish.abilities or []):
+        for name, value in ab.effect.items():
+            if not isinstance(value, (int, float)):
+                continue
+            if name.endswith("_mult"):
+                out[name] = out.get(name, 1.0) * float(value)
+            else:
+                out[name] = out.get(name, 0.0) + float(value)
+    return out
+
+
+def _freeze(groups: Dict) -> Mapping:
+    return MappingProxyType({k: tuple(v) for k, v in groups.items()})
+
+
+class DishCatalog:
+    """Catálogo indexado e somente-leitura de pratos e ingredientes."""
+
+    def __init__(self, dishes: Iterable[Dish], ingredients: Mapping[str, Ingredient]) -> None:
+        self.dishes: Tuple[Dish, ...] = tuple(dishes)
+        self.ingredients: Mapping[str, Ingredient] = MappingProxyType(dict(ingredients))
+
+        by_key: Dict[str, Dish] = {}
+        by_ingredient: Dict[str, List[Dish]] = {}
+        by_effect: Dict[str, List[Dish]] = {}
+        by_stars: Dict[int, List[Dish]] = {}
+        by_price_tier: Dict[str, List[Dish]] = {}
+        stats: Dict[str, DishStats] = {}
+
+        for d in self.dishes:
+            by_key[d.key] = d
+            # dict.fromkeys: o prato não entra duas vezes se repetir o ingrediente
+            for ing in dict.fromkeys(d.ingredient_keys):
+                by_ingredient.setdefault(ing, []).append(d)
+            effects = aggregate_effects(d)
+            for name in effects:
+                by_effect.setdefault(name, []).append(d)
+            by_stars.setdefault(d.stars, []).append(d)
+            by_price_tier.setdefault(d.price_tier, []).append(d)
+            stats[d.key] = DishStats(
+                effective_prep_time=d.effective_prep_time(),
+                effects=MappingProxyType(effects),
+            )
+
+        self.by_key: Mapping[str, Dish] = MappingProxyType(by_key)
+        self.by_ingredient: Mapping[str, Tuple[Dish, ...]] = _freeze(by_ingredient)
+        self.by_effect: Mapping[str, Tuple[Dish, ...]] = _freeze(by_effect)
+        self.by_stars: Mapping[int, Tuple[Dish, ...]] = _freeze(by_stars)
+        self.by_price_tier: Mapping[str, Tuple[Dish, ...]] = _freeze(by_price_tier)
+        self.stats: Mapping[str, DishStats] = MappingProxyType(stats)
+
+    # ---- consultas ----
+    def get(self, key: str) -> Optional[Dish]:
+        return self.by_key.get(key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.by_key
+
+    def __len__(self) -> int:
+        return len(self.dishes)
+
+    def prep_time(self, key: str) -> float:
+        """Tempo de preparo efetivo (já com multiplicadores das habilidades)."""
+        return self.stats[key].effective_prep_time
+
+    def effect(self, key: str, name: str, default: float = 0.0) -> float:
+        """Valor agregado de um efeito (ex.: 'patience_add') para o prato."""
+        return self.stats[key].effects.get(name, default)
+
+    def dishes_with_ingredient(self, ingredient_key: str) -> Tuple[Dish, ...]:
+        return self.by_ingredient.get(ingredient_key, ())
+
+    def dishes_with_effect(self, effect_name: str) -> Tuple[Dish, ...]:
+        return self.by_effect.get(effect_name, ())
+
+
+# Instância global (o catálogo não muda durante a partida)
+CATALOG = DishCatalog(DISHES, INGREDIENTS)
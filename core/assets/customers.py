@@ -8,10 +8,10 @@ from core.assets.order import Order
 class Customer:
     """Classe do jogo com suporte a paciência/temporizador."""
 
-    def __init__(self, id, player_menu):
+    def __init__(self, id, player_menu, order_generator=None):
         self.id = id
         self.status = "waiting"  # waiting, eating, done, left
-        self.order = Order(self, player_menu)
+        self.order = Order(self, player_menu, order_generator)
         self.timer = 0.0              # tempo esperando/consumindo
         self.satisfaction = 1.0
 
@@ -66,9 +66,9 @@ class Customer:
 
 class CommonCustomer(Customer):
     """Cliente comum: paciência média."""
-    def __init__(self, id, player_menu):
-        super().__init__(id, player_menu)
-        self.type = "comum"
+    def __init__(self, id, player_menu, order_generator=None):
+        self.type = "comum"  # antes do super(): o pedido é sorteado pelo tipo
+        super().__init__(id, player_menu, order_generator)
         self.patience = random.uniform(70, 80)
         self.max_patience = self.patience
 
@@ -85,9 +85,9 @@ class CommonCustomer(Customer):
 
 class ImpatientCustomer(Customer):
     """Cliente apressado: paciência menor."""
-    def __init__(self, id, player_menu):
-        super().__init__(id, player_menu)
+    def __init__(self, id, player_menu, order_generator=None):
         self.type = "apressado"
+        super().__init__(id, player_menu, order_generator)
         self.patience = random.uniform(40, 50)
         self.max_patience = self.patience
 
@@ -104,9 +104,9 @@ class ImpatientCustomer(Customer):
 
 class BossCustomer(Customer):
     """Cliente 'boss': muito paciente e dá gorjeta maior."""
-    def __init__(self, id, player_menu):
-        super().__init__(id, player_menu)
+    def __init__(self, id, player_menu, order_generator=None):
         self.type = "boss"
+        super().__init__(id, player_menu, order_generator)
         self.patience = random.uniform(60, 90)
         self.max_patience = self.patience
         self.reward_multiplier = 2.0
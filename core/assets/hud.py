@@ -5,14 +5,38 @@ import math
 
 from settings import Settings
 from utils.audio_manager import audio_manager
+from core.assets.observable import Observable
+from core.gui.digit_atlas import get_atlas
 
 
 # assets/hud.py (ou onde sua classe Money vive)
 import pygame
 from settings import Settings  # só se você usar para carregar imagem/fonte fora daqui
 
+
+class HudRenderStats:
+    """Contadores de renderização de texto da HUD (render real x reaproveitado)."""
+
+    def __init__(self):
+        self.renders = 0     # textos recompostos (atlas de dígitos)
+        self.avoided = 0     # frames que reaproveitaram a surface em cache
+
+    def reset(self):
+        self.renders = 0
+        self.avoided = 0
+
+
+HUD_STATS = HudRenderStats()
+
+
 class Money:
-    """HUD que exibe/atualiza o dinheiro do RESTAURANTE ATIVO do jogador."""
+    """
+    HUD que exibe/atualiza o dinheiro do RESTAURANTE ATIVO do jogador.
+
+    O valor exibido chega pela assinatura `Player.subscribe_money`; o render
+    não consulta o restaurante a cada frame e só refaz o texto quando o valor
+    muda.
+    """
     def __init__(self, x, y, image, font, game):
         self.x = x
         self.y = y
@@ -20,6 +44,28 @@ class Money:
         self.font = font
         self.game = game       # precisamos do game para chegar no player -> restaurante ativo
 
+        self._atlas = get_atlas(font, (65, 40, 20))
+        self._player = None    # jogador assinado (troca se game.player mudar)
+        self._amount = 0
+        self._text = None      # surface do texto (None = precisa renderizar)
+        self._bind_player()
+
+    def _bind_player(self):
+        player = getattr(self.game, "player", None)
+        self._player = player
+        if player is not None and hasattr(player, "subscribe_money"):
+            player.subscribe_money(self._on_money)
+            r = player.get_active_restaurant()
+            self._amount = r.money if r else 0
+        else:
+            self._amount = self.get_amount()
+        self._text = None
+
+    def _on_money(self, value):
+        if value != self._amount:
+            self._amount = value
+            self._text = None
+
     # --- util ---
     @staticmethod
     def _fmt(v: int) -> str:
@@ -63,16 +109,30 @@ class Money:
         screen.blit(self.image, (self.x, self.y))
 
         # texto centralizado no badge
-        amount = self.get_amount()
-        text = self.font.render(self._fmt(amount), True, (65, 40, 20))
+        if getattr(self.game, "player", None) is not self._player:
+            self._bind_player()
+        if self._text is None:
+            self._text = self._atlas.render(self._fmt(self._amount))
+            HUD_STATS.renders += 1
+        else:
+            HUD_STATS.avoided += 1
+        text = self._text
         cx = self.x + self.image.get_width() // 2
         cy = self.y + 38  # ajusta conforme seu sprite
         text_rect = text.get_rect(center=(cx, cy))
         screen.blit(text, text_rect)
 
 
-class Clock:
-    """Classe que representa o relógio de parede do jogo."""
+class Clock(Observable):
+    """
+    Classe que representa o relógio de parede do jogo.
+
+    `time` (horas, minutos) é observável: muda uma vez por minuto do jogo e
+    é o único gatilho para refazer o texto da hora.
+    """
+
+    _OBSERVED = frozenset({"time"})
+
     def __init__(self, x, y, clock_image, font):
         self.x = x
         self.y = y
@@ -81,18 +141,23 @@ class Clock:
         self.elapsed_time = 0
         self.total_duration = 12 * 60  # 12 minutos em segundos
 
+        self._atlas = get_atlas(font, (255, 255, 220))
+        self._text = None
+        self.subscribe(self._on_time, ("time",))
+        self.time = self.current_time()
+
+    def _on_time(self, clock, name, old, new):
+        self._text = None
+
     def update(self, dt):
         self.elapsed_time += dt
         if self.elapsed_time > self.total_duration:
             self.elapsed_time = self.total_duration
+        self.time = self.current_time()
 
-    def render(self, screen):
-        # Desenha o relógio base
-        screen.blit(self.image, (self.x, self.y))
-
-        # Tempo atual
-        time_ratio = self.elapsed_time / self.total_duration
-        game_minutes = int(time_ratio * 720)  # 12 horas = 720 minutos
+    def current_time(self):
+        """Retorna (horas, minutos) do relógio do jogo."""
+        game_minutes = int(self.elapsed_time / self.total_duration * 720)  # 12 horas = 720 minutos
 
         hours = 12 + (game_minutes // 60)
         minutes = game_minutes % 60
@@ -100,9 +165,14 @@ class Clock:
         # Quando ultrapassa 23h, vira 00h
         if hours >= 24:
             hours -= 24
+        return hours, minutes
 
-        # Exibição final
-        time_str = f"{hours:02}:{minutes:02}"
+    def render(self, screen):
+        # Desenha o relógio base
+        screen.blit(self.image, (self.x, self.y))
+
+        # Tempo atual
+        time_ratio = self.elapsed_time / self.total_duration
 
         # Desenhar ponteiro
         center = (self.x + 40, self.y + 48)
@@ -112,7 +182,12 @@ class Clock:
         end_y = center[1] + math.sin(math.radians(angle)) * length
         pygame.draw.line(screen, (60, 40, 20), center, (end_x, end_y), 4)
 
-        # Desenhar hora
-        text = self.font.render(time_str, True, (255, 255, 220))
-        screen.blit(text, (self.x + 90, self.y + 20))
+        # Desenhar hora (texto refeito só quando o minuto muda)
+        if self._text is None:
+            hours, minutes = self.time
+            self._text = self._atlas.render(f"{hours:02}:{minutes:02}")
+            HUD_STATS.renders += 1
+        else:
+            HUD_STATS.avoided += 1
+        screen.blit(self._text, (self.x + 90, self.y + 20))
         
\ No newline at end of file
@@ -0,0 +1,302 @@
+# core/assets/inventory.py
+"""
+Livro-razão (ledger) do estoque de um restaurante.
+
+- Toda movimentação vira uma transação APPEND-ONLY em lote: uma compra do
+  supermercado (carrinho inteiro) ou o consumo de um pedido (todos os
+  ingredientes do prato) geram UMA transação cada.
+- Os saldos ficam num `array` compacto indexado pelo ingrediente
+  (mesma ordem de `INGREDIENTS`; nomes desconhecidos ganham novos índices).
+- Acumuladores do dia corrente permitem fechar o resumo diário em O(nº de
+  ingredientes), sem reprocessar o histórico.
+"""
+
+from array import array
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from core.assets.menu_query import MENU_QUERY
+
+
+# Tipos de transação
+PURCHASE = "purchase"
+CONSUME = "consume"
+ADJUST = "adjust"
+
+
+@dataclass(frozen=True)
+class Transaction:
+    """Lote imutável de movimentações de estoque."""
+    kind: str                              # purchase | consume | adjust
+    day: int
+    entries: Tuple[Tuple[int, int], ...]   # (índice do ingrediente, delta)
+    money: float = 0.0                     # custo (compra) ou receita associada
+    ref: str = ""                          # ex.: chave do prato consumido
+
+
+@dataclass
+class DaySummary:
+    """Resumo de um dia fechado (gerado a partir dos acumuladores)."""
+    day: int
+    purchased: Dict[str, int] = field(default_factory=dict)
+    consumed: Dict[str, int] = field(default_factory=dict)
+    spent: float = 0.0
+    orders: int = 0
+    transactions: int = 0
+
+
+class InventoryLedger:
+    """Saldos + histórico append-only + acumuladores diários."""
+
+    def __init__(self) -> None:
+        # chaves conhecidas; começa com o catálogo e cresce sob demanda
+        self.keys: List[str] = list(MENU_QUERY.ingredient_keys)
+        self._index: Dict[str, int] = {k: i for i, k in enumerate(self.keys)}
+
+        self.totals = array("l", [0] * len(self.keys))
+        self.transactions: List[Transaction] = []
+        self.day_summaries: List[DaySummary] = []
+        self.version = 0
+
+        self._reset_day()
+
+    # ------------------------------------------------------------------ #
+    # Índices
+    # ------------------------------------------------------------------ #
+    def index_of(self, name: str) -> int:
+        """Índice compacto do ingrediente (aceita chave ou nome exibido)."""
+        key = MENU_QUERY.resolve(name) or name
+        idx = self._index.get(key)
+        if idx is None:
+            idx = len(self.keys)
+            self.keys.append(key)
+            self._index[key] = idx
+            self.totals.append(0)
+            self._day_in.append(0)
+            self._day_out.append(0)
+        return idx
+
+    def _reset_day(self) -> None:
+        n = len(self.keys)
+        self._day_in = array("l", [0] * n)
+        self._day_out = array("l", [0] * n)
+        self._day_spent = 0.0
+        self._day_orders = 0
+        self._day_txns = 0
+
+    # ------------------------------------------------------------------ #
+    # Escrita
+    # ------------------------------------------------------------------ #
+    def commit(
+        self,
+        kind: str,
+        deltas: Mapping[str, int],
+        day: int,
+        money: float = 0.0,
+        ref: str = "",
+    ) -> Transaction:
+        """
+        Registra um lote de deltas (nome → quantidade) como uma transação.
+
+        Saídas maiores que o saldo são limitadas a ele: nenhum saldo fica
+        negativo, e a transação registra só o que de fato saiu.
+        """
+        merged: Dict[int, int] = {}
+        for name, qty in deltas.items():
+            if qty:
+                idx = self.index_of(name)
+                merged[idx] = merged.get(idx, 0) + int(qty)
+
+        entries = tuple(
+            (idx, delta) for idx, delta in
+            ((idx, max(delta, -self.totals[idx])) for idx, delta in sorted(merged.items()))
+            if delta
+        )
+        txn = Transaction(kind, int(day), entries, float(money), ref)
+        self.transactions.append(txn)
+        self._apply(txn)
+        return txn
+
+    def _apply(self, txn: Transaction) -> None:
+        totals, day_in, day_out = self.totals, self._day_in, self._day_out
+        for idx, delta in txn.entries:
+            totals[idx] += delta
+            if delta > 0:
+                day_in[idx] += delta
+            else:
+                day_out[idx] -= delta
+        if txn.kind == PURCHASE:
+            self._day_spent += txn.money
+        elif txn.kind == CONSUME:
+            self._day_orders += 1
+        self._day_txns += 1
+        self.version += 1
+
+    def purchase(self, cart: Mapping[str, int], cost: float, day: int) -> Transaction:
+        """Compra de um carrinho inteiro (uma transação)."""
+        return self.commit(PURCHASE, cart, day, money=cost)
+
+    def consume(self, needs: Mapping[str, int], day: int, ref: str = "") -> Optional[Transaction]:
+        """
+        Consome os ingredientes de um pedido. Retorna None (sem registrar nada)
+        se algum ingrediente não tiver saldo suficiente.
+        """
+        for name, qty in needs.items():
+            if self.quantity(name) < qty:
+                return None
+        return self.commit(CONSUME, {k: -q for k, q in needs.items()}, day, ref=ref)
+
+    # ------------------------------------------------------------------ #
+    # Leitura
+    # ------------------------------------------------------------------ #
+    def quantity(self, name: str) -> int:
+        key = MENU_QUERY.resolve(name) or name
+        idx = self._index.get(key)
+        return self.totals[idx] if idx is not None else 0
+
+    def as_dict(self) -> Dict[str, int]:
+        """Saldos positivos por chave (formato de `Restaurant.owned_ingredients`)."""
+        return {k: q for k, q in zip(self.keys, self.totals) if q > 0}
+
+    def close_day(self, day: int) -> DaySummary:
+        """Fecha o dia corrente a partir dos acumuladores e zera-os."""
+        summary = DaySummary(
+            day=int(day),
+            purchased={k: q for k, q in zip(self.keys, self._day_in) if q},
+            consumed={k: q for k, q in zip(self.keys, self._day_out) if q},
+            spent=self._day_spent,
+            orders=self._day_orders,
+            transactions=self._day_txns,
+        )
+        self.day_summaries.append(summary)
+        self._reset_day()
+        return summary
+
+    def transactions_since(self, start: int) -> List[Transaction]:
+        """Transações a partir da posição `start` do histórico."""
+        return self.transactions[start:]
+
+    # ------------------------------------------------------------------ #
+    # Persistência
+    # ------------------------------------------------------------------ #
+    def to_dict(self) -> dict:
+        """
+        Snapshot barato para salvamento: copia só listas de referências.
+        Transações e resumos fechados são imutáveis, então podem ser
+        serializados depois (em outra thread) com `to_jsonable`.
+        """
+        return {
+            "keys": list(self.keys),
+            "totals": self.totals.tolist(),
+            "transactions": list(self.transactions),
+            "day_summaries": list(self.day_summaries),
+            "day_in": self._day_in.tolist(),
+            "day_out": self._day_out.tolist(),
+            "day_spent": self._day_spent,
+            "day_orders": self._day_orders,
+            "day_txns": self._day_txns,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "InventoryLedger":
+        ledger = cls()
+        ledger.keys = list(data.get("keys", ledger.keys))
+        ledger._index = {k: i for i, k in enumerate(ledger.keys)}
+        n = len(ledger.keys)
+
+        def _arr(values):
+            values = list(values or [])
+            return array("l", values + [0] * (n - len(values)))
+
+        ledger.totals = _arr(data.get("totals"))
+        ledger.transactions = [as_transaction(t) for t in data.get("transactions", [])]
+        ledger.day_summaries = [as_day_summary(s) for s in data.get("day_summaries", [])]
+        ledger._day_in = _arr(data.get("day_in"))
+        ledger._day_out = _arr(data.get("day_out"))
+        ledger._day_spent = float(data.get("day_spent", 0.0))
+        ledger._day_orders = int(data.get("day_orders", 0))
+        ledger._day_txns = int(data.get("day_txns", 0))
+        return ledger
+
+    def apply_delta(self, delta: Mapping) -> None:
+        """
+        Aplica um delta gerado por `ledger_delta` (replay do journal de saves).
+        As listas são truncadas na posição de origem antes de estender, então
+        reaplicar o mesmo delta não duplica nada.
+        """
+        start = delta["keys_from"]
+        self.keys[start:] = delta["keys"]
+        self._index = {k: i for i, k in enumerate(self.keys)}
+
+        start = delta["txns_from"]
+        self.transactions[start:] = [as_transaction(t) for t in delta["txns"]]
+        start = delta["summaries_from"]
+        self.day_summaries[start:] = [as_day_summary(s) for s in delta["summaries"]]
+
+        self.totals = array("l", delta["totals"])
+        self._day_in = array("l", delta["day_in"])
+        self._day_out = array("l", delta["day_out"])
+        self._day_spent = float(delta["day_spent"])
+        self._day_orders = int(delta["day_orders"])
+        self._day_txns = int(delta["day_txns"])
+        self.version += 1
+
+
+_EMPTY_SNAPSHOT = {"keys": [], "transactions": [], "day_summaries": []}
+
+
+def ledger_delta(prev: Optional[Mapping], curr: Mapping) -> Optional[dict]:
+    """
+    Diferença entre dois snapshots de `InventoryLedger.to_dict` (None se
+    nada mudou). Como o histórico é append-only, só os sufixos novos entram
+    no delta; saldos e acumuladores do dia vão inteiros (O(nº ingredientes)).
+    """
+    prev = prev or _EMPTY_SNAPSHOT
+    n_keys, n_txns, n_sums = len(prev["keys"]), len(prev["transactions"]), len(prev["day_summaries"])
+    scalars = ("totals", "day_in", "day_out", "day_spent", "day_orders", "day_txns")
+    if (
+        len(curr["keys"]) == n_keys
+        and len(curr["transactions"]) == n_txns
+        and len(curr["day_summaries"]) == n_sums
+        and all(prev.get(k) == curr[k] for k in scalars)
+    ):
+        return None
+
+    delta = {
+        "keys_from": n_keys, "keys": curr["keys"][n_keys:],
+        "txns_from": n_txns, "txns": curr["transactions"][n_txns:],
+        "summaries_from": n_sums, "summaries": curr["day_summaries"][n_sums:],
+    }
+    for k in scalars:
+        delta[k] = curr[k]
+    return delta
+
+
+def as_transaction(t) -> Transaction:
+    """Aceita uma `Transaction` ou sua forma serializada por `to_jsonable`."""
+    if isinstance(t, Transaction):
+        return t
+    return Transaction(t[0], int(t[1]), tuple((int(i), int(d)) for i, d in t[2]), float(t[3]), t[4])
+
+
+def as_day_summary(s) -> DaySummary:
+    return s if isinstance(s, DaySummary) else DaySummary(**s)
+
+
+def to_jsonable(obj):
+    """Hook `default=` do json para os registros do ledger."""
+    if isinstance(obj, Transaction):
+        return [obj.kind, obj.day, [list(e) for e in obj.entries], obj.money, obj.ref]
+    if isinstance(obj, DaySummary):
+        return asdict(obj)
+    if isinstance(obj, array):
+        return obj.tolist()
+    raise TypeError(f"Objeto não serializável: {type(obj).__name__}")
+
+
+def dish_needs(ingredient_keys: Iterable[str]) -> Dict[str, int]:
+    """Converte a lista de ingredientes de um prato em {chave: quantidade}."""
+    out: Dict[str, int] = {}
+    for key in ingredient_keys:
+        out[key] = out.get(key, 0) + 1
+    return out
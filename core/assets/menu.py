@@ -1,7 +1,8 @@
 # core/assets/menu.py
-from typing import List
+from typing import List, Optional, Set, Tuple
 
-from core.assets.dishes import DISHES, Dish
+from core.assets.catalog import CATALOG
+from core.assets.dishes import Dish
 
 
 class PlayerMenu:
@@ -9,21 +10,33 @@ class PlayerMenu:
     Armazena os pratos desbloqueados do jogador.
     Você pode persistir/carregar isso em savegames depois.
 
+    `owned_keys` mantém a ordem de desbloqueio; um set espelha as chaves para
+    `is_owned` O(1) e a tupla de pratos é cacheada até o próximo `unlock`.
+
     OBS (teste): iniciamos com TODOS os pratos do catálogo desbloqueados,
     apenas para fins de teste/validação do cardápio.
     """
 
     def __init__(self) -> None:
         # TESTE: desbloquear todos os pratos disponíveis no catálogo
-        self.owned_keys: List[str] = [d.key for d in DISHES]
-
-    def owned_dishes(self) -> List[Dish]:
-        catalog = {d.key: d for d in DISHES}
-        return [catalog[k] for k in self.owned_keys if k in catalog]
+        self.owned_keys: List[str] = [d.key for d in CATALOG.dishes]
+        self._owned_set: Set[str] = set(self.owned_keys)
+        self._owned_cache: Optional[Tuple[Dish, ...]] = None
+        self.version = 0  # incrementa a cada desbloqueio (invalida caches externos)
+
+    def owned_dishes(self) -> Tuple[Dish, ...]:
+        if self._owned_cache is None:
+            self._owned_cache = tuple(
+                CATALOG.by_key[k] for k in self.owned_keys if k in CATALOG.by_key
+            )
+        return self._owned_cache
 
     def unlock(self, dish_key: str) -> None:
-        if dish_key not in self.owned_keys:
+        if dish_key not in self._owned_set:
             self.owned_keys.append(dish_key)
+            self._owned_set.add(dish_key)
+            self._owned_cache = None
+            self.version += 1
 
     def is_owned(self, dish_key: str) -> bool:
-        return dish_key in self.owned_keys
+        return dish_key in self._owned_set
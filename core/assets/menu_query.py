@@ -0,0 +1,183 @@
+# core/assets/menu_query.py
+"""
+Consultas de viabilidade do cardápio a partir do estoque.
+
+Responde, sem varrer `Dish.ingredient_keys` de todos os pratos:
+- quais pratos dá para cozinhar com o estoque atual;
+- quantas porções de um prato o estoque rende;
+- o que falta comprar para conseguir fazer um prato.
+
+Representação:
+- cada ingrediente de `INGREDIENTS` recebe um bit (ordem do dicionário);
+- cada prato vira uma máscara de ingredientes + lista (índice, quantidade);
+- índice reverso: ingrediente → máscara dos pratos que o usam.
+
+Com isso, "pratos viáveis" é um OR das máscaras reversas dos ingredientes
+em falta, negado sobre o conjunto de pratos — O(nº de ingredientes).
+
+O estoque aceita tanto chaves (`"tomato"`) quanto nomes exibidos
+(`"Tomate"`), já que o Supermercado registra compras pelo nome. Itens do
+Supermercado sem ingrediente próprio no catálogo são mapeados em
+`SHOP_ALIASES`.
+"""
+
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from core.assets.catalog import CATALOG, DishCatalog
+from core.assets.dishes import Dish
+
+# Nomes do Supermercado -> chave do ingrediente que eles abastecem
+SHOP_ALIASES: Dict[str, str] = {
+    "Cenoura": "veggies",
+    "Batata": "veggies",
+    "Brócolis": "veggies",
+}
+
+
+class MenuQueryEngine:
+    """Índices de bits sobre ingredientes/pratos e consultas de estoque."""
+
+    def __init__(self, catalog: DishCatalog) -> None:
+        self.catalog = catalog
+
+        # ---- ingredientes: chave <-> bit ----
+        self.ingredient_keys: Tuple[str, ...] = tuple(catalog.ingredients.keys())
+        self.ingredient_index: Dict[str, int] = {
+            k: i for i, k in enumerate(self.ingredient_keys)
+        }
+        # nomes exibidos e chaves resolvem para a mesma chave
+        self._alias: Dict[str, str] = {}
+        for k, ing in catalog.ingredients.items():
+            self._alias[k] = k
+            self._alias.setdefault(ing.name, k)
+            self._alias.setdefault(ing.name.lower(), k)
+        for name, k in SHOP_ALIASES.items():
+            if k in self.ingredient_index:
+                self._alias.setdefault(name, k)
+                self._alias.setdefault(name.lower(), k)
+
+        # ---- pratos: chave <-> bit ----
+        self.dishes: Tuple[Dish, ...] = catalog.dishes
+        self.dish_index: Dict[str, int] = {d.key: i for i, d in enumerate(self.dishes)}
+        self.all_dishes_mask = (1 << len(self.dishes)) - 1
+
+        self.dish_mask: Dict[str, int] = {}                       # ingredientes do prato
+        self.dish_needs: Dict[str, Tuple[Tuple[int, int], ...]] = {}  # (bit, qtd) por porção
+        self.users_mask: List[int] = [0] * len(self.ingredient_keys)   # índice reverso
+
+        for di, d in enumerate(self.dishes):
+            counts: Dict[int, int] = {}
+            for key in d.ingredient_keys:
+                idx = self.ingredient_index.get(key)
+                if idx is not None:
+                    counts[idx] = counts.get(idx, 0) + 1
+            mask = 0
+            for idx in counts:
+                mask |= 1 << idx
+                self.users_mask[idx] |= 1 << di
+            self.dish_mask[d.key] = mask
+            self.dish_needs[d.key] = tuple(sorted(counts.items()))
+
+    # ------------------------------------------------------------------ #
+    # Estoque
+    # ------------------------------------------------------------------ #
+    def resolve(self, name: str) -> Optional[str]:
+        """Converte chave ou nome exibido no ingrediente correspondente (ou None)."""
+        return self._alias.get(name) or self._alias.get(str(name).lower())
+
+    def stock_counts(self, stock: Mapping[str, int]) -> List[int]:
+        """Estoque como lista indexada pelo bit do ingrediente."""
+        counts = [0] * len(self.ingredient_keys)
+        for name, qty in stock.items():
+            key = self.resolve(name)
+            if key is not None and qty > 0:
+                counts[self.ingredient_index[key]] += int(qty)
+        return counts
+
+    def stock_mask(self, stock: Mapping[str, int]) -> int:
+        """Máscara dos ingredientes com quantidade > 0."""
+        mask = 0
+        for idx, qty in enumerate(self.stock_counts(stock)):
+            if qty > 0:
+                mask |= 1 << idx
+        return mask
+
+    # ------------------------------------------------------------------ #
+    # Consultas
+    # ------------------------------------------------------------------ #
+    def feasible_mask(self, stock_mask: int, candidates: Optional[int] = None) -> int:
+        """Máscara dos pratos cujos ingredientes estão todos em `stock_mask`."""
+        blocked = 0
+        missing = ~stock_mask
+        for idx, users in enumerate(self.users_mask):
+            if missing >> idx & 1:
+                blocked |= users
+        base = self.all_dishes_mask if candidates is None else candidates
+        return base & ~blocked
+
+    def feasible_dishes(
+        self, stock: Mapping[str, int], keys: Optional[Iterable[str]] = None
+    ) -> Tuple[Dish, ...]:
+        """Pratos que podem ser feitos ao menos uma vez (opcionalmente só entre `keys`)."""
+        mask = self.feasible_mask(self.stock_mask(stock), self.mask_of(keys) if keys is not None else None)
+        return self.dishes_in(mask)
+
+    def can_cook(self, dish_key: str, stock: Mapping[str, int]) -> bool:
+        return self.max_servings(dish_key, stock) > 0
+
+    def max_servings(self, dish_key: str, stock: Mapping[str, int]) -> int:
+        """Quantas porções do prato o estoque rende (0 se faltar algo)."""
+        return self.servings_from_counts(dish_key, self.stock_counts(stock))
+
+    def servings_from_counts(self, dish_key: str, counts: List[int]) -> int:
+        """Igual a `max_servings`, mas com o estoque já convertido por `stock_counts`."""
+        needs = self.dish_needs.get(dish_key)
+        if not needs:
+            return 0
+        return min(counts[idx] // qty for idx, qty in needs)
+
+    def shopping_list(
+        self, dish_key: str, stock: Mapping[str, int], servings: int = 1
+    ) -> Dict[str, int]:
+        """O que falta comprar (chave → quantidade) para fazer `servings` porções."""
+        counts = self.stock_counts(stock)
+        out: Dict[str, int] = {}
+        for idx, qty in self.dish_needs.get(dish_key, ()):
+            lack = qty * max(0, int(servings)) - counts[idx]
+            if lack > 0:
+                out[self.ingredient_keys[idx]] = lack
+        return out
+
+    def unlocked_by(self, ingredient: str, stock: Mapping[str, int]) -> Tuple[Dish, ...]:
+        """Pratos que passam a ser viáveis se comprarmos o ingrediente informado."""
+        key = self.resolve(ingredient)
+        if key is None:
+            return ()
+        idx = self.ingredient_index[key]
+        mask = self.stock_mask(stock)
+        before = self.feasible_mask(mask)
+        after = self.feasible_mask(mask | (1 << idx))
+        return self.dishes_in(after & ~before)
+
+    # ------------------------------------------------------------------ #
+    # Helpers de máscara
+    # ------------------------------------------------------------------ #
+    def mask_of(self, keys: Iterable[str]) -> int:
+        mask = 0
+        for k in keys:
+            i = self.dish_index.get(k)
+            if i is not None:
+                mask |= 1 << i
+        return mask
+
+    def dishes_in(self, mask: int) -> Tuple[Dish, ...]:
+        out = []
+        while mask:
+            low = mask & -mask
+            out.append(self.dishes[low.bit_length() - 1])
+            mask ^= low
+        return tuple(out)
+
+
+# Instância global, construída sobre o catálogo global
+MENU_QUERY = MenuQueryEngine(CATALOG)
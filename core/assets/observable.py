@@ -0,0 +1,47 @@
+# core/assets/observable.py
+"""
+Camada observável do modelo do jogo.
+
+Classes que herdam `Observable` declaram em `_OBSERVED` os campos cujas
+atribuições viram eventos de mudança. Quem se interessa (ex.: widgets da
+HUD) se registra com `subscribe` e é chamado como
+`callback(objeto, campo, antigo, novo)` — só quando o valor realmente muda.
+
+Atribuições a outros campos seguem o caminho normal do Python; o custo extra
+é um teste de pertinência num frozenset.
+"""
+
+from typing import Callable, Iterable, Optional
+
+
+class Observable:
+    """Mixin que emite eventos de mudança para os campos de `_OBSERVED`."""
+
+    _OBSERVED: frozenset = frozenset()
+
+    def __setattr__(self, name, value):
+        if name not in self._OBSERVED:
+            object.__setattr__(self, name, value)
+            return
+        old = self.__dict__.get(name)
+        object.__setattr__(self, name, value)
+        listeners = self.__dict__.get("_listeners")
+        if listeners and old != value:
+            for callback, fields in tuple(listeners):
+                if fields is None or name in fields:
+                    callback(self, name, old, value)
+
+    def subscribe(self, callback: Callable, fields: Optional[Iterable[str]] = None) -> None:
+        """
+        Registra `callback(objeto, campo, antigo, novo)`.
+
+        :param fields: Restringe os eventos a esses campos (padrão: todos)
+        """
+        listeners = self.__dict__.setdefault("_listeners", [])
+        if all(cb != callback for cb, _ in listeners):
+            listeners.append((callback, frozenset(fields) if fields is not None else None))
+
+    def unsubscribe(self, callback: Callable) -> None:
+        listeners = self.__dict__.get("_listeners")
+        if listeners:
+            listeners[:] = [(cb, f) for cb, f in listeners if cb != callback]
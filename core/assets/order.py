@@ -3,35 +3,50 @@
 import random
 from core.assets.menu import PlayerMenu
 from core.assets.dishes import Dish
+from core.assets.catalog import CATALOG
 
 
 class Order:
     """Representa um pedido feito por um cliente."""
 
-    def __init__(self, customer, player_menu: PlayerMenu):
+    def __init__(self, customer, player_menu: PlayerMenu, generator=None):
         self.customer = customer
 
-        # escolhe um prato aleatório entre os pratos que o jogador já desbloqueou
-        owned = player_menu.owned_dishes()
-        if not owned:
-            raise ValueError("O jogador não possui nenhum prato desbloqueado!")
-
-        self.dish: Dish = random.choice(owned)
+        if generator is not None:
+            # sorteio ponderado entre os pratos viáveis com o estoque atual
+            self.dish: Dish = generator.pick(getattr(customer, "type", None))
+        else:
+            # escolhe um prato aleatório entre os pratos que o jogador já desbloqueou
+            owned = player_menu.owned_dishes()
+            if not owned:
+                raise ValueError("O jogador não possui nenhum prato desbloqueado!")
+            self.dish = random.choice(owned)
+        # tempo efetivo pré-calculado no catálogo (não recalcula a cada frame)
+        stats = CATALOG.stats.get(self.dish.key)
+        self.prep_time = stats.effective_prep_time if stats else self.dish.effective_prep_time()
 
         self.status = "waiting"  # waiting, preparing, ready, served
         self.progress = 0.0      # progresso de preparo (0 a 100)
 
-    def start_preparing(self):
-        """Coloca o prato em preparo."""
-        if self.status == "waiting":
-            self.status = "preparing"
-            self.progress = 0.0
+    def start_preparing(self, restaurant=None) -> bool:
+        """
+        Coloca o prato em preparo.
+
+        Se o restaurante for informado, consome os ingredientes do estoque;
+        sem saldo suficiente o pedido continua esperando.
+        """
+        if self.status != "waiting":
+            return False
+        if restaurant is not None and not restaurant.consume_dish(self.dish):
+            return False
+        self.status = "preparing"
+        self.progress = 0.0
+        return True
 
     def update(self, dt: float):
         """Atualiza o progresso do preparo do prato."""
         if self.status == "preparing":
-            prep_time = self.dish.effective_prep_time()
-            self.progress += dt * (100.0 / prep_time)
+            self.progress += dt * (100.0 / self.prep_time)
 
             if self.progress >= 100.0:
                 self.progress = 100.0
@@ -0,0 +1,214 @@
+# core/assets/order_generator.py
+"""
+Geração de pedidos ciente do estoque, com amostragem ponderada O(1).
+
+- Só sorteia pratos desbloqueados que o restaurante ativo consegue cozinhar
+  com o estoque atual (consulta por bitset em `menu_query`).
+- Pesos por prato combinam popularidade, estrelas e o tipo do cliente.
+- Para cada tipo de cliente é mantida uma tabela de alias (Walker/Vose):
+  o sorteio custa O(1) independentemente do tamanho do cardápio.
+- As tabelas são guardadas por (conjunto de pratos viáveis, tipo de
+  cliente) num LRU: consumir estoque só muda o conjunto quando um
+  ingrediente zera ou volta a ter saldo, e conjuntos já vistos (o estoque
+  oscila entre poucos estados durante o serviço) reaproveitam a tabela.
+  Os pesos de cada prato por tipo são calculados uma única vez, então uma
+  tabela nova custa só a montagem de Vose, O(nº de pratos viáveis), e
+  apenas para o tipo de cliente que pediu.
+
+Se nenhum prato for viável (ex.: estoque ainda vazio), `feasible_dishes()`
+fica vazio e `pick` falha, a menos que o dono do gerador opte por
+`fallback_to_owned` (sorteio entre todos os pratos desbloqueados).
+"""
+
+import random
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from core.assets.catalog import CATALOG
+from core.assets.dishes import Dish
+from core.assets.menu import PlayerMenu
+from core.assets.menu_query import MENU_QUERY
+
+
+# Tabelas de alias guardadas por (máscara de pratos viáveis, tipo de cliente)
+TABLE_CACHE_SIZE = 32
+
+
+class AliasTable:
+    """Tabela de alias (método de Vose) para amostragem discreta em O(1)."""
+
+    def __init__(self, items: Sequence, weights: Sequence[float]) -> None:
+        n = len(items)
+        if n == 0:
+            raise ValueError("AliasTable precisa de ao menos um item.")
+        self.items = tuple(items)
+
+        total = float(sum(w for w in weights if w > 0))
+        if total <= 0:
+            scaled = [1.0] * n
+        else:
+            scaled = [max(0.0, float(w)) * n / total for w in weights]
+
+        self.prob: List[float] = [0.0] * n
+        self.alias: List[int] = [0] * n
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] = (scaled[l] + scaled[s]) - 1.0
+            (small if scaled[l] < 1.0 else large).append(l)
+
+        # sobras (erros de arredondamento) ficam com probabilidade 1
+        for i in large + small:
+            self.prob[i] = 1.0
+
+    def sample(self, rng=random):
+        i = rng.randrange(len(self.items))
+        return self.items[i] if rng.random() < self.prob[i] else self.items[self.alias[i]]
+
+
+# ---------------------------------------------------------------------- #
+# Pesos por tipo de cliente (mesmos rótulos de Customer.type)
+# ---------------------------------------------------------------------- #
+
+def _weight_common(dish: Dish) -> float:
+    # cliente comum: leve preferência por pratos mais bem avaliados
+    return 1.0 + 0.15 * dish.stars
+
+
+def _weight_impatient(dish: Dish) -> float:
+    # apressado: prefere o que sai rápido da cozinha
+    return 10.0 / max(1.0, CATALOG.prep_time(dish.key))
+
+
+def _weight_boss(dish: Dish) -> float:
+    # boss: pratos estrelados e que rendem gorjeta gourmet
+    tip = CATALOG.effect(dish.key, "tip_bonus_pct_gourmet")
+    return float(dish.stars ** 2) * (1.0 + tip / 100.0)
+
+
+TYPE_WEIGHTS: Dict[Optional[str], Callable[[Dish], float]] = {
+    None: _weight_common,
+    "comum": _weight_common,
+    "apressado": _weight_impatient,
+    "boss": _weight_boss,
+}
+
+
+class OrderGenerator:
+    """
+    Sorteia o prato de cada pedido a partir do cardápio e do estoque.
+
+    :param player_menu: Pratos desbloqueados do jogador.
+    :param restaurant_getter: Função que devolve o restaurante ativo (ou None).
+    :param fallback_to_owned: Sem prato viável, sorteia entre todos os
+        desbloqueados em vez de falhar (`fallbacks` conta esses sorteios).
+    """
+
+    def __init__(
+        self,
+        player_menu: PlayerMenu,
+        restaurant_getter: Callable[[], object] = lambda: None,
+        rng=random,
+        fallback_to_owned: bool = False,
+    ) -> None:
+        self.player_menu = player_menu
+        self.restaurant_getter = restaurant_getter
+        self.rng = rng
+        self.fallback_to_owned = fallback_to_owned
+        self.popularity: Dict[str, float] = {}
+
+        # estado de cache
+        self._menu_version = -1
+        self._stock_key: Optional[Tuple[int, int]] = None
+        self._feasible_mask = -1
+        self._owned_mask = -1
+        self._tables: "OrderedDict[Tuple[int, Optional[str]], AliasTable]" = OrderedDict()
+        self._weights: Dict[Optional[str], Dict[str, float]] = {}  # tipo -> prato -> peso
+        self.rebuilds = 0   # quantas vezes as tabelas foram refeitas
+        self.fallbacks = 0  # sorteios feitos fora do estoque (fallback_to_owned)
+
+    # ------------------------------------------------------------------ #
+    # Invalidação
+    # ------------------------------------------------------------------ #
+    def set_popularity(self, dish_key: str, weight: float) -> None:
+        """Define a popularidade (peso multiplicativo) de um prato."""
+        self.popularity[dish_key] = max(0.0, float(weight))
+        self._tables.clear()
+        self._weights.clear()
+
+    def invalidate(self) -> None:
+        """Força a reavaliação do estoque e do cardápio no próximo sorteio."""
+        self._menu_version = -1
+        self._stock_key = None
+
+    def _refresh(self) -> None:
+        """Recalcula os pratos viáveis se cardápio ou estoque mudaram."""
+        menu_version = getattr(self.player_menu, "version", 0)
+        restaurant = self.restaurant_getter()
+        stock_key = (id(restaurant), getattr(restaurant, "stock_version", 0))
+
+        if menu_version == self._menu_version and stock_key == self._stock_key:
+            return
+        self._menu_version = menu_version
+        self._stock_key = stock_key
+
+        owned_mask = MENU_QUERY.mask_of(self.player_menu.owned_keys)
+        stock = getattr(restaurant, "owned_ingredients", None) or {}
+        mask = MENU_QUERY.feasible_mask(MENU_QUERY.stock_mask(stock), owned_mask)
+
+        # as tabelas ficam no LRU por máscara; trocar de máscara não invalida nada
+        self._feasible_mask = mask
+        self._owned_mask = owned_mask
+
+    def _weight(self, customer_type: Optional[str], dish: Dish) -> float:
+        """Peso do prato para o tipo de cliente (calculado uma vez)."""
+        per_type = self._weights.get(customer_type)
+        if per_type is None:
+            per_type = self._weights[customer_type] = {}
+        weight = per_type.get(dish.key)
+        if weight is None:
+            weight_fn = TYPE_WEIGHTS.get(customer_type, _weight_common)
+            weight = per_type[dish.key] = weight_fn(dish) * self.popularity.get(dish.key, 1.0)
+        return weight
+
+    def _table_for(self, customer_type: Optional[str]) -> Optional[AliasTable]:
+        mask = self._feasible_mask
+        if not mask and self.fallback_to_owned:
+            mask = self._owned_mask
+        key = (mask, customer_type)
+        table = self._tables.get(key)
+        if table is not None:
+            self._tables.move_to_end(key)
+            return table
+        dishes = MENU_QUERY.dishes_in(mask)
+        if not dishes:
+            return None
+        table = AliasTable(dishes, [self._weight(customer_type, d) for d in dishes])
+        self._tables[key] = table
+        while len(self._tables) > TABLE_CACHE_SIZE:
+            self._tables.popitem(last=False)
+        self.rebuilds += 1
+        return table
+
+    # ------------------------------------------------------------------ #
+    # API
+    # ------------------------------------------------------------------ #
+    def feasible_dishes(self) -> Tuple[Dish, ...]:
+        """Pratos desbloqueados que o estoque atual permite cozinhar (pode ser vazio)."""
+        self._refresh()
+        return MENU_QUERY.dishes_in(self._feasible_mask)
+
+    def pick(self, customer_type: Optional[str] = None) -> Dish:
+        """Sorteia um prato para um cliente do tipo informado."""
+        self._refresh()
+        table = self._table_for(customer_type)
+        if table is None:
+            raise ValueError("Nenhum prato desbloqueado pode ser preparado com o estoque atual!")
+        if not self._feasible_mask:
+            self.fallbacks += 1
+        return table.sample(self.rng)
@@ -11,6 +11,8 @@ class PatienceMeter(AnimatedObject):
     Todo o desenho (cores/geom/AA) é interno a esta classe.
     """
 
+    anim_group = "gameplay"   # congela junto com o atendimento
+
     def __init__(
         self,
         center: Tuple[int, int],
@@ -60,7 +62,7 @@ class PatienceMeter(AnimatedObject):
         return self.visible and (self.alpha > 0.01)
 
     def update(self, dt: float):
-        self.update_animations(dt)
+        # timelines avançam no SCHEDULER (grupo "gameplay", pausado com o serviço)
         if not self.is_playing() and self.alpha <= 0.01:
             self.visible = False
 
@@ -1,15 +1,30 @@
 import json
 import uuid
+import weakref
 from datetime import datetime
 from core.assets.restaurant import Restaurant
+from core.assets.inventory import to_jsonable
+from core.assets.save_format import encode_player, is_binary_save
+from core.assets.save_journal import SaveJournal
+from core.assets.slot_index import encode_index, index_path_for
+from utils.autosave import atomic_write_bytes
 
 
 class Player:
     """
     Classe que representa um jogador no Kitchen Rush 1.
     Armazena dados de progresso, identidade, configurações e controle de restaurantes.
+
+    Mantém um índice id → Restaurant e o restaurante ativo em cache, então
+    `get_active_restaurant` é O(1) mesmo sendo chamado a cada frame.
     """
 
+    # Índice/cache (recriados sob demanda; instâncias montadas pelo loader
+    # binário via `__new__` também começam daqui)
+    _by_id = None
+    _active = None
+    _money_listeners = None
+
     def __init__(self, nickname: str, restaurant_name: str):
         """
         Inicializa um novo perfil de jogador.
@@ -25,6 +40,9 @@ class Player:
         self.restaurants = [Restaurant(restaurant_name)]
         self.active_restaurant_id = self.restaurants[0].restaurant_id
 
+        # Geração do save binário carregado (ver save_journal)
+        self.save_generation = 0
+
         # Configurações pessoais
         self.settings = {
             "volume": 0.8,
@@ -32,65 +50,160 @@ class Player:
             "notifications": True
         }
 
+    # ------------------------------------------------------------------ #
+    # Restaurantes
+    # ------------------------------------------------------------------ #
+    def get_restaurant(self, restaurant_id: str):
+        """Restaurante pelo id (O(1)); None se não existir."""
+        index = self._by_id
+        if index is None or len(index) != len(self.restaurants) or restaurant_id not in index:
+            # lista alterada por fora (carga, replay do journal): reindexa
+            index = self._by_id = {r.restaurant_id: r for r in self.restaurants}
+        return index.get(restaurant_id)
+
     def get_active_restaurant(self):
         """Retorna o restaurante atualmente selecionado pelo jogador."""
-        for r in self.restaurants:
-            if r.restaurant_id == self.active_restaurant_id:
-                return r
-        return None
+        active = self._active
+        if active is not None and active.restaurant_id == self.active_restaurant_id:
+            return active
+        return self._set_active(self.get_restaurant(self.active_restaurant_id))
+
+    def _set_active(self, restaurant):
+        """Atualiza o cache do ativo e move a assinatura de dinheiro para ele."""
+        previous = self._active
+        if previous is restaurant:
+            return restaurant
+        if previous is not None:
+            previous.unsubscribe(self._on_restaurant_change)
+        self._active = restaurant
+        if restaurant is not None:
+            self.active_restaurant_id = restaurant.restaurant_id
+            if self._money_listeners:
+                restaurant.subscribe(self._on_restaurant_change, ("money",))
+        self._notify_money(restaurant.money if restaurant is not None else 0)
+        return restaurant
 
     def add_restaurant(self, name: str):
         """Cria e adiciona um novo restaurante ao perfil do jogador."""
         new_restaurant = Restaurant(name)
         self.restaurants.append(new_restaurant)
-        self.active_restaurant_id = new_restaurant.restaurant_id
+        self._by_id = None
+        self._set_active(new_restaurant)
 
     def switch_restaurant(self, restaurant_id: str):
         """Troca o restaurante ativo para outro já existente no perfil."""
-        if any(r.restaurant_id == restaurant_id for r in self.restaurants):
-            self.active_restaurant_id = restaurant_id
+        restaurant = self.get_restaurant(restaurant_id)
+        if restaurant is not None:
+            self._set_active(restaurant)
+
+    # ------------------------------------------------------------------ #
+    # Notificação de dinheiro
+    # ------------------------------------------------------------------ #
+    def subscribe_money(self, callback):
+        """
+        Registra `callback(valor)` chamado quando o dinheiro do restaurante
+        ativo muda (ou quando o ativo é trocado). Métodos ligados são
+        guardados por referência fraca, então a HUD pode ser descartada
+        sem cancelar a assinatura.
+        """
+        if self._money_listeners is None:
+            self._money_listeners = []
+        ref = weakref.WeakMethod(callback) if hasattr(callback, "__self__") else (lambda: callback)
+        self._money_listeners.append(ref)
+        active = self.get_active_restaurant()
+        if active is not None:
+            active.subscribe(self._on_restaurant_change, ("money",))
+
+    def _on_restaurant_change(self, restaurant, name, old, new):
+        if restaurant is self._active:
+            self._notify_money(new)
+
+    def _notify_money(self, value):
+        listeners = self._money_listeners
+        if not listeners:
+            return
+        alive = []
+        for ref in listeners:
+            callback = ref()
+            if callback is not None:
+                callback(value)
+                alive.append(ref)
+        listeners[:] = alive
 
     def to_dict(self):
-        """Converte os dados do jogador para um dicionário serializável."""
+        """
+        Converte os dados do jogador para um dicionário serializável.
+
+        É também o snapshot do autosave: copia só os contêineres, sem
+        serializar nada (isso fica para a thread de gravação).
+        """
         return {
             "nickname": self.nickname,
             "player_id": self.player_id,
             "created_at": self.created_at,
-            "settings": self.settings,
+            "settings": dict(self.settings),
             "active_restaurant_id": self.active_restaurant_id,
-            "restaurants": [r.__dict__ for r in self.restaurants],
+            "restaurants": [r.to_dict() for r in self.restaurants],
         }
 
+    @staticmethod
+    def encode(data: dict, fmt: str = "binary") -> bytes:
+        """
+        Serializa um snapshot de `to_dict`.
+
+        :param fmt: "binary" (formato versionado de `save_format`) ou "json"
+        """
+        if fmt == "json":
+            return json.dumps(data, indent=4, ensure_ascii=False, default=to_jsonable).encode("utf-8")
+        return encode_player(data)
+
     def save_to_file(self, filepath: str):
         """
-        Salva os dados do jogador em um arquivo JSON.
+        Salva os dados do jogador (gravação atômica).
+
+        Arquivos terminados em ".json" são exportados em JSON legível, para
+        depuração; os demais gravam um snapshot binário completo (zerando o
+        journal de deltas) e atualizam o índice de slots (`slot_index`).
+        Para salvar sem travar o frame, use `utils.autosave.AutosaveManager`.
 
         :param filepath: Caminho do arquivo de salvamento
         """
-        with open(filepath, "w", encoding="utf-8") as file:
-            json.dump(self.to_dict(), file, indent=4, ensure_ascii=False)
+        if filepath.lower().endswith(".json"):
+            self.export_json(filepath)
+            return
+        snapshot = self.to_dict()
+        SaveJournal(filepath).compact(snapshot)
+        atomic_write_bytes(index_path_for(filepath), encode_index(snapshot, filepath))
+
+    def export_json(self, filepath: str):
+        """Exporta o progresso em JSON legível (independente da extensão)."""
+        atomic_write_bytes(filepath, self.encode(self.to_dict(), "json"))
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        """Reconstrói um jogador a partir de `to_dict` (ou de um JSON exportado)."""
+        player = cls.__new__(cls)
+        player.nickname = data["nickname"]
+        player.player_id = data["player_id"]
+        player.created_at = data["created_at"]
+        player.settings = dict(data["settings"])
+        player.active_restaurant_id = data["active_restaurant_id"]
+        player.save_generation = 0
+        player.restaurants = [Restaurant.from_dict(r_data) for r_data in data["restaurants"]]
+        return player
 
     @classmethod
     def load_from_file(cls, filepath: str):
         """
-        Carrega dados de um jogador a partir de um arquivo JSON.
+        Carrega um jogador salvo. O formato (binário ou JSON) é detectado
+        pelo cabeçalho do arquivo; saves binários também reaplicam o journal.
 
         :param filepath: Caminho do arquivo salvo
         :return: Instância de Player carregada
         """
-        with open(filepath, "r", encoding="utf-8") as file:
-            data = json.load(file)
+        with open(filepath, "rb") as file:
+            raw = file.read()
 
-        player = cls(data["nickname"], data["restaurants"][0]["name"])
-        player.player_id = data["player_id"]
-        player.created_at = data["created_at"]
-        player.settings = data["settings"]
-        player.active_restaurant_id = data["active_restaurant_id"]
-
-        player.restaurants = []
-        for r_data in data["restaurants"]:
-            r = Restaurant(r_data["name"])
-            r.__dict__.update(r_data)
-            player.restaurants.append(r)
-
-        return player
+        if is_binary_save(raw):
+            return SaveJournal(filepath).load(cls, Restaurant, raw)
+        return cls.from_dict(json.loads(raw.decode("utf-8")))
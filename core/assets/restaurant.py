@@ -1,14 +1,23 @@
 import uuid
 from datetime import datetime
 from settings import Settings
+from core.assets.inventory import ADJUST, InventoryLedger, dish_needs
+from core.assets.observable import Observable
 
 
-class Restaurant:
+class Restaurant(Observable):
     """
     Classe que representa um restaurante gerenciado pelo jogador.
     Armazena dados de progresso, equipe, cardápio e estoque.
+
+    Atribuições aos campos de `_OBSERVED` notificam os ouvintes registrados
+    com `subscribe` (ex.: HUD), evitando polling por frame. Mudanças de
+    estoque aparecem como eventos de `stock_version`.
     """
 
+    # Campos cujas mudanças disparam notificação
+    _OBSERVED = frozenset({"money", "reputation", "day", "stock_version"})
+
     def __init__(self, name: str):
         """
         Inicializa um novo restaurante com valores padrões.
@@ -29,7 +38,9 @@ class Restaurant:
 
         # Operação
         self.menu = []                     # Pratos ativos
-        self.owned_ingredients = {}       # Estoque: {"Tomato": 5}
+        self.inventory = InventoryLedger()  # histórico + saldos do estoque
+        self.owned_ingredients = {}       # Espelho dos saldos: {"tomato": 5}
+        self.stock_version = 0            # incrementa a cada mudança no estoque
         self.employees = []               # Funcionários ativos (IDs ou objetos)
         self.events = []                  # Eventos especiais futuros
 
@@ -48,15 +59,83 @@ class Restaurant:
         if employee_id in self.employees:
             self.employees.remove(employee_id)
 
+    def _sync_stock(self):
+        """Atualiza o espelho `owned_ingredients` após uma transação do ledger."""
+        self.owned_ingredients = self.inventory.as_dict()
+        self.stock_version += 1
+
     def update_ingredient(self, name: str, quantity: int):
-        """Adiciona ou consome ingredientes no estoque."""
-        self.owned_ingredients[name] = self.owned_ingredients.get(name, 0) + quantity
+        """Adiciona ou consome ingredientes no estoque (ajuste avulso)."""
+        self.inventory.commit(ADJUST, {name: quantity}, self.day)
+        self._sync_stock()
+
+    def record_purchase(self, cart: dict, cost: float) -> bool:
+        """
+        Registra a compra de um carrinho inteiro numa única transação.
+
+        :param cart: {nome ou chave do ingrediente: quantidade}
+        :param cost: Valor total debitado do restaurante
+        :return: False se o dinheiro não for suficiente
+        """
+        if cost > self.money:
+            return False
+        self.money -= cost
+        self.inventory.purchase(cart, cost, self.day)
+        self._sync_stock()
+        return True
+
+    def consume_dish(self, dish) -> bool:
+        """Consome os ingredientes de uma porção do prato (False se faltar algo)."""
+        txn = self.inventory.consume(dish_needs(dish.ingredient_keys), self.day, ref=dish.key)
+        if txn is None:
+            return False
+        self._sync_stock()
+        return True
 
     def add_money(self, value: float):
         """Adiciona dinheiro ao restaurante."""
         self.money += value
 
+    # Atributos que não vão para o save (recriados ou derivados na carga)
+    _TRANSIENT = ("config", "inventory", "owned_ingredients", "stock_version")
+
+    def to_dict(self) -> dict:
+        """
+        Snapshot serializável do restaurante.
+
+        Copia apenas os contêineres de primeiro nível, então é barato o
+        suficiente para ser tirado na thread principal e serializado depois.
+        """
+        data = {}
+        for key, value in vars(self).items():
+            if key in self._TRANSIENT or key.startswith("_"):
+                continue
+            if isinstance(value, list):
+                value = list(value)
+            elif isinstance(value, dict):
+                value = dict(value)
+            data[key] = value
+        data["inventory"] = self.inventory.to_dict()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Restaurant":
+        """Reconstrói um restaurante a partir de `to_dict` (ou de saves antigos)."""
+        restaurant = cls(data["name"])
+        for key, value in data.items():
+            if key not in cls._TRANSIENT:
+                setattr(restaurant, key, value)
+
+        if "inventory" in data:
+            restaurant.inventory = InventoryLedger.from_dict(data["inventory"])
+        elif data.get("owned_ingredients"):
+            # saves antigos: só havia o dicionário de estoque
+            restaurant.inventory.commit(ADJUST, data["owned_ingredients"], restaurant.day)
+        restaurant._sync_stock()
+        return restaurant
+
     def advance_day(self):
-        """Avança o restaurante para o próximo dia."""
+        """Fecha o resumo do estoque do dia e avança para o próximo."""
+        self.inventory.close_day(self.day)
         self.day += 1
         
\ No newline at end of file
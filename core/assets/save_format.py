@@ -0,0 +1,323 @@
+# core/assets/save_format.py
+"""
+Formato binário versionado dos saves do jogador.
+
+Layout (little-endian):
+
+    b"KRSV" | u16 versão | registro Player | u32 nº restaurantes | registros Restaurant
+
+Cada registro é descrito por um SCHEMA: lista de (campo, tipo, versão em que
+o campo surgiu). O escritor sempre grava a versão atual; o leitor só lê os
+campos existentes na versão do arquivo e usa o padrão para os demais, então
+saves antigos continuam abrindo depois que o schema cresce.
+
+O histórico do estoque (a parte que mais cresce) é gravado em COLUNAS
+(`array.tobytes`), o que deixa o arquivo compacto e a leitura rápida.
+
+O loader monta `Player`/`Restaurant` direto dos campos tipados, sem criar
+objetos descartáveis. O JSON continua disponível para depuração
+(`Player.save_to_file("x.json")`).
+"""
+
+import json
+import struct
+import sys
+from array import array
+from typing import Any, Callable, Dict, List, Tuple
+
+from settings import Settings
+from core.assets.inventory import (
+    DaySummary, InventoryLedger, Transaction, as_day_summary, as_transaction, to_jsonable,
+)
+
+
+MAGIC = b"KRSV"
+SCHEMA_VERSION = 3
+
+# Colunas inteiras do ledger: "q" tem 8 bytes em qualquer plataforma. Até a
+# versão 2, contagens e índices usavam "l" (8 bytes no Linux/macOS, 4 no
+# Windows), então o arquivo dependia do SO que o gravou.
+_LEGACY_COUNT_TYPECODE = "l"
+
+# (campo, tipo, desde_versão)
+PLAYER_SCHEMA: Tuple[Tuple[str, str, int], ...] = (
+    ("nickname", "str", 1),
+    ("player_id", "str", 1),
+    ("created_at", "str", 1),
+    ("active_restaurant_id", "str", 1),
+    ("settings", "json", 1),
+    ("save_generation", "i64", 2),   # amarra o snapshot ao seu journal (save_journal)
+)
+
+RESTAURANT_SCHEMA: Tuple[Tuple[str, str, int], ...] = (
+    ("name", "str", 1),
+    ("restaurant_id", "str", 1),
+    ("created_at", "str", 1),
+    ("day", "i64", 1),
+    ("money", "f64", 1),
+    ("reputation", "i64", 1),
+    ("menu", "json", 1),
+    ("employees", "json", 1),
+    ("events", "json", 1),
+    ("total_clients_served", "i64", 1),
+    ("total_money_earned", "f64", 1),
+    ("total_failed_days", "i64", 1),
+)
+
+_DEFAULTS = {"str": "", "i64": 0, "f64": 0.0, "json": None}
+
+# tipos de transação <-> código de 1 byte
+_KIND_CODES = {"purchase": 0, "consume": 1, "adjust": 2}
+_KIND_NAMES = {v: k for k, v in _KIND_CODES.items()}
+
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+_U32 = struct.Struct("<I")
+_U16 = struct.Struct("<H")
+
+
+class SaveFormatError(ValueError):
+    """Arquivo que não é um save válido (ou de versão futura)."""
+
+
+# ---------------------------------------------------------------------- #
+# Escrita
+# ---------------------------------------------------------------------- #
+class _Writer:
+    def __init__(self) -> None:
+        self.parts: List[bytes] = []
+
+    def u32(self, v: int) -> None:
+        self.parts.append(_U32.pack(v))
+
+    def i64(self, v) -> None:
+        self.parts.append(_I64.pack(int(v)))
+
+    def f64(self, v) -> None:
+        self.parts.append(_F64.pack(float(v)))
+
+    def str(self, v) -> None:
+        data = ("" if v is None else str(v)).encode("utf-8")
+        self.u32(len(data))
+        self.parts.append(data)
+
+    def json(self, v) -> None:
+        self.str(json.dumps(v, ensure_ascii=False, separators=(",", ":"), default=to_jsonable))
+
+    def strings(self, values) -> None:
+        # lista de strings num único bloco separado por \0
+        self.str("\0".join(values))
+        self.u32(len(values))
+
+    def ints(self, values, typecode: str = "q") -> None:
+        arr = array(typecode, values)
+        if sys.byteorder == "big":
+            arr.byteswap()
+        self.u32(len(arr))
+        self.parts.append(arr.tobytes())
+
+    def record(self, obj: Dict[str, Any], schema) -> None:
+        for name, kind, _since in schema:
+            getattr(self, kind)(obj.get(name, _DEFAULTS[kind]))
+
+    def getvalue(self) -> bytes:
+        return b"".join(self.parts)
+
+
+def _write_ledger(w: _Writer, inv: Dict[str, Any]) -> None:
+    keys = inv["keys"]
+    index = {k: i for i, k in enumerate(keys)}
+    w.strings(keys)
+    w.ints(inv["totals"])
+    w.ints(inv["day_in"])
+    w.ints(inv["day_out"])
+    w.f64(inv["day_spent"])
+    w.i64(inv["day_orders"])
+    w.i64(inv["day_txns"])
+
+    # transações em colunas
+    txns = [as_transaction(t) for t in inv["transactions"]]
+    w.ints([_KIND_CODES.get(t.kind, 2) for t in txns], "b")
+    w.ints([t.day for t in txns])
+    w.ints([len(t.entries) for t in txns])
+    w.ints([i for t in txns for i, _ in t.entries])
+    w.ints([d for t in txns for _, d in t.entries])
+    money = array("d", [t.money for t in txns])
+    if sys.byteorder == "big":
+        money.byteswap()
+    w.parts.append(money.tobytes())
+    w.strings([t.ref for t in txns])
+
+    # resumos diários: escalares em colunas + contagens por índice de ingrediente
+    sums = [as_day_summary(s) for s in inv["day_summaries"]]
+    w.ints([s.day for s in sums])
+    w.ints([s.orders for s in sums])
+    w.ints([s.transactions for s in sums])
+    spent = array("d", [s.spent for s in sums])
+    if sys.byteorder == "big":
+        spent.byteswap()
+    w.parts.append(spent.tobytes())
+    for attr in ("purchased", "consumed"):
+        counts = [getattr(s, attr) for s in sums]
+        w.ints([len(c) for c in counts])
+        w.ints([index[k] for c in counts for k in c])
+        w.ints([q for c in counts for q in c.values()])
+
+
+def encode_player(data: Dict[str, Any]) -> bytes:
+    """Serializa um snapshot de `Player.to_dict()` no formato binário."""
+    w = _Writer()
+    w.parts.append(MAGIC)
+    w.parts.append(_U16.pack(SCHEMA_VERSION))
+    w.record(data, PLAYER_SCHEMA)
+
+    restaurants = data["restaurants"]
+    w.u32(len(restaurants))
+    known = {name for name, _, _ in RESTAURANT_SCHEMA} | {"inventory"}
+    for r in restaurants:
+        w.record(r, RESTAURANT_SCHEMA)
+        # campos fora do schema (ex.: difficulty, level) seguem como JSON
+        w.json({k: v for k, v in r.items() if k not in known})
+        _write_ledger(w, r["inventory"])
+    return w.getvalue()
+
+
+# ---------------------------------------------------------------------- #
+# Leitura
+# ---------------------------------------------------------------------- #
+class _Reader:
+    def __init__(self, data: bytes, pos: int = 0) -> None:
+        self.data = memoryview(data)
+        self.pos = pos
+
+    def _take(self, n: int) -> memoryview:
+        chunk = self.data[self.pos:self.pos + n]
+        if len(chunk) != n:
+            raise SaveFormatError("Save truncado.")
+        self.pos += n
+        return chunk
+
+    def u32(self) -> int:
+        return _U32.unpack(self._take(4))[0]
+
+    def i64(self) -> int:
+        return _I64.unpack(self._take(8))[0]
+
+    def f64(self) -> float:
+        return _F64.unpack(self._take(8))[0]
+
+    def str(self) -> str:
+        return bytes(self._take(self.u32())).decode("utf-8")
+
+    def json(self):
+        return json.loads(self.str())
+
+    def strings(self) -> List[str]:
+        blob = self.str()
+        count = self.u32()
+        return blob.split("\0") if count else []
+
+    def ints(self, typecode: str = "q") -> array:
+        n = self.u32()
+        arr = array(typecode)
+        arr.frombytes(self._take(n * arr.itemsize))
+        if sys.byteorder == "big":
+            arr.byteswap()
+        return arr
+
+    def floats(self, n: int) -> array:
+        arr = array("d")
+        arr.frombytes(self._take(n * arr.itemsize))
+        if sys.byteorder == "big":
+            arr.byteswap()
+        return arr
+
+    def record(self, schema, version: int) -> Dict[str, Any]:
+        out = {}
+        for name, kind, since in schema:
+            out[name] = getattr(self, kind)() if version >= since else _DEFAULTS[kind]
+        return out
+
+
+def _read_ledger(rd: _Reader, version: int) -> InventoryLedger:
+    count_tc = _LEGACY_COUNT_TYPECODE if version < 3 else "q"
+    keys = rd.strings()
+    totals, day_in, day_out = rd.ints(), rd.ints(), rd.ints()
+    day_spent, day_orders, day_txns = rd.f64(), rd.i64(), rd.i64()
+
+    kinds = rd.ints("b")
+    days = rd.ints()
+    n_entries = rd.ints(count_tc)
+    idxs = rd.ints(count_tc)
+    deltas = rd.ints()
+    money = rd.floats(len(kinds))
+    refs = rd.strings()
+
+    txns: List[Transaction] = []
+    pos = 0
+    for i, count in enumerate(n_entries):
+        end = pos + count
+        txns.append(Transaction(
+            _KIND_NAMES.get(kinds[i], "adjust"), days[i],
+            tuple(zip(idxs[pos:end], deltas[pos:end])), money[i], refs[i],
+        ))
+        pos = end
+
+    s_days, s_orders, s_txns = rd.ints(), rd.ints(), rd.ints()
+    s_spent = rd.floats(len(s_days))
+    per_attr = []
+    for _attr in ("purchased", "consumed"):
+        lens, c_idx, c_qty = rd.ints(count_tc), rd.ints(count_tc), rd.ints()
+        dicts, pos = [], 0
+        for n in lens:
+            end = pos + n
+            dicts.append({keys[k]: q for k, q in zip(c_idx[pos:end], c_qty[pos:end])})
+            pos = end
+        per_attr.append(dicts)
+    summaries = [
+        DaySummary(s_days[i], per_attr[0][i], per_attr[1][i], s_spent[i], s_orders[i], s_txns[i])
+        for i in range(len(s_days))
+    ]
+
+    return InventoryLedger.from_dict({
+        "keys": keys, "totals": totals, "transactions": txns, "day_summaries": summaries,
+        "day_in": day_in, "day_out": day_out,
+        "day_spent": day_spent, "day_orders": day_orders, "day_txns": day_txns,
+    })
+
+
+def is_binary_save(data: bytes) -> bool:
+    return bytes(data[:4]) == MAGIC
+
+
+def decode_player(data: bytes, player_cls: Callable, restaurant_cls: Callable):
+    """
+    Lê um save binário e devolve a instância de `player_cls` já montada.
+
+    :raises SaveFormatError: arquivo inválido ou de versão mais nova que o jogo
+    """
+    if not is_binary_save(data):
+        raise SaveFormatError("Cabeçalho de save inválido.")
+    rd = _Reader(data, 4)
+    version = _U16.unpack(rd._take(2))[0]
+    if version > SCHEMA_VERSION:
+        raise SaveFormatError(f"Save na versão {version}; o jogo suporta até {SCHEMA_VERSION}.")
+
+    player = player_cls.__new__(player_cls)
+    player.__dict__.update(rd.record(PLAYER_SCHEMA, version))
+
+    config = Settings()
+    restaurants = []
+    for _ in range(rd.u32()):
+        restaurant = restaurant_cls.__new__(restaurant_cls)
+        fields = rd.record(RESTAURANT_SCHEMA, version)
+        fields.update(rd.json() or {})
+        restaurant.__dict__.update(fields)
+        restaurant.config = config
+        restaurant.inventory = _read_ledger(rd, version)
+        restaurant.stock_version = 0
+        restaurant._sync_stock()
+        restaurants.append(restaurant)
+
+    player.restaurants = restaurants
+    return player
@@ -0,0 +1,273 @@
+# core/assets/save_journal.py
+"""
+Saves incrementais: snapshot completo + journal append-only de deltas.
+
+- O snapshot usa o formato binário de `save_format` e carrega um número de
+  geração aleatório (`save_generation`).
+- Cada save seguinte só anexa ao journal (`<save>.journal`) o que mudou
+  desde o último save: campos alterados, sufixos novos de listas (ex.:
+  `events`) e o sufixo novo do ledger de estoque. O I/O por save fica
+  proporcional à mudança, não ao tamanho da campanha.
+- Quando o journal passa do limite, o próximo save é uma COMPACTAÇÃO: grava
+  um snapshot novo (nova geração) e recomeça o journal. Como roda na thread
+  do autosave, não trava o frame.
+- A carga lê o snapshot e reaplica os registros do journal cuja geração
+  bate com a do snapshot. Um registro truncado ou corrompido (crash no meio
+  de um append) encerra o replay ali.
+
+Layout do journal: b"KRJL" | u16 versão | i64 geração | registros, onde cada
+registro é u32 tamanho | u32 crc32 | delta em JSON (UTF-8).
+"""
+
+import json
+import os
+import random
+import struct
+import zlib
+from typing import Any, Dict, List, Optional
+
+from settings import Settings
+from core.assets.inventory import InventoryLedger, ledger_delta, to_jsonable
+from core.assets.save_format import decode_player, encode_player
+from utils.autosave import atomic_write_bytes
+
+
+JOURNAL_MAGIC = b"KRJL"
+JOURNAL_VERSION = 1
+
+_HEADER = struct.Struct("<4sHq")
+_RECORD = struct.Struct("<II")
+
+# campos do jogador que podem mudar entre saves
+_PLAYER_FIELDS = ("nickname", "active_restaurant_id", "settings")
+
+
+def journal_path_for(save_path: str) -> str:
+    return save_path + ".journal"
+
+
+# ---------------------------------------------------------------------- #
+# Diferenças entre snapshots de `Player.to_dict`
+# ---------------------------------------------------------------------- #
+def _restaurant_delta(prev: Optional[dict], curr: dict) -> Optional[dict]:
+    prev = prev or {}
+    changed: Dict[str, Any] = {}
+    extended: Dict[str, list] = {}
+    for key, value in curr.items():
+        if key == "inventory":
+            continue
+        old = prev.get(key)
+        if key in prev and old == value:
+            continue
+        # listas que só cresceram (events, menu...) gravam apenas o sufixo
+        if isinstance(old, list) and isinstance(value, list) and value[:len(old)] == old:
+            extended[key] = value[len(old):]
+        else:
+            changed[key] = value
+
+    ledger = ledger_delta(prev.get("inventory"), curr["inventory"])
+    if not (changed or extended or ledger):
+        return None
+    delta: Dict[str, Any] = {"id": curr["restaurant_id"]}
+    if changed:
+        delta["set"] = changed
+    if extended:
+        delta["extend"] = extended
+    if ledger:
+        delta["ledger"] = ledger
+    return delta
+
+
+def diff_snapshots(prev: dict, curr: dict) -> Optional[dict]:
+    """Delta entre dois snapshots do jogador (None se nada mudou)."""
+    delta: Dict[str, Any] = {}
+
+    player = {k: curr[k] for k in _PLAYER_FIELDS if curr.get(k) != prev.get(k)}
+    if player:
+        delta["player"] = player
+
+    old_by_id = {r["restaurant_id"]: r for r in prev["restaurants"]}
+    restaurants = []
+    for r in curr["restaurants"]:
+        rd = _restaurant_delta(old_by_id.get(r["restaurant_id"]), r)
+        if rd is not None:
+            restaurants.append(rd)
+    if restaurants:
+        delta["restaurants"] = restaurants
+
+    order = [r["restaurant_id"] for r in curr["restaurants"]]
+    if order != [r["restaurant_id"] for r in prev["restaurants"]]:
+        delta["order"] = order
+
+    return delta or None
+
+
+def apply_delta(player, delta: dict, restaurant_cls) -> None:
+    """Reaplica um delta do journal sobre o jogador já carregado."""
+    for key, value in delta.get("player", {}).items():
+        setattr(player, key, value)
+
+    by_id = {r.restaurant_id: r for r in player.restaurants}
+    for rd in delta.get("restaurants", ()):
+        restaurant = by_id.get(rd["id"])
+        if restaurant is None:
+            # restaurante criado depois do snapshot
+            restaurant = restaurant_cls.__new__(restaurant_cls)
+            restaurant.config = Settings()
+            restaurant.inventory = InventoryLedger()
+            restaurant.stock_version = 0
+            by_id[rd["id"]] = restaurant
+            player.restaurants.append(restaurant)
+        for key, value in rd.get("set", {}).items():
+            setattr(restaurant, key, value)
+        for key, suffix in rd.get("extend", {}).items():
+            getattr(restaurant, key).extend(suffix)
+        if "ledger" in rd:
+            restaurant.inventory.apply_delta(rd["ledger"])
+        restaurant._sync_stock()
+
+    if "order" in delta:
+        player.restaurants = [by_id[rid] for rid in delta["order"] if rid in by_id]
+
+
+# ---------------------------------------------------------------------- #
+# Armazenamento
+# ---------------------------------------------------------------------- #
+class SaveJournal:
+    """
+    Snapshot + journal de um arquivo de save.
+
+    `write` é chamado pela thread do autosave; `load` na thread principal,
+    antes de qualquer save ser pedido.
+
+    :param save_path: Caminho do snapshot binário
+    :param compact_bytes: Tamanho do journal que dispara a compactação
+    :param compact_records: Nº de registros que dispara a compactação
+    """
+
+    def __init__(self, save_path: str, compact_bytes: int = 256 * 1024, compact_records: int = 500):
+        self.save_path = save_path
+        self.journal_path = journal_path_for(save_path)
+        self.compact_bytes = compact_bytes
+        self.compact_records = compact_records
+
+        # base conhecida (o que está em disco)
+        self._last: Optional[dict] = None
+        self._generation = 0
+        self._journal_size = 0
+        self._records = 0
+
+        # métricas
+        self.snapshots = 0
+        self.appends = 0
+        self.skipped = 0        # saves sem mudança (nenhum I/O)
+        self.last_bytes = 0
+
+    # ------------------------------------------------------------------ #
+    # Escrita
+    # ------------------------------------------------------------------ #
+    def write(self, snapshot: dict) -> int:
+        """Grava o snapshot como delta (ou compactação). Retorna os bytes gravados."""
+        if self._needs_snapshot():
+            return self.compact(snapshot)
+
+        delta = diff_snapshots(self._last, snapshot)
+        if delta is None:
+            self.skipped += 1
+            self.last_bytes = 0
+            return 0
+
+        payload = json.dumps(delta, ensure_ascii=False, separators=(",", ":"), default=to_jsonable).encode("utf-8")
+        record = _RECORD.pack(len(payload), zlib.crc32(payload)) + payload
+        with open(self.journal_path, "ab") as file:
+            file.write(record)
+            file.flush()
+            os.fsync(file.fileno())
+
+        self._journal_size += len(record)
+        self._records += 1
+        self._last = snapshot
+        self.appends += 1
+        self.last_bytes = len(record)
+        return len(record)
+
+    def compact(self, snapshot: dict) -> int:
+        """Grava um snapshot completo (nova geração) e recomeça o journal."""
+        generation = random.getrandbits(62) + 1
+        data = encode_player(dict(snapshot, save_generation=generation))
+        atomic_write_bytes(self.save_path, data)
+        # se cair aqui, o journal antigo tem outra geração e é ignorado na carga
+        header = _HEADER.pack(JOURNAL_MAGIC, JOURNAL_VERSION, generation)
+        atomic_write_bytes(self.journal_path, header)
+
+        self._last = snapshot
+        self._generation = generation
+        self._journal_size = len(header)
+        self._records = 0
+        self.snapshots += 1
+        self.last_bytes = len(data) + len(header)
+        return self.last_bytes
+
+    def _needs_snapshot(self) -> bool:
+        if self._last is None:
+            return True
+        if self._journal_size >= self.compact_bytes or self._records >= self.compact_records:
+            return True
+        # alguém regravou o save por fora (ex.: `Player.save_to_file`)
+        try:
+            return os.path.getsize(self.journal_path) != self._journal_size
+        except OSError:
+            return True
+
+    # ------------------------------------------------------------------ #
+    # Leitura
+    # ------------------------------------------------------------------ #
+    def load(self, player_cls, restaurant_cls, data: Optional[bytes] = None):
+        """
+        Carrega snapshot + journal e passa a usar esse estado como base.
+
+        :param data: Bytes do snapshot, se já lidos pelo chamador
+        """
+        if data is None:
+            with open(self.save_path, "rb") as file:
+                data = file.read()
+        player = decode_player(data, player_cls, restaurant_cls)
+        generation = player.save_generation
+
+        records, size = self._read_journal(generation)
+        for delta in records:
+            apply_delta(player, delta, restaurant_cls)
+
+        self._last = player.to_dict()
+        self._generation = generation
+        self._journal_size = size
+        self._records = len(records)
+        return player
+
+    def _read_journal(self, generation: int):
+        """Deltas válidos do journal e o tamanho até o último registro íntegro."""
+        try:
+            with open(self.journal_path, "rb") as file:
+                raw = file.read()
+        except OSError:
+            return [], -1
+        if len(raw) < _HEADER.size:
+            return [], -1
+        magic, version, gen = _HEADER.unpack_from(raw, 0)
+        if magic != JOURNAL_MAGIC or version > JOURNAL_VERSION or gen != generation or not generation:
+            return [], -1
+
+        records: List[dict] = []
+        pos = _HEADER.size
+        while pos + _RECORD.size <= len(raw):
+            length, crc = _RECORD.unpack_from(raw, pos)
+            payload = raw[pos + _RECORD.size: pos + _RECORD.size + length]
+            if len(payload) != length or zlib.crc32(payload) != crc:
+                break
+            records.append(json.loads(payload.decode("utf-8")))
+            pos += _RECORD.size + length
+
+        if pos != len(raw):
+            # cauda corrompida: o tamanho não bate e o próximo save compacta
+            return records, -1
+        return records, pos
@@ -0,0 +1,142 @@
+# core/assets/slot_index.py
+"""
+Índice de slots do save.
+
+Arquivo pequeno (JSON) gravado ao lado do save completo, com só o que a
+tela de seleção precisa para desenhar os cards: nome, dia, reputação,
+dinheiro e nível de cada restaurante. Assim `RestaurantSelect` abre com uma
+única leitura minúscula, e o save completo só é carregado quando um slot é
+escolhido.
+
+Consistência: o save é gravado primeiro e o índice depois (ambos
+atômicos). O índice guarda tamanho e mtime do save (e do seu journal de
+deltas) que descreve; se um crash acontecer entre as gravações, o `stat`
+não bate e o índice é reconstruído a partir do save completo.
+"""
+
+import json
+import os
+from dataclasses import asdict, dataclass
+from typing import Optional, Tuple
+
+from core.assets.save_journal import journal_path_for
+from utils.autosave import atomic_write_bytes
+
+
+INDEX_VERSION = 1
+
+
+@dataclass(frozen=True)
+class SlotSummary:
+    """Resumo de um restaurante para o card de seleção."""
+    restaurant_id: str
+    name: str
+    day: int = 1
+    reputation: int = 0
+    money: float = 0.0
+    level: int = 0
+    difficulty: str = ""
+
+    @classmethod
+    def from_restaurant(cls, r) -> "SlotSummary":
+        """Resumo de um `Restaurant` vivo (ou do dicionário de `to_dict`)."""
+        get = r.get if isinstance(r, dict) else (lambda k, d=None: getattr(r, k, d))
+        return cls(
+            restaurant_id=get("restaurant_id", ""),
+            name=get("name", ""),
+            day=int(get("day", 1)),
+            reputation=int(get("reputation", 0)),
+            money=float(get("money", 0.0)),
+            level=int(get("level", get("rating", 0)) or 0),
+            difficulty=get("difficulty", "") or "",
+        )
+
+    def card_data(self) -> dict:
+        """Dicionário no formato esperado por `RestaurantCard.set_filled`."""
+        return {"name": self.name, "day": self.day, "money": self.money,
+                "level": self.level, "reputation": self.reputation}
+
+
+class SlotIndex:
+    """Índice carregado do disco."""
+
+    def __init__(self, player_id: str, nickname: str, active_restaurant_id: str,
+                 slots: Tuple[SlotSummary, ...], save_stamp: Tuple[int, ...]) -> None:
+        self.player_id = player_id
+        self.nickname = nickname
+        self.active_restaurant_id = active_restaurant_id
+        self.slots = slots
+        self.save_stamp = save_stamp    # tamanho/mtime_ns do save e do journal
+
+    def is_fresh(self, save_path: str) -> bool:
+        """True se o índice descreve o save atual (só um `stat`, sem ler o save)."""
+        try:
+            return _stamp(save_path) == self.save_stamp
+        except OSError:
+            return False
+
+    @classmethod
+    def read(cls, path: str) -> Optional["SlotIndex"]:
+        """Lê o índice; None se não existir ou estiver corrompido."""
+        try:
+            with open(path, "rb") as file:
+                data = json.loads(file.read().decode("utf-8"))
+            if data.get("version", 0) > INDEX_VERSION:
+                return None
+            return cls(
+                data["player_id"], data["nickname"], data["active_restaurant_id"],
+                tuple(SlotSummary(**s) for s in data["slots"]), tuple(data["save_stamp"]),
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+
+def _stamp(save_path: str) -> Tuple[int, ...]:
+    st = os.stat(save_path)
+    try:
+        jst = os.stat(journal_path_for(save_path))
+        journal = (jst.st_size, jst.st_mtime_ns)
+    except OSError:
+        journal = (0, 0)
+    return (st.st_size, st.st_mtime_ns) + journal
+
+
+def index_path_for(save_path: str) -> str:
+    """Caminho do índice de um save: `saves/player.krs` → `saves/player.slots.json`."""
+    root, _ = os.path.splitext(save_path)
+    return root + ".slots.json"
+
+
+def encode_index(snapshot: dict, save_path: str) -> bytes:
+    """
+    Gera o índice a partir do snapshot de `Player.to_dict`.
+    Deve ser chamado DEPOIS de gravar o save em `save_path`.
+    """
+    return json.dumps({
+        "version": INDEX_VERSION,
+        "player_id": snapshot["player_id"],
+        "nickname": snapshot["nickname"],
+        "active_restaurant_id": snapshot["active_restaurant_id"],
+        "save_stamp": list(_stamp(save_path)),
+        "slots": [asdict(SlotSummary.from_restaurant(r)) for r in snapshot["restaurants"]],
+    }, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def load_slot_index(save_path: str, player_loader) -> Optional[SlotIndex]:
+    """
+    Índice válido para o save em `save_path`.
+
+    Se o índice faltar ou estiver desatualizado, carrega o save completo com
+    `player_loader(save_path)`, regrava o índice e o devolve.
+    None se não houver save.
+    """
+    if not os.path.exists(save_path):
+        return None
+    path = index_path_for(save_path)
+    index = SlotIndex.read(path)
+    if index is not None and index.is_fresh(save_path):
+        return index
+
+    player = player_loader(save_path)
+    atomic_write_bytes(path, encode_index(player.to_dict(), save_path))
+    return SlotIndex.read(path)
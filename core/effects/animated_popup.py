@@ -90,6 +90,9 @@ class AnimatedPopup:
         self.fade_speed = float(fade_speed)
         self.bg_alpha = 0.0
         self.bg_surface.set_alpha(int(self.bg_alpha))
+        # True quando quem está por baixo já desenhou o fundo escurecido
+        # (ex.: snapshot congelado do PhaseService); aí a popup não o repete
+        self.backdrop_baked = False
 
         # Efeitos sonoros opcionais
         self.open_sound = open_sound
@@ -216,7 +219,7 @@ class AnimatedPopup:
         screen : pygame.Surface
             Surface principal onde tudo será desenhado.
         """
-        screen.blit(self.bg_surface, (0, 0))
+        self.render_backdrop(screen)
 
         # Posiciona o conteúdo no X central e Y animado
         content_draw_rect = self.content.get_rect(
@@ -224,6 +227,16 @@ class AnimatedPopup:
         )
         screen.blit(self.content, content_draw_rect)
 
+    @property
+    def backdrop_settled(self) -> bool:
+        """True quando o fundo escurecido está parado na opacidade máxima."""
+        return not self.closing and self.bg_alpha >= self.max_alpha
+
+    def render_backdrop(self, screen: pygame.Surface) -> None:
+        """Desenha o fundo escurecido (omitido se já estiver no snapshot de baixo)."""
+        if not self.backdrop_baked:
+            screen.blit(self.bg_surface, (0, 0))
+
     def handle_event(self, event: pygame.event.Event) -> None:
         """
         Manipula eventos do pygame.
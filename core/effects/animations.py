@@ -106,13 +106,89 @@ class Sequence:
             tw.reset()
 
 
+# -----------------------------
+# AGENDADOR GLOBAL
+# -----------------------------
+class AnimationScheduler:
+    """
+    Avança, uma vez por frame, só os objetos com timeline em execução.
+
+    - `AnimatedObject.play` acorda o objeto (entra no conjunto ativo);
+    - ao terminar (ou em `stop`), ele dorme e deixa de custar algo por frame;
+    - grupos (`AnimatedObject.anim_group`) podem ser pausados, ex.: o
+      "gameplay" congela enquanto uma janela está aberta;
+    - motores em lote (ex.: `batch_tween.BatchTweenEngine`) registrados com
+      `attach` são avançados no mesmo tick.
+    """
+    def __init__(self):
+        self._active = {}            # objeto -> None (conjunto ordenado)
+        self._paused_groups = set()
+        self._engines = []
+        self.woken = 0               # total de play() recebidos
+        self.completed = 0           # timelines que terminaram
+
+    def wake(self, obj: "AnimatedObject"):
+        self._active[obj] = None
+        self.woken += 1
+
+    def sleep(self, obj: "AnimatedObject"):
+        self._active.pop(obj, None)
+
+    def set_paused(self, group: str, paused: bool):
+        if paused:
+            self._paused_groups.add(group)
+        else:
+            self._paused_groups.discard(group)
+
+    def attach(self, engine):
+        """Registra um motor com `step(dt)` e contador `active`."""
+        if engine not in self._engines:
+            self._engines.append(engine)
+
+    def tick(self, dt: float):
+        for engine in self._engines:
+            if engine.active:
+                engine.step(dt)
+        if not self._active:
+            return
+        paused = self._paused_groups
+        for obj in list(self._active):
+            if paused and obj.anim_group in paused:
+                continue
+            if not obj._advance(dt) and obj in self._active:
+                del self._active[obj]
+                self.completed += 1
+
+    @property
+    def active_objects(self) -> int:
+        return len(self._active)
+
+    @property
+    def active_tweens(self) -> int:
+        """Tweens rodando agora (um por timeline ativa + os dos motores em lote)."""
+        timelines = sum(1 for obj in self._active if obj._current is not None)
+        return timelines + sum(engine.active for engine in self._engines)
+
+    def clear(self):
+        self._active.clear()
+
+
+SCHEDULER = AnimationScheduler()
+
+
 # -----------------------------
 # OBJETO ANIMÁVEL
 # -----------------------------
 class AnimatedObject:
     """
     Classe base: gerencia timelines nomeadas (por ex. 'appear', 'disappear', 'stand').
+
+    O avanço é feito pelo `SCHEDULER` global (chamado pelo `Game` a cada
+    frame): o dono não precisa atualizar as animações, e objetos parados
+    não custam nada.
     """
+    anim_group: Optional[str] = None   # grupo para pausas (ver AnimationScheduler)
+
     def __init__(self):
         self._timelines = {}   # name -> Sequence
         self._current: Optional[str] = None
@@ -125,21 +201,28 @@ class AnimatedObject:
             self._current = name
             if restart:
                 self._timelines[name].restart()
+            SCHEDULER.wake(self)
 
     def stop(self):
         self._current = None
+        SCHEDULER.sleep(self)
 
     def is_playing(self, name: Optional[str] = None) -> bool:
         if self._current is None:
             return False
         return name is None or self._current == name
 
-    def update_animations(self, dt: float):
-        if self._current is None: 
-            return
+    def _advance(self, dt: float) -> bool:
+        """Avança a timeline atual; False quando não há mais nada tocando."""
+        if self._current is None:
+            return False
         seq = self._timelines.get(self._current)
         if seq:
             seq.update(dt)
             if seq.is_done():
                 # mantém último estado; para automaticamente
                 self._current = None
+                return False
+            return True
+        self._current = None
+        return False
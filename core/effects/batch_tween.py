@@ -0,0 +1,226 @@
+# core/effects/batch_tween.py
+"""
+Motor de tweens em lote (NumPy).
+
+`Tween` avalia o easing objeto a objeto, com closures Python por frame. Para
+cenas com muitas animações simultâneas (multidões, grades de cards), este
+motor guarda cada tween como uma linha de arrays:
+
+    início | fim | decorrido | duração | id do easing | parâmetro | vivo
+
+e a cada frame avalia TODOS os tweens de um mesmo easing num único passo
+vetorizado. O resultado vai para `values` (buffer de propriedades), que os
+widgets leem pelo seu `TweenHandle` — sem callback por frame.
+
+Sem NumPy instalado o motor continua funcionando, avaliando tween a tween
+com as funções de `animations`.
+"""
+
+from typing import Callable, Dict, List, Optional
+
+from core.effects.animations import (
+    SCHEDULER, ease_in_back, ease_in_cubic, ease_out_back, ease_out_cubic, ease_out_sine,
+)
+
+try:
+    import numpy as np
+except ImportError:  # dependência opcional
+    np = None
+
+
+# -----------------------------
+# EASINGS (id -> função escalar / vetorizada)
+# -----------------------------
+LINEAR, OUT_CUBIC, IN_CUBIC, OUT_SINE, OUT_BACK, IN_BACK = range(6)
+
+EASING_IDS: Dict[str, int] = {
+    "linear": LINEAR,
+    "out_cubic": OUT_CUBIC,
+    "in_cubic": IN_CUBIC,
+    "out_sine": OUT_SINE,
+    "out_back": OUT_BACK,
+    "in_back": IN_BACK,
+}
+
+_SCALAR = {
+    LINEAR: lambda t, s: t,
+    OUT_CUBIC: lambda t, s: ease_out_cubic(t),
+    IN_CUBIC: lambda t, s: ease_in_cubic(t),
+    OUT_SINE: lambda t, s: ease_out_sine(t),
+    OUT_BACK: ease_out_back,
+    IN_BACK: ease_in_back,
+}
+
+if np is not None:
+    def _v_out_back(t, s):
+        t = t - 1.0
+        return t * t * ((s + 1.0) * t + s) + 1.0
+
+    _VECTOR = {
+        LINEAR: lambda t, s: t,
+        OUT_CUBIC: lambda t, s: (t - 1.0) ** 3 + 1.0,
+        IN_CUBIC: lambda t, s: t * t * t,
+        OUT_SINE: lambda t, s: np.sin(t * (np.pi * 0.5)),
+        OUT_BACK: _v_out_back,
+        IN_BACK: lambda t, s: t * t * ((s + 1.0) * t - s),
+    }
+
+
+class TweenHandle:
+    """Referência a um tween do motor; `value` lê o buffer de propriedades."""
+    __slots__ = ("engine", "slot", "serial")
+
+    def __init__(self, engine: "BatchTweenEngine", slot: int, serial: int):
+        self.engine = engine
+        self.slot = slot
+        self.serial = serial
+
+    @property
+    def value(self) -> float:
+        return float(self.engine.values[self.slot])
+
+    @property
+    def done(self) -> bool:
+        return self.engine._serials[self.slot] != self.serial or not self.engine.alive[self.slot]
+
+    def cancel(self):
+        if not self.done:
+            self.engine._free(self.slot)
+
+
+class BatchTweenEngine:
+    """
+    Conjunto de tweens avaliados em lote.
+
+    :param capacity: Nº inicial de linhas (dobra quando enche)
+    """
+
+    def __init__(self, capacity: int = 256):
+        self._alloc(max(1, int(capacity)))
+        self._free_slots: List[int] = list(range(self.capacity - 1, -1, -1))
+        self._callbacks: Dict[int, Callable[[], None]] = {}
+        self.active = 0
+        self.steps = 0
+
+    # ------------------------------------------------------------------ #
+    # Armazenamento
+    # ------------------------------------------------------------------ #
+    def _alloc(self, capacity: int):
+        old = getattr(self, "capacity", 0)
+        self.capacity = capacity
+        if np is not None:
+            def grow(name, dtype, fill=0):
+                arr = np.full(capacity, fill, dtype=dtype)
+                if old:
+                    arr[:old] = getattr(self, name)
+                setattr(self, name, arr)
+            grow("start", np.float64)
+            grow("end", np.float64)
+            grow("elapsed", np.float64)
+            grow("duration", np.float64, 1.0)
+            grow("param", np.float64)
+            grow("easing", np.int8)
+            grow("alive", np.bool_, False)
+            grow("values", np.float64)
+        else:
+            for name, fill in (("start", 0.0), ("end", 0.0), ("elapsed", 0.0), ("duration", 1.0),
+                               ("param", 0.0), ("easing", 0), ("alive", False), ("values", 0.0)):
+                arr = getattr(self, name, [])
+                arr.extend([fill] * (capacity - old))
+                setattr(self, name, arr)
+        serials = getattr(self, "_serials", [])
+        serials.extend([0] * (capacity - old))
+        self._serials = serials
+
+    def _free(self, slot: int):
+        self.alive[slot] = False
+        self._callbacks.pop(slot, None)
+        self._free_slots.append(slot)
+        self.active -= 1
+
+    # ------------------------------------------------------------------ #
+    # API
+    # ------------------------------------------------------------------ #
+    def add(
+        self,
+        start: float,
+        end: float,
+        duration: float,
+        easing: str = "out_sine",
+        param: float = 1.70158,
+        on_complete: Optional[Callable[[], None]] = None,
+    ) -> TweenHandle:
+        """Agenda um tween de `start` a `end`; o valor corrente fica em `values`."""
+        if not self._free_slots:
+            old = self.capacity
+            self._alloc(old * 2)
+            self._free_slots.extend(range(self.capacity - 1, old - 1, -1))
+        slot = self._free_slots.pop()
+        self.start[slot] = start
+        self.end[slot] = end
+        self.elapsed[slot] = 0.0
+        self.duration[slot] = max(1e-6, float(duration))
+        self.param[slot] = param
+        self.easing[slot] = EASING_IDS[easing]
+        self.alive[slot] = True
+        self.values[slot] = start
+        self._serials[slot] += 1
+        if on_complete is not None:
+            self._callbacks[slot] = on_complete
+        self.active += 1
+        return TweenHandle(self, slot, self._serials[slot])
+
+    def step(self, dt: float):
+        """Avança todos os tweens vivos em `dt` segundos."""
+        if not self.active:
+            return
+        self.steps += 1
+        dt = max(0.0, float(dt))
+        finished = self._step_numpy(dt) if np is not None else self._step_python(dt)
+        # libera todos antes dos callbacks: um callback que cancela outro tween
+        # do mesmo lote não o libera duas vezes, e os que criam tweens novos
+        # já encontram as linhas livres
+        callbacks = []
+        for slot in finished:
+            callback = self._callbacks.get(slot)
+            self._free(slot)
+            if callback is not None:
+                callbacks.append(callback)
+        for callback in callbacks:
+            callback()
+
+    def _step_numpy(self, dt: float) -> List[int]:
+        idx = np.flatnonzero(self.alive)
+        self.elapsed[idx] += dt
+        t = np.minimum(self.elapsed[idx] / self.duration[idx], 1.0)
+        easing = self.easing[idx]
+        eased = np.empty_like(t)
+        for eid in np.unique(easing):
+            mask = easing == eid
+            eased[mask] = _VECTOR[int(eid)](t[mask], self.param[idx[mask]])
+        start = self.start[idx]
+        self.values[idx] = start + (self.end[idx] - start) * eased
+        return idx[t >= 1.0].tolist()
+
+    def _step_python(self, dt: float) -> List[int]:
+        finished = []
+        for slot in range(self.capacity):
+            if not self.alive[slot]:
+                continue
+            self.elapsed[slot] += dt
+            t = min(1.0, self.elapsed[slot] / self.duration[slot])
+            e = _SCALAR[self.easing[slot]](t, self.param[slot])
+            self.values[slot] = self.start[slot] + (self.end[slot] - self.start[slot]) * e
+            if t >= 1.0:
+                finished.append(slot)
+        return finished
+
+    def clear(self):
+        for slot in range(self.capacity):
+            if self.alive[slot]:
+                self._free(slot)
+
+
+# Instância global, avançada pelo SCHEDULER (ver animations.AnimationScheduler)
+BATCH_TWEENS = BatchTweenEngine()
+SCHEDULER.attach(BATCH_TWEENS)
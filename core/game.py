@@ -5,10 +5,20 @@ Define a classe principal do jogo, responsável por gerenciar o estado atual (te
 e delegar atualizações, renderizações e eventos para o estado correspondente.
 """
 
+import os
+import struct
+
 from core.states.splash_screen import SplashScreen
 from settings import Settings
 from core.assets.player import Player
 from core.assets.menu import PlayerMenu
+from core.assets.restaurant import Restaurant
+from core.assets.save_journal import SaveJournal, journal_path_for
+from core.assets.slot_index import encode_index, index_path_for, load_slot_index
+from core.effects.animations import SCHEDULER
+from utils.autosave import AutosaveManager
+from utils.input_state import INPUT
+from utils.music_manager import music_manager
 
 
 class Game:
@@ -24,9 +34,69 @@ class Game:
         Inicializa o jogo com as configurações e define o primeiro estado (SplashScreen).
         """
         self.config = Settings()
-        self.player = Player(nickname="Player", restaurant_name="Meu Restaurante")
+        self.save_path = self.config.SAVE['path']
+
+        # Com save existente, só o índice de slots é lido agora; o jogador
+        # completo é carregado quando um slot for escolhido (`load_player`).
+        # Se o índice precisou ser refeito, o save já foi lido inteiro: o
+        # jogador carregado fica em memória em vez de ser lido de novo depois.
+        self.player = None
+        self.slot_index = self._load_slot_index()
+        if self.slot_index is None and self.player is None:
+            self.player = Player(nickname="Player", restaurant_name="Meu Restaurante")
+
         self.state = SplashScreen(self)
+        music_manager.fade = self.config.AUDIO['crossfade']
         self.player_menu = PlayerMenu()
+        # Saves em segundo plano: deltas no journal, compactação periódica
+        self.save_store = SaveJournal(
+            self.save_path, compact_bytes=self.config.SAVE['journal_compact_kb'] * 1024
+        )
+        self.autosave = AutosaveManager(
+            self.save_path,
+            store=self.save_store,
+            index_path=index_path_for(self.save_path),
+            index_encoder=encode_index,
+        )
+
+    def _load_slot_index(self):
+        """Índice de slots do save; None sem save ou com save ilegível."""
+        def loader(path):
+            self.player = Player.load_from_file(path)
+            return self.player
+
+        try:
+            return load_slot_index(self.save_path, loader)
+        except (OSError, ValueError, KeyError, TypeError, struct.error) as exc:
+            if self.player is not None:
+                # o save foi lido; só a regravação do índice falhou
+                print(f"[Game] Não foi possível regravar o índice de slots ({exc}).")
+                return None
+            # save corrompido: guarda uma cópia de lado e começa sem save
+            # (o primeiro autosave gravaria por cima dele)
+            print(f"[Game] Save ilegível ({exc}); iniciando sem save.")
+            self.player = None
+            for path in (self.save_path, journal_path_for(self.save_path)):
+                try:
+                    os.replace(path, path + ".corrupt")
+                except OSError:
+                    pass
+            return None
+
+    def load_player(self):
+        """Carrega o save completo (snapshot + journal), se ainda não estiver em memória."""
+        if self.player is None:
+            self.player = self.save_store.load(Player, Restaurant)
+        return self.player
+
+    def request_autosave(self):
+        """Agenda um save do jogador sem bloquear o frame."""
+        if self.player is not None:
+            self.autosave.request_save(self.player)
+
+    def shutdown(self):
+        """Finaliza o jogo garantindo que o último save pendente foi gravado."""
+        self.autosave.stop(flush=True)
 
     def change_state(self, new_state):
         """
@@ -34,14 +104,31 @@ class Game:
 
         :param new_state: Instância da nova tela/estado (ex: MainMenu, PhaseService).
         """
+        # o estado que sai desfaz o que deixou global (ex.: pausas do SCHEDULER)
+        on_exit = getattr(self.state, "on_exit", None)
+        if on_exit is not None:
+            on_exit()
         self.state = new_state
+        # Playlist da nova tela (crossfade e carga em segundo plano)
+        music_manager.enter(type(new_state).__name__)
 
-    def update(self, dt):
+    def update(self, dt, frame_input=None):
         """
         Atualiza o estado atual do jogo.
 
         :param dt: Delta time (tempo entre frames).
+        :param frame_input: `InputSnapshot` do frame (capturado no laço principal).
         """
+        # Entrada do frame: widgets leem o snapshot em vez de consultar o pygame
+        if frame_input is None:
+            frame_input = INPUT.capture()
+        else:
+            INPUT.use(frame_input)
+        self.input = frame_input
+
+        # Animações ativas primeiro: o estado já enxerga os valores do frame
+        SCHEDULER.tick(dt)
+        music_manager.update(dt)
         self.state.update(dt)
 
     def render(self, screen):
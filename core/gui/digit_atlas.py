@@ -0,0 +1,127 @@
+"""
+Módulo que armazena o renderizador de números por atlas de glifos.
+
+Números são o texto mais re-renderizado da interface (dinheiro, relógio,
+quantidades, totais). Em vez de chamar `font.render` (FreeType) a cada
+mudança, os dígitos e símbolos são pré-renderizados UMA vez por
+fonte/cor numa única surface (o atlas) e cada número é composto com um
+único `Surface.blits` usando áreas desse atlas.
+
+Caracteres fora do conjunto padrão (ex.: letras de um rótulo) são
+renderizados na primeira vez que aparecem e guardados, então o caminho
+quente continua sem FreeType.
+"""
+
+import weakref
+from collections import OrderedDict
+
+import pygame
+
+# Dígitos e símbolos pré-renderizados no atlas
+DEFAULT_CHARSET = "0123456789$:,.−-+ %"
+
+# Atlas guardados por fonte (combinações de cor/charset, LRU)
+ATLASES_PER_FONT = 8
+
+
+class DigitAtlas:
+    """
+    Atlas de glifos para uma combinação fonte + cor.
+
+    Args:
+        font (pygame.font.Font): Fonte usada para os glifos.
+        color (tuple): Cor RGB do texto.
+        charset (str): Caracteres pré-renderizados no atlas.
+    """
+
+    def __init__(self, font, color, charset=DEFAULT_CHARSET):
+        # referência fraca: o cache de atlas não mantém fontes descartadas vivas
+        self._font = weakref.ref(font)
+        self.color = color
+        self.height = font.get_height()
+
+        # Atlas: glifos lado a lado numa única surface
+        glyphs = [(ch, font.render(ch, True, color)) for ch in dict.fromkeys(charset)]
+        total_w = sum(s.get_width() for _, s in glyphs)
+        self.surface = pygame.Surface((max(1, total_w), self.height), pygame.SRCALPHA)
+
+        # char -> (surface de origem, área, avanço)
+        self.glyphs = {}
+        x = 0
+        for ch, surf in glyphs:
+            w = surf.get_width()
+            self.surface.blit(surf, (x, 0))
+            self.glyphs[ch] = (self.surface, pygame.Rect(x, 0, w, self.height), w)
+            x += w
+
+    @property
+    def font(self):
+        return self._font()
+
+    def _glyph(self, ch):
+        glyph = self.glyphs.get(ch)
+        if glyph is None:
+            font = self._font()
+            if font is None:
+                return (None, None, 0)  # fonte já descartada: caractere some
+            # fora do atlas: renderiza uma vez e guarda
+            surf = font.render(ch, True, self.color)
+            glyph = (surf, None, surf.get_width())
+            self.glyphs[ch] = glyph
+        return glyph
+
+    def size(self, text):
+        """Largura e altura que `text` ocupa."""
+        return sum(self._glyph(ch)[2] for ch in text), self.height
+
+    def blit(self, dest, text, pos, anchor="topleft"):
+        """
+        Desenha `text` direto em `dest` com um único `blits`.
+
+        Args:
+            dest (Surface): Surface de destino.
+            text (str): Texto (normalmente numérico).
+            pos (tuple): Posição do ponto de âncora.
+            anchor (str): Atributo de `pygame.Rect` usado como âncora
+                (ex.: "topleft", "center", "midright").
+
+        Returns:
+            pygame.Rect: Área ocupada em `dest`.
+        """
+        rect = pygame.Rect((0, 0), self.size(text))
+        setattr(rect, anchor, pos)
+        x, y = rect.topleft
+        seq = []
+        for ch in text:
+            surf, area, adv = self._glyph(ch)
+            if surf is not None:
+                seq.append((surf, (x, y), area))
+            x += adv
+        dest.blits(seq, doreturn=False)
+        return rect
+
+    def render(self, text):
+        """Compõe `text` numa surface nova (equivalente a `font.render`)."""
+        surf = pygame.Surface(self.size(text), pygame.SRCALPHA)
+        self.blit(surf, text, (0, 0))
+        return surf
+
+
+# fonte -> OrderedDict((cor, charset) -> DigitAtlas); some junto com a fonte
+_ATLASES = weakref.WeakKeyDictionary()
+
+
+def get_atlas(font, color, charset=DEFAULT_CHARSET):
+    """Atlas compartilhado para fonte + cor (criado na primeira chamada)."""
+    per_font = _ATLASES.get(font)
+    if per_font is None:
+        per_font = _ATLASES[font] = OrderedDict()
+    key = (tuple(color), charset)
+    atlas = per_font.get(key)
+    if atlas is None:
+        atlas = per_font[key] = DigitAtlas(font, color, charset)
+        while len(per_font) > ATLASES_PER_FONT:
+            per_font.popitem(last=False)
+    else:
+        per_font.move_to_end(key)
+    return atlas
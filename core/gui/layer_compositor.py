@@ -0,0 +1,152 @@
+"""
+Módulo que armazena o compositor de camadas para telas de título.
+
+Cada camada tem a própria surface (convertida uma vez para o formato da
+tela), posição e estado de mistura (alpha, visibilidade). Camadas estáticas
+vizinhas são fundidas UMA vez numa única surface; a cada frame só as
+camadas animadas são re-blitadas, sem criar surfaces novas.
+"""
+
+import pygame
+
+
+def _converted(surface):
+    """Converte para o formato da tela (mantendo alpha por pixel, se houver)."""
+    if surface is None or not pygame.display.get_init() or pygame.display.get_surface() is None:
+        return surface
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface.convert_alpha()
+    return surface.convert()
+
+
+class Layer:
+    """
+    Camada do compositor.
+
+    Args:
+        name (str): Nome usado em `LayerCompositor.get`.
+        surface (Surface | None): Imagem da camada (convertida na criação).
+        pos (tuple): Posição de desenho.
+        alpha (int): Opacidade global (0..255).
+        static (bool): Camada que não muda; pode ser fundida às vizinhas.
+        draw (callable | None): Desenho próprio `draw(screen)` (ex.: widgets),
+            usado no lugar da surface.
+    """
+
+    def __init__(self, name, surface=None, pos=(0, 0), alpha=255, static=False, draw=None):
+        self.name = name
+        self.surface = _converted(surface)
+        self.pos = pos
+        self.alpha = int(alpha)
+        self.visible = True
+        self.static = static
+        self.draw_fn = draw
+
+    def set_alpha(self, alpha):
+        self.alpha = max(0, min(255, int(alpha)))
+
+    def draw(self, screen):
+        if self.draw_fn is not None:
+            self.draw_fn(screen)
+            return
+        if self.surface is None or self.alpha <= 0:
+            return
+        # a mesma surface pode servir a mais de uma camada: alpha aplicado no blit
+        if self.surface.get_alpha() != self.alpha:
+            self.surface.set_alpha(self.alpha)
+        screen.blit(self.surface, self.pos)
+
+
+class ScrollLayer(Layer):
+    """
+    Faixa que rola na horizontal com repetição (ex.: céu).
+
+    `offset` é o deslocamento em pixels; o desenho usa no máximo dois blits
+    da mesma surface, sem criar surfaces por frame.
+    """
+
+    def __init__(self, name, surface, y=0, **kwargs):
+        super().__init__(name, surface, pos=(0, y), **kwargs)
+        self.offset = 0.0
+
+    def draw(self, screen):
+        if self.surface is None or self.alpha <= 0:
+            return
+        if self.surface.get_alpha() != self.alpha:
+            self.surface.set_alpha(self.alpha)
+        width = self.surface.get_width()
+        x = -(int(self.offset) % width)
+        y = self.pos[1]
+        screen_w = screen.get_width()
+        while x < screen_w:
+            screen.blit(self.surface, (x, y))
+            x += width
+
+
+class LayerCompositor:
+    """
+    Pilha de camadas desenhada de baixo para cima.
+
+    Args:
+        size (tuple): Tamanho da tela (para as fusões de camadas estáticas).
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.layers = []
+        self._by_name = {}
+        self._runs = None
+
+    def add(self, layer):
+        """Empilha `layer` no topo e a retorna."""
+        self.layers.append(layer)
+        self._by_name[layer.name] = layer
+        self._runs = None
+        return layer
+
+    def get(self, name):
+        return self._by_name[name]
+
+    def set_visible(self, name, visible):
+        layer = self._by_name[name]
+        if layer.visible != visible:
+            layer.visible = visible
+            if layer.static:
+                # a fusão depende de quais estáticas estão visíveis
+                self._runs = None
+
+    def invalidate(self):
+        """Refaz as fusões de camadas estáticas no próximo render."""
+        self._runs = None
+
+    def _build_runs(self):
+        """Agrupa estáticas vizinhas numa surface só; animadas seguem como estão."""
+        runs, pending = [], []
+
+        def flush():
+            if len(pending) == 1:
+                runs.append(pending[0])
+            elif pending:
+                merged = pygame.Surface(self.size, pygame.SRCALPHA)
+                for layer in pending:
+                    layer.draw(merged)
+                runs.append(Layer("+".join(l.name for l in pending), _converted(merged), static=True))
+            pending.clear()
+
+        for layer in self.layers:
+            if not layer.visible:
+                continue
+            if layer.static:
+                pending.append(layer)
+            else:
+                flush()
+                runs.append(layer)
+        flush()
+        return runs
+
+    def render(self, screen):
+        if self._runs is None:
+            self._runs = self._build_runs()
+        for layer in self._runs:
+            if layer.visible:
+                layer.draw(screen)
@@ -0,0 +1,155 @@
+"""
+Módulo que armazena o motor de layout de texto.
+
+Descrições longas (cardápio, mercado) eram re-quebradas com `font.size`
+palavra a palavra e re-renderizadas linha a linha com `font.render` a cada
+frame. Aqui:
+
+- a quebra de linha é memorizada por (texto, fonte, largura);
+- um `TextBlock` posiciona as linhas UMA vez e as compõe numa única surface
+  alta; a área rolável só recorta uma janela dela com `blit(..., area=...)`,
+  então rolar a descrição custa um blit.
+"""
+
+from collections import OrderedDict
+
+import pygame
+
+# Nº de quebras de linha memorizadas (LRU)
+WRAP_CACHE_SIZE = 256
+
+_WRAPS = OrderedDict()
+
+
+def _memo(kind, text, font, width, compute):
+    key = (kind, text, id(font), width)
+    hit = _WRAPS.get(key)
+    # id() pode ser reaproveitado por outra fonte depois que a antiga morrer
+    if hit is not None and hit[0] is font:
+        _WRAPS.move_to_end(key)
+        return hit[1]
+    result = compute()
+    _WRAPS[key] = (font, result)
+    while len(_WRAPS) > WRAP_CACHE_SIZE:
+        _WRAPS.popitem(last=False)
+    return result
+
+
+def wrap_text(text, font, max_width):
+    """
+    Quebra `text` em linhas que cabem em `max_width` (gulosa, por palavras).
+
+    O resultado é memorizado por (texto, fonte, largura).
+
+    Returns:
+        tuple[str, ...]: Linhas resultantes.
+    """
+    def compute():
+        lines, line = [], ""
+        for w in text.split():
+            t = (line + " " + w).strip()
+            if font.size(t)[0] <= max_width:
+                line = t
+            else:
+                if line:
+                    lines.append(line)
+                line = w
+        if line:
+            lines.append(line)
+        return tuple(lines)
+
+    return _memo("wrap", text, font, max_width, compute)
+
+
+def split_first_line(text, font, max_width):
+    """
+    Separa o maior prefixo de palavras que cabe em `max_width` do restante.
+
+    Se nem a primeira palavra couber, o prefixo fica vazio.
+
+    Returns:
+        tuple[str, str]: (primeira linha, resto do texto).
+    """
+    def compute():
+        words = text.split()
+        first = ""
+        for i, w in enumerate(words):
+            t = (first + " " + w).strip()
+            if font.size(t)[0] > max_width:
+                return first, " ".join(words[i:])
+            first = t
+        return first, ""
+
+    return _memo("first", text, font, max_width, compute)
+
+
+class TextBlock:
+    """
+    Bloco de texto posicionado uma vez e composto numa surface alta.
+
+    As linhas são adicionadas de cima para baixo a partir de um cursor
+    vertical (`y`); `surface` renderiza tudo na primeira leitura.
+
+    Args:
+        width (int): Largura do bloco em pixels.
+    """
+
+    def __init__(self, width):
+        self.width = max(1, int(width))
+        self.y = 0
+        self.height = 0
+        self._runs = []
+        self._surface = None
+
+    def line(self, font, text, color, x=0, y=None):
+        """
+        Posiciona uma linha em (x, y) sem mover o cursor.
+
+        Args:
+            y (int | None): Topo da linha (padrão: cursor atual).
+
+        Returns:
+            pygame.Rect: Área ocupada pela linha no bloco.
+        """
+        rect = pygame.Rect((x, self.y if y is None else y), font.size(text))
+        if text:
+            self._runs.append((font, text, color, rect.topleft))
+        self.height = max(self.height, rect.bottom)
+        self._surface = None
+        return rect
+
+    def paragraph(self, font, text, color, max_width, x=0):
+        """Quebra `text` em `max_width` e empilha as linhas a partir do cursor."""
+        line_h = font.get_linesize()
+        for ln in wrap_text(text, font, max_width):
+            self.line(font, ln, color, x)
+            self.advance(line_h)
+
+    def advance(self, dy):
+        """Desce o cursor (espaçamentos entre seções)."""
+        self.y += dy
+        self.height = max(self.height, self.y)
+
+    @property
+    def surface(self):
+        """Surface com todas as linhas (renderizada uma única vez)."""
+        if self._surface is None:
+            surf = pygame.Surface((self.width, max(1, self.height)), pygame.SRCALPHA)
+            surf.blits(
+                [(font.render(text, True, color), pos) for font, text, color, pos in self._runs],
+                doreturn=False,
+            )
+            self._surface = surf
+        return self._surface
+
+    def blit_window(self, dest, rect, offset):
+        """
+        Desenha em `dest` a janela do bloco que começa em `offset` (rolagem).
+
+        Args:
+            dest (Surface): Surface de destino.
+            rect (pygame.Rect): Área visível em `dest`.
+            offset (int): Deslocamento vertical da rolagem.
+        """
+        area = pygame.Rect(0, int(offset), rect.width, rect.height)
+        dest.blit(self.surface, rect.topleft, area)
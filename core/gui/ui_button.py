@@ -1,16 +1,22 @@
 # core/gui/ui_button.py
 import pygame
 from utils.audio_manager import audio_manager
+from utils.input_state import HIT_TEST, INPUT
 
 # +++ IMPORTANTE: importe o sistema de animação + easings
-from core.effects.animations import (
-    AnimatedObject,
-    Tween,
-    Sequence,
-    lerp,
-    ease_out_back,
-    ease_out_sine,
-    ease_in_cubic,
+from core.effects.animations import AnimatedObject, lerp
+from core.effects.batch_tween import BATCH_TWEENS
+
+
+# Fases das animações de surgir/sumir, avaliadas em lote pelo BATCH_TWEENS:
+# (duração, easing, parâmetro, escala de->para, alpha de->para ou None)
+APPEAR_PHASES = (
+    (0.22, "out_back", 1.5, (0.75, 1.08), (0.0, 1.0)),   # impacto
+    (0.12, "out_sine", 0.0, (1.08, 1.00), None),         # assenta
+)
+DISAPPEAR_PHASES = (
+    (0.10, "out_sine", 0.0, (1.00, 1.08), (1.0, 0.8)),   # estalo
+    (0.18, "in_cubic", 0.0, (1.08, 0.80), (0.8, 0.0)),   # encolhe e some
 )
 
 
@@ -27,7 +33,8 @@ class UIButton(AnimatedObject):
     - Sons de hover e clique
 
     Adições:
-    - Animações de surgir/sumir (scale+alpha) usando AnimatedObject
+    - Animações de surgir/sumir (scale+alpha) avaliadas em lote pelo
+      `BATCH_TWEENS` (grades de cards animam juntas num passo vetorizado)
     - Estado 'active' (efeito rádio): quando ativo, usa a MESMA escala do hover
     """
 
@@ -55,6 +62,11 @@ class UIButton(AnimatedObject):
     ):
         super().__init__()  # <-- inicializa AnimatedObject
 
+        # Animação em lote em curso: nome, fase atual e handle do tween
+        self._anim_name = None
+        self._phase = None
+        self._tween = None
+
         self.x = x
         self.y = y
         self.bg_image = bg_image
@@ -101,9 +113,26 @@ class UIButton(AnimatedObject):
         self.hover_sound = hover_sound
         self.click_sound = click_sound
 
-        # Timelines de animação
-        self._build_appear_timeline()
-        self._build_disappear_timeline()
+        HIT_TEST.register(self)
+
+    @property
+    def hit_rect(self):
+        """Área que reage ao cursor (em coordenadas de tela)."""
+        return self._fixed_rect
+
+    @property
+    def fixed_rect(self):
+        return self._fixed_rect
+
+    @fixed_rect.setter
+    def fixed_rect(self, rect):
+        # mantém o índice de hit-test em dia quando o botão move/escala
+        self._fixed_rect = rect
+        HIT_TEST.move(self, rect)
+
+    def _sync_hit_layer(self):
+        """Hover/ativo ficam por cima no hit-test (são desenhados por cima)."""
+        HIT_TEST.set_layer(self, 2 if self.hovered else 1 if self.active else 0)
 
     # -------------------------------------------------
     # API de estado ativo (rádio)
@@ -111,54 +140,78 @@ class UIButton(AnimatedObject):
     def set_active(self, value: bool) -> None:
         """Define se o botão está ativo (mantém escala de hover)."""
         self.active = bool(value)
+        self._sync_hit_layer()
 
     def is_active(self) -> bool:
         return self.active
 
     # -------------------------------------------------
-    # ANIMAÇÕES (timelines)
+    # ANIMAÇÕES (tweens em lote)
     # -------------------------------------------------
-    def _build_appear_timeline(self):
-        # Fase A: 0.75 -> 1.08 com alpha 0 -> 1 (impacto)
-        dur_a = 0.22
-
-        def on_update_a(t):
-            self.anim_scale = lerp(0.75, 1.08, t)
-            self.anim_alpha = lerp(0.0, 1.0, t)
-
-        tw_a = Tween(duration=dur_a, easing=lambda x: ease_out_back(x, 1.5), on_update=on_update_a)
-
-        # Fase B: 1.08 -> 1.00 (assenta)
-        dur_b = 0.12
-
-        def on_update_b(t):
-            self.anim_scale = lerp(1.08, 1.00, t)
-
-        tw_b = Tween(duration=dur_b, easing=ease_out_sine, on_update=on_update_b)
-
-        self.add_timeline("appear", Sequence([tw_a, tw_b], loop=False))
-
-    def _build_disappear_timeline(self):
-        # Fase A: 1.00 -> 1.08 (estalo) com leve queda de alpha
-        dur_a = 0.10
-
-        def on_update_a(t):
-            self.anim_scale = lerp(1.00, 1.08, t)
-            self.anim_alpha = lerp(1.0, 0.8, t)
-
-        tw_a = Tween(duration=dur_a, easing=ease_out_sine, on_update=on_update_a)
-
-        # Fase B: 1.08 -> 0.80 e alpha 0.8 -> 0
-        dur_b = 0.18
-
-        def on_update_b(t):
-            self.anim_scale = lerp(1.08, 0.80, t)
-            self.anim_alpha = lerp(0.8, 0.0, t)
+    @property
+    def anim_scale(self):
+        """Escala da animação; durante uma fase, lida do buffer do BATCH_TWEENS."""
+        phase = self._phase
+        if phase is not None:
+            return lerp(*phase[3], self._tween.value)
+        return self._anim_scale
+
+    @anim_scale.setter
+    def anim_scale(self, value):
+        self._anim_scale = value
+
+    @property
+    def anim_alpha(self):
+        phase = self._phase
+        if phase is not None and phase[4] is not None:
+            return lerp(*phase[4], self._tween.value)
+        return self._anim_alpha
+
+    @anim_alpha.setter
+    def anim_alpha(self, value):
+        self._anim_alpha = value
+
+    def _run_phases(self, name, phases, index=0):
+        """Toca `phases` em sequência; cada fase é um tween 0 -> 1 no motor em lote."""
+        duration, easing, param, scale, alpha = phases[index]
+
+        def on_complete():
+            # mantém o estado final da fase e encadeia a próxima
+            self._anim_scale = scale[1]
+            if alpha is not None:
+                self._anim_alpha = alpha[1]
+            if index + 1 < len(phases):
+                self._run_phases(name, phases, index + 1)
+            else:
+                self._anim_name = self._phase = self._tween = None
 
-        tw_b = Tween(duration=dur_b, easing=ease_in_cubic, on_update=on_update_b)
+        self._anim_name = name
+        self._phase = phases[index]
+        self._tween = BATCH_TWEENS.add(0.0, 1.0, duration, easing, param, on_complete=on_complete)
 
-        seq = Sequence([tw_a, tw_b], loop=False)
-        self.add_timeline("disappear", seq)
+    def play(self, name, restart=True):
+        phases = {"appear": APPEAR_PHASES, "disappear": DISAPPEAR_PHASES}.get(name)
+        if phases is None:
+            super().play(name, restart)
+            return
+        if self._anim_name == name and not restart:
+            return
+        self.stop()
+        self._run_phases(name, phases)
+
+    def stop(self):
+        if self._tween is not None:
+            # congela no valor corrente da fase interrompida
+            scale, alpha = self.anim_scale, self.anim_alpha
+            self._tween.cancel()
+            self._anim_name = self._phase = self._tween = None
+            self._anim_scale, self._anim_alpha = scale, alpha
+        super().stop()
+
+    def is_playing(self, name=None):
+        if self._anim_name is not None:
+            return name is None or self._anim_name == name
+        return super().is_playing(name)
 
     # API pública de animação
     def appear(self):
@@ -188,12 +241,14 @@ class UIButton(AnimatedObject):
         draw_y = self.y + self.original_size[1] // 2 - height // 2
         return pygame.Rect(draw_x, draw_y, width, height)
 
-    def update(self, dt):
-        """Atualiza animações (appear/disappear) e efeitos de hover/scale/fade."""
-        # 1) Animações (timelines) SEMPRE rodam
-        self.update_animations(dt)
+    def update(self, dt, offset_x=0, offset_y=0):
+        """
+        Atualiza efeitos de hover/scale/fade (appear/disappear rodam no SCHEDULER).
 
-        # Se alguma timeline terminou e alpha ~0, marca invisível
+        `offset_x`/`offset_y` deslocam o retângulo final para coordenadas de
+        tela (ex.: superfície pai com rolagem), sem um segundo `update_position`.
+        """
+        # 1) Se a timeline terminou e alpha ~0, marca invisível
         if not self.is_playing() and self.anim_alpha <= 0.01:
             self._visible_flag = False
 
@@ -201,9 +256,11 @@ class UIButton(AnimatedObject):
         interactive = getattr(self, "_interactive", True) and (self.anim_alpha >= 0.05)
 
         if interactive:
-            mouse_pos = pygame.mouse.get_pos()
-            is_hovering = self.fixed_rect.collidepoint(mouse_pos)
-            self.hovered = is_hovering
+            # hover resolvido uma vez por frame na captura da entrada
+            is_hovering = INPUT.current.hovering(self)
+            if is_hovering != self.hovered:
+                self.hovered = is_hovering
+                self._sync_hit_layer()
 
             if is_hovering and not self.was_hovering and self.hover_sound:
                 audio_manager.play_sound(self.hover_sound)
@@ -225,15 +282,18 @@ class UIButton(AnimatedObject):
             self.was_hovering = is_hovering
         else:
             # Interação desligada: sem hover, mas mantém estado ativo
-            self.hovered = False
+            if self.hovered:
+                self.hovered = False
+                self._sync_hit_layer()
             self._hover_target = self.max_scale if (self.active and self.enable_scale) else 1.0
             self.was_hovering = False
 
         # 3) Corrente de hover/ativo suavizada
         self.current_scale += (self._hover_target - self.current_scale) * min(self.scale_speed * dt, 1.0)
 
-        # 4) Atualiza rect a partir da escala composta (anim_scale * hover/ativo)
-        self.rect = self.get_scaled_rect()
+        # 4) Atualiza rect a partir da escala composta (anim_scale * hover/ativo);
+        #    fixed_rect é atribuído uma única vez (cada atribuição move o hit-test)
+        self.rect = self.get_scaled_rect().move(offset_x, offset_y)
         self.fixed_rect = self.rect.copy()
 
     def update_position(self, offset_x=0, offset_y=0):
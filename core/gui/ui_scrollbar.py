@@ -2,6 +2,8 @@
 
 import pygame
 
+from utils.input_state import HIT_TEST, INPUT
+
 
 class UIScrollbar:
     """
@@ -24,6 +26,9 @@ class UIScrollbar:
         bg_image (Surface or None): Imagem do fundo da barra (opcional).
     """
 
+    # Nº máximo de skins (fundo/botão por tamanho) mantidas em cache
+    SKIN_CACHE_SIZE = 16
+
     def __init__(self, x, y, height, content_height, view_height,
                  width=8, hover_scale=1.5, bar_color=(100, 70, 40), bg_color=(180, 130, 100),
                  bar_image=None, bg_image=None):
@@ -54,6 +59,16 @@ class UIScrollbar:
         self.mouse_offset_y = 0
         self.hover_speed = 12.0
 
+        # (tipo, (largura, altura)) -> surface pronta para blit
+        self._skins = {}
+
+        HIT_TEST.register(self)
+
+    @property
+    def hit_rect(self):
+        """Área que reage ao cursor (o botão da barra)."""
+        return self.bar_rect
+
     def handle_event(self, event):
         """Lida com os eventos de clique, arrasto e liberação do mouse sobre a barra."""
         if event.type == pygame.MOUSEBUTTONDOWN and self.bar_rect.collidepoint(event.pos):
@@ -65,11 +80,11 @@ class UIScrollbar:
             new_y = event.pos[1] - self.mouse_offset_y
             new_y = max(self.y, min(self.y + self.height - self.bar_height, new_y))
             self.bar_rect.y = new_y
+            HIT_TEST.move(self, self.bar_rect)
 
     def update(self, dt):
         """Atualiza a largura do botão da barra suavemente com base no hover ou arrasto."""
-        mouse_pos = pygame.mouse.get_pos()
-        hovered = self.bar_rect.collidepoint(mouse_pos)
+        hovered = INPUT.current.hovering(self)
 
         target_width = self.hover_width if hovered or self.dragging else self.default_width
         self.current_width += (target_width - self.current_width) * min(self.hover_speed * dt, 1)
@@ -77,6 +92,7 @@ class UIScrollbar:
         center_x = self.x + self.default_width // 2
         self.bar_rect.width = int(self.current_width)
         self.bar_rect.x = center_x - self.bar_rect.width // 2
+        HIT_TEST.move(self, self.bar_rect)
 
     def get_scroll_offset(self):
         """Retorna o deslocamento atual do conteúdo com base na posição da barra."""
@@ -93,36 +109,38 @@ class UIScrollbar:
             scroll_ratio = offset / (self.content_height - self.view_height)
             self.bar_rect.y = int(scroll_ratio * (self.height - self.bar_height)) + self.y
 
+    def _skin(self, kind, size):
+        """
+        Surface do fundo ("bg") ou do botão ("bar") no tamanho pedido.
+
+        As versões escaladas (ou desenhadas, sem imagem) ficam em cache por
+        tamanho; como a largura do hover é inteira, a animação passa por
+        poucos tamanhos e cada um é gerado uma única vez.
+        """
+        key = (kind, size)
+        skin = self._skins.get(key)
+        if skin is None:
+            image = self.bg_image if kind == "bg" else self.bar_image
+            if image:
+                skin = pygame.transform.scale(image, size)
+            else:
+                color = self.bg_color if kind == "bg" else self.bar_color
+                skin = pygame.Surface(size, pygame.SRCALPHA)
+                pygame.draw.rect(skin, color, skin.get_rect(), border_radius=6)
+            if len(self._skins) >= self.SKIN_CACHE_SIZE:
+                # alturas antigas (conteúdo mudou): recomeça o cache
+                self._skins.clear()
+            self._skins[key] = skin
+        return skin
+
     def render(self, screen):
         """Desenha a barra de rolagem (fundo + botão), com imagens ou cores."""
-        if self.bg_image:
-            bg_scaled = pygame.transform.scale(self.bg_image, (self.default_width, self.height))
-            screen.blit(bg_scaled, (self.x, self.y))
-        else:
-            pygame.draw.rect(screen, self.bg_color, (self.x, self.y, self.default_width, self.height), border_radius=6)
-
-        if self.bar_image:
-            bar_scaled = pygame.transform.scale(self.bar_image, (self.bar_rect.width, self.bar_rect.height))
-            screen.blit(bar_scaled, self.bar_rect.topleft)
-        else:
-            pygame.draw.rect(screen, self.bar_color, self.bar_rect, border_radius=6)
+        self.render_at(screen, y_offset=0)
 
     def render_at(self, screen, y_offset=0):
         """Desenha a barra com um deslocamento vertical (ex: popups animadas)."""
-        if self.bg_image:
-            bg_scaled = pygame.transform.scale(self.bg_image, (self.default_width, self.height))
-            screen.blit(bg_scaled, (self.x, self.y + y_offset))
-        else:
-            pygame.draw.rect(screen, self.bg_color, (self.x, self.y + y_offset, self.default_width, self.height), border_radius=6)
-
-        bar_rect_y = self.bar_rect.y + y_offset
-        bar_rect = pygame.Rect(self.bar_rect.x, bar_rect_y, self.bar_rect.width, self.bar_rect.height)
-
-        if self.bar_image:
-            bar_scaled = pygame.transform.scale(self.bar_image, (bar_rect.width, bar_rect.height))
-            screen.blit(bar_scaled, bar_rect.topleft)
-        else:
-            pygame.draw.rect(screen, self.bar_color, bar_rect, border_radius=6)
+        screen.blit(self._skin("bg", (self.default_width, self.height)), (self.x, self.y + y_offset))
+        screen.blit(self._skin("bar", self.bar_rect.size), (self.bar_rect.x, self.bar_rect.y + y_offset))
 
     def set_content(self, content_height: int, view_height: int):
         """
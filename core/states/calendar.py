@@ -1,17 +1,27 @@
 import pygame
 import calendar
+from collections import OrderedDict
 from datetime import datetime
 
 from settings import Settings
 from core.effects.animated_popup import AnimatedPopup
 from core.gui.ui_button import UIButton
 from utils.functions import render_text_with_outline
+from utils.input_state import HIT_TEST
+
+
+# Nº de páginas mensais pré-renderizadas mantidas em cache (LRU)
+PAGE_CACHE_SIZE = 5
 
 
 class Calendar(AnimatedPopup):
     """
     Classe responsável por exibir o calendário do jogo com sistema de transição suave entre páginas mensais.
     Herda animações de entrada/saída de AnimatedPopup.
+
+    Cada mês é pré-renderizado numa textura (página + título + grade de dias)
+    guardada num cache LRU; a transição apenas desliza essas texturas. Os
+    botões interativos dos dias só são criados quando a página assenta.
     """
 
     def __init__(self, game):
@@ -36,8 +46,11 @@ class Calendar(AnimatedPopup):
             "JANEIRO", "FEVEREIRO", "MARÇO", "ABRIL", "MAIO", "JUNHO",
             "JULHO", "AGOSTO", "SETEMBRO", "OUTUBRO", "NOVEMBRO", "DEZEMBRO"
         ]
-        font = pygame.font.Font('fonts/LuckiestGuy-Regular.ttf', 38)
-        self.month_title = render_text_with_outline(font, self.month_names[self.current_month], (255, 255, 255), (0, 0, 0))
+        self.title_font = pygame.font.Font('fonts/LuckiestGuy-Regular.ttf', 38)
+        self.day_font = pygame.font.Font('fonts/LuckiestGuy-Regular.ttf', 30)
+        self.day_image = pygame.image.load('graphics/sprites/calendar_button.png')
+        self._titles = {}
+        self.month_title = self._month_title(self.current_month)
         self.month_title_rect = self.month_title.get_rect(center=(self.config.SCREEN['width'] // 2, 30))
 
         # Superfície base do calendário
@@ -79,23 +92,24 @@ class Calendar(AnimatedPopup):
             hover_sound='hover', click_sound='swipe',
             enable_scale=True,
         )
+        # Botão de navegação -> ação (0 fecha; ±1 troca de mês), roteado pelo HIT_TEST
+        self._nav_buttons = {self.go_back: 0, self.prev_button: -1, self.next_button: 1}
+
+        # Texturas das páginas mensais: mês -> surface (LRU)
+        self._page_cache = OrderedDict()
+        self.page_renders = 0
 
         # Cria os botões dos dias do mês
         self.day_buttons = []
         self.create_day_buttons()
 
-    def create_day_buttons(self):
-        """Cria os botões representando os dias do mês atual."""
-        self.day_buttons.clear()
-
+    def _day_cells(self, month):
+        """Gera (dia, x, y) de cada dia do mês na grade de 7 colunas."""
         # Cálculo do primeiro dia da semana e número de dias do mês
-        first_weekday, num_days = calendar.monthrange(self.current_year, self.current_month + 1)
-
-        day_image = pygame.image.load('graphics/sprites/calendar_button.png')
-        day_rect = day_image.get_rect()
-        font = pygame.font.Font('fonts/LuckiestGuy-Regular.ttf', 30)
+        first_weekday, num_days = calendar.monthrange(self.current_year, month + 1)
 
         # Tamanho base de célula (7 colunas, até 6 linhas)
+        day_rect = self.day_image.get_rect()
         cell_width = day_rect.width - 4
         cell_height = day_rect.height - 5
         start_x = 168
@@ -104,15 +118,64 @@ class Calendar(AnimatedPopup):
         for day in range(1, num_days + 1):
             col = (first_weekday + day - 1) % 7
             row = (first_weekday + day - 1) // 7
+            yield day, start_x + col * cell_width, start_y + row * cell_height
+
+    def _month_title(self, month):
+        """Título renderizado (com contorno) do mês, criado uma vez."""
+        title = self._titles.get(month)
+        if title is None:
+            title = self._titles[month] = render_text_with_outline(
+                self.title_font, self.month_names[month], (255, 255, 255), (0, 0, 0)
+            )
+        return title
+
+    def _page_texture(self, month):
+        """
+        Textura da página do mês na largura da tela: fundo, título e a grade
+        de dias em repouso. Coordenadas relativas ao topo da popup.
+        """
+        texture = self._page_cache.get(month)
+        if texture is not None:
+            self._page_cache.move_to_end(month)
+            return texture
+
+        page = self.pages[month]
+        texture = pygame.Surface((self.screen_width, page.get_height()), pygame.SRCALPHA)
+        texture.blit(page, (self.rect.left, 0))
+
+        title = self._month_title(month)
+        title_rect = title.get_rect(center=(self.config.SCREEN['width'] // 2, 30))
+        texture.blit(title, (title_rect.left, 88))
+
+        for day, x, y in self._day_cells(month):
+            texture.blit(self.day_image, (x, y))
+            text = self.day_font.render(str(day), True, (0, 0, 0))
+            cell = self.day_image.get_rect(topleft=(x, y))
+            texture.blit(text, text.get_rect(center=cell.center))
+
+        self._page_cache[month] = texture
+        self.page_renders += 1
+        while len(self._page_cache) > PAGE_CACHE_SIZE:
+            self._page_cache.popitem(last=False)
+        return texture
+
+    def _prewarm_neighbours(self):
+        """Pré-renderiza a página anterior/seguinte (no máximo uma por frame)."""
+        for month in (self.current_month + 1, self.current_month - 1):
+            if 0 <= month <= 11 and month not in self._page_cache:
+                self._page_texture(month)
+                return
 
-            x = start_x + col * cell_width
-            y = start_y + row * cell_height
+    def create_day_buttons(self):
+        """Cria os botões representando os dias do mês atual."""
+        self.day_buttons.clear()
 
+        for day, x, y in self._day_cells(self.current_month):
             button = UIButton(
                 x, y,
-                day_image,
+                self.day_image,
                 text=str(day),
-                font=font, text_color=(0, 0, 0),
+                font=self.day_font, text_color=(0, 0, 0),
                 enable_fade=True,
                 fade_speed=8,
                 fade_color=(255, 255, 100),
@@ -139,15 +202,13 @@ class Calendar(AnimatedPopup):
                     self.transitioning = False
                     self.current_month = max(0, min(self.current_month + direction, 11))
                     self.current_surface = self.pages[self.current_month]
-                    self.month_title = render_text_with_outline(
-                        pygame.font.Font('fonts/LuckiestGuy-Regular.ttf', 38),
-                        self.month_names[self.current_month], (255, 255, 255), (0, 0, 0)
-                    )
+                    self.month_title = self._month_title(self.current_month)
                     self.create_day_buttons()
                     self.set_content_surface(self.current_surface)
                     self.current_rect = self.current_surface.get_rect(center=(self.screen_width // 2,
                                                                               self.screen_height // 2))
             else:
+                self._prewarm_neighbours()
                 self.go_back.update(dt)
                 self.prev_button.update(dt)
                 self.next_button.update(dt)
@@ -156,12 +217,15 @@ class Calendar(AnimatedPopup):
 
     def render(self, screen):
         """Renderiza o calendário e os botões de navegação e dias."""
-        screen.blit(self.bg_surface, (0, 0))
+        self.render_backdrop(screen)
         y = self.rect.top
 
         if self.transitioning:
-            screen.blit(self.current_surface, (self.current_rect.left, y))
-            screen.blit(self.next_surface, (self.next_rect.left, y))
+            # Desliza as texturas das páginas (sem widgets vivos)
+            center = self.screen_width // 2
+            next_month = self.current_month + self.transition_direction
+            screen.blit(self._page_texture(self.current_month), (self.current_rect.centerx - center, y))
+            screen.blit(self._page_texture(next_month), (self.next_rect.centerx - center, y))
         else:
             # Fundo do calendário
             screen.blit(self.current_surface, (self.rect.left, y))
@@ -192,12 +256,13 @@ class Calendar(AnimatedPopup):
         """Processa eventos de clique nos botões do calendário."""
         if self.animation_done and not self.closing and not self.transitioning:
             if event.type == pygame.MOUSEBUTTONDOWN:
-                if self.go_back.rect.collidepoint(event.pos):
-                    self.start_closing()
-                elif self.prev_button.rect.collidepoint(event.pos):
-                    self.start_transition(-1)
-                elif self.next_button.rect.collidepoint(event.pos):
-                    self.start_transition(1)
+                button = HIT_TEST.topmost(event.pos, among=self._nav_buttons)
+                if button is not None:
+                    direction = self._nav_buttons[button]
+                    if direction:
+                        self.start_transition(direction)
+                    else:
+                        self.start_closing()
 
             for button in (self.prev_button, self.next_button):
                 button.handle_event(event)
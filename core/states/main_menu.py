@@ -10,9 +10,11 @@ import pygame
 import math
 
 from settings import Settings
+from core.gui.layer_compositor import Layer, LayerCompositor, ScrollLayer
 from core.gui.ui_button import UIButton
 from core.states.restaurant_select import RestaurantSelect
 from utils.audio_manager import audio_manager
+from utils.input_state import HIT_TEST, INPUT
 
 
 class MenuButton(UIButton):
@@ -68,7 +70,7 @@ class MenuButton(UIButton):
                     self.y = self.target_y
                     self.appeared = True
 
-        self.fixed_rect.topleft = (self.x, self.y)
+        self.fixed_rect = pygame.Rect((self.x, self.y), self.fixed_rect.size)
         super().update(dt)
 
     def reverse_exit(self, dt):
@@ -129,12 +131,60 @@ class MainMenu:
             'settings': MenuButton('graphics/sprites/button_settings.png', 95, 331, delay=0.20),
             'quit': MenuButton('graphics/sprites/button_quit.png', 95, 412, delay=0.30),
         }
+        # Botão -> nome, para rotear o clique pelo HIT_TEST
+        self._button_names = {button: name for name, button in self.buttons.items()}
 
         # Cursor personalizado
         self.cursor_image = pygame.image.load(self.config.MOUSE['image'])
         self.cursor_image = pygame.transform.scale(self.cursor_image, (57, 40))
         pygame.mouse.set_visible(False)
 
+        # Respiração do chef: alturas escaladas guardadas (o seno repete poucas)
+        self._chef_frames = {}
+        self._build_layers()
+
+    def _build_layers(self):
+        """Monta a pilha de camadas da tela (de baixo para cima)."""
+        size = (self.config.SCREEN['width'], self.config.SCREEN['height'])
+        self.layers = LayerCompositor(size)
+
+        self.layers.add(ScrollLayer('sky', self.sky_image))
+        self.layers.add(Layer('backdrop', self.bg_image, static=True))
+        chef = self.layers.add(Layer('chef', self.chef_image))
+        self._chef_base = chef.surface
+
+        # Título e brilho compartilham a mesma surface convertida
+        title = self.layers.add(Layer('title', self.title_image, pos=(58, 10), alpha=0))
+        self.layers.add(Layer('title_flash', pos=(58, 10), alpha=0)).surface = title.surface
+
+        self.layers.add(Layer('buttons', draw=self._render_buttons))
+
+        # Fades de entrada/saída: uma única surface preta, só o alpha muda
+        black = pygame.Surface(size)
+        black.fill((0, 0, 0))
+        fade_in = self.layers.add(Layer('fade_in', black, alpha=self.fade_alpha))
+        self.layers.add(Layer('fade_out', alpha=0)).surface = fade_in.surface
+
+        # Créditos no rodapé (estáticos)
+        credit_font = pygame.font.Font(None, 20)
+        credit_text = credit_font.render("© 2025 Quantum Games · Criado por Luiz R. Dererita", True, (200, 200, 200))
+        credit_rect = credit_text.get_rect(center=(self.config.SCREEN["width"] // 2, self.config.SCREEN["height"] - 15))
+        self.layers.add(Layer('credits', credit_text, pos=credit_rect.topleft, static=True))
+
+    def _chef_frame(self, breath_scale):
+        """Chef escalado na vertical pela respiração (cache por altura)."""
+        height = int(self.chef_image.get_height() * breath_scale)
+        frame = self._chef_frames.get(height)
+        if frame is None:
+            frame = self._chef_frames[height] = pygame.transform.scale(
+                self._chef_base, (self.chef_image.get_width(), height)
+            )
+        return frame
+
+    def _render_buttons(self, screen):
+        for button in self.buttons.values():
+            button.render(screen)
+
     def update(self, dt):
         """
         Atualiza todos os elementos da tela do menu.
@@ -180,58 +230,33 @@ class MainMenu:
 
         :param screen: Surface principal do jogo onde será desenhado.
         """
-        # Fundo animado
-        screen.blit(self.sky_image, (self.sky_x, 0))
-        screen.blit(self.sky_image, (self.sky_x + self.sky_image.get_width(), 0))
-        screen.blit(self.bg_image, (0, 0))
+        layers = self.layers
+
+        # Céu em faixa contínua
+        layers.get('sky').offset = -self.sky_x
 
         # Chef com efeito de respiração
+        chef = layers.get('chef')
         breath_scale = 1 + 0.01 * math.sin(self.chef_breath * 2)
-        chef_scaled = pygame.transform.scale(
-            self.chef_image,
-            (self.chef_image.get_width(), int(self.chef_image.get_height() * breath_scale))
-        )
-        screen.blit(chef_scaled, (int(self.chef_x), self.chef_y))
+        chef.surface = self._chef_frame(breath_scale)
+        chef.pos = (int(self.chef_x), self.chef_y)
 
         # Título com fade e brilho branco
-        if self.title_alpha > 0:
-            title_copy = self.title_image.copy().convert_alpha()
-            title_copy.set_alpha(int(self.title_alpha))
-            screen.blit(title_copy, (58, 10))
+        layers.get('title').set_alpha(self.title_alpha)
+        flash_alpha = self.title_white_alpha if self.title_alpha >= 255 else 0
+        layers.get('title_flash').set_alpha(flash_alpha)
 
-        if self.title_alpha >= 255 and self.title_white_alpha > 0:
-            flash = self.title_image.copy().convert_alpha()
-            flash.fill((255, 255, 255, int(self.title_white_alpha)), special_flags=pygame.BLEND_RGBA_MULT)
-            screen.blit(flash, (58, 10))
+        # Fade-in inicial e fade final (saída)
+        layers.get('fade_in').set_alpha(self.fade_alpha)
+        layers.get('fade_out').set_alpha(self.exit_fade if self.exiting else 0)
 
-        # Botões
-        for button in self.buttons.values():
-            button.render(screen)
+        layers.render(screen)
 
-        # Fade-in inicial
-        if self.fade_alpha > 0:
-            fade_surface = pygame.Surface((self.config.SCREEN['width'], self.config.SCREEN['height']))
-            fade_surface.set_alpha(int(self.fade_alpha))
-            fade_surface.fill((0, 0, 0))
-            screen.blit(fade_surface, (0, 0))
-
-        # Fade final (saída)
-        if self.exiting and self.exit_fade > 0:
-            fade_surface = pygame.Surface((self.config.SCREEN['width'], self.config.SCREEN['height']))
-            fade_surface.set_alpha(int(self.exit_fade))
-            fade_surface.fill((0, 0, 0))
-            screen.blit(fade_surface, (0, 0))
-            if self.exit_fade >= 255:
-                self.game.change_state(RestaurantSelect(self.game))
-
-        # Créditos no rodapé
-        credit_font = pygame.font.Font(None, 20)
-        credit_text = credit_font.render("© 2025 Quantum Games · Criado por Luiz R. Dererita", True, (200, 200, 200))
-        credit_rect = credit_text.get_rect(center=(self.config.SCREEN["width"] // 2, self.config.SCREEN["height"] - 15))
-        screen.blit(credit_text, credit_rect)
+        if self.exiting and self.exit_fade >= 255:
+            self.game.change_state(RestaurantSelect(self.game))
 
         # Cursor do mouse customizado
-        screen.blit(self.cursor_image, pygame.mouse.get_pos())
+        screen.blit(self.cursor_image, INPUT.current.mouse_pos)
 
     def handle_event(self, event):
         """
@@ -240,7 +265,8 @@ class MainMenu:
         :param event: Evento capturado pelo Pygame.
         """
         if event.type == pygame.MOUSEBUTTONDOWN:
-            if self.buttons['play'].rect.collidepoint(event.pos):
+            button = HIT_TEST.topmost(event.pos, among=self._button_names)
+            if button is not None and self._button_names[button] == 'play':
                 self.exiting = True
 
             # Toca o efeito de clique dos botões
@@ -27,9 +27,11 @@ import pygame
 from settings import Settings
 from utils.functions import render_text_with_outline
 from core.effects.animated_popup import AnimatedPopup
+from core.gui.text_layout import TextBlock, split_first_line
 from core.gui.ui_button import UIButton
 from core.gui.ui_scrollbar import UIScrollbar
 from core.assets.dishes import INGREDIENTS
+from utils.input_state import HIT_TEST
 
 
 Color = Tuple[int, int, int]
@@ -162,7 +164,7 @@ class Menu(AnimatedPopup):
         self.scroll_offset = 0
         self.margin_x, self.margin_y = self.GRID_MARGIN
 
-        self.dishes: List["Dish"] = self.game.player_menu.owned_dishes()
+        self.dishes: Tuple["Dish", ...] = self.game.player_menu.owned_dishes()
 
         grid_card_bg = pygame.image.load("graphics/sprites/dish_card.png").convert_alpha()
         dish_font = pygame.font.Font(self.TITLE_FONT_PATH, 14)
@@ -201,6 +203,8 @@ class Menu(AnimatedPopup):
             hover_sound="hover",
         )
         self.dish_cards.append(self.add_recipe_card)
+        # card -> índice, para rotear cliques pelo índice de hit-test
+        self._card_index = {card: i for i, card in enumerate(self.dish_cards)}
 
         # Scrollbar da grade
         card_h = self.dish_cards[0].original_size[1] if self.dish_cards else 0
@@ -253,6 +257,8 @@ class Menu(AnimatedPopup):
 
         # prato atual exibido no painel (key)
         self._current_panel_key: Optional[str] = None
+        # (chave, TextBlock) da descrição exibida
+        self._desc_block = None
 
         # Botão de retorno
         back_img = pygame.image.load("graphics/sprites/go_back.png").convert_alpha()
@@ -275,22 +281,50 @@ class Menu(AnimatedPopup):
             return self.dishes[self.selected_index]
         return None
 
-    @staticmethod
-    def _wrap_text(text: str, font: pygame.font.Font, max_width: int) -> List[str]:
-        words = text.split()
-        lines: List[str] = []
-        cur = ""
-        for w in words:
-            test = (cur + " " + w).strip()
-            if font.size(test)[0] <= max_width:
-                cur = test
-            else:
-                if cur:
-                    lines.append(cur)
-                cur = w
-        if cur:
-            lines.append(cur)
-        return lines
+    def _description_block(self, dish: "Dish") -> TextBlock:
+        """Descrição + habilidades do prato, posicionadas uma vez (cache por prato/largura)."""
+        inner = self.ZONE_DESC.inflate(-self.DESC_PAD * 2, -self.DESC_PAD * 2)
+        reserved = self.desc_scroll.default_width + self.DESC_SCROLL_GUTTER
+        wrap_w = max(16, inner.width - reserved)
+        key = (dish.key, wrap_w)
+        if self._desc_block is not None and self._desc_block[0] == key:
+            return self._desc_block[1]
+
+        line_h = self.desc_font.get_linesize()
+        meta_h = self.meta_font.get_linesize()
+        block = TextBlock(inner.width)
+
+        # Descrição
+        block.paragraph(self.desc_font, dish.description, self.COLOR_TEXT_DESC, wrap_w)
+
+        # Habilidades
+        if dish.abilities:
+            block.advance(self.SEC_BEFORE_ABIL)
+            block.line(self.meta_font, "Habilidades:", self.COLOR_LABEL)
+            block.advance(meta_h)
+
+            for idx, ab in enumerate(dish.abilities):
+                label = block.line(self.meta_font, f"• {ab.label}:", self.COLOR_TEXT_MAIN)
+
+                after_label_gap = 6
+                first_wrap_w = max(16, wrap_w - label.width - after_label_gap)
+                first_line, remaining_text = split_first_line(ab.description, self.desc_font, first_wrap_w)
+
+                if first_line:
+                    first_y = block.y + (label.height - self.desc_font.get_height()) // 2
+                    block.line(self.desc_font, first_line, self.COLOR_TEXT_MAIN,
+                               x=label.width + after_label_gap, y=first_y)
+
+                block.advance(line_h)
+
+                if remaining_text:
+                    block.paragraph(self.desc_font, remaining_text, self.COLOR_TEXT_MAIN, wrap_w, x=16)
+
+                if idx < len(dish.abilities) - 1:
+                    block.advance(self.ABIL_BLOCK_GAP)
+
+        self._desc_block = (key, block)
+        return block
 
     @staticmethod
     def _recalc_scrollbar_geometry(sb: UIScrollbar, min_bar: int) -> None:
@@ -335,10 +369,10 @@ class Menu(AnimatedPopup):
             card.x = self.margin_x + col * (card.original_size[0] + self.GRID_CARD_GAP)
             card.y = self.margin_y + row * (card.original_size[1] + self.GRID_CARD_GAP)
 
-            # 1) atualiza animações/hover
-            card.update(dt)
-            # 2) só depois aplica offsets de surface e scroll — mantém fixed_rect em coordenadas de TELA
-            card.update_position(
+            # atualiza animações/hover já com os offsets de surface e scroll:
+            # fixed_rect sai direto em coordenadas de TELA (uma atribuição por frame)
+            card.update(
+                dt,
                 offset_x=self.GRID_OFFSET[0],
                 offset_y=self.GRID_OFFSET[1] - self.scroll_offset,
             )
@@ -359,28 +393,8 @@ class Menu(AnimatedPopup):
                 self.desc_scroll.bar_rect.y = self.desc_scroll.y
                 self.desc_offset = 0
 
-            inner_rect = self.ZONE_DESC.inflate(-self.DESC_PAD * 2, -self.DESC_PAD * 2)
-            reserved = self.desc_scroll.default_width + self.DESC_SCROLL_GUTTER
-            wrap_w = max(16, inner_rect.width - reserved)
-
-            line_h = self.desc_font.get_linesize()
-            meta_h = self.meta_font.get_linesize()
-
-            content_h = 0
-
-            lines_desc = self._wrap_text(dish.description, self.desc_font, wrap_w)
-            content_h += len(lines_desc) * line_h
-
-            abil_blocks = [
-                (ab.label, self._wrap_text(ab.description, self.desc_font, wrap_w))
-                for ab in dish.abilities
-            ]
-            if abil_blocks:
-                content_h += self.SEC_BEFORE_ABIL + meta_h
-                for idx, (_, block) in enumerate(abil_blocks):
-                    content_h += self.ABIL_LABEL_GAP + len(block) * line_h
-                    if idx < len(abil_blocks) - 1:
-                        content_h += self.ABIL_BLOCK_GAP
+            # altura real do bloco já posicionado (layout memorizado)
+            content_h = self._description_block(dish).height
 
             # folga no rodapé: evita "grudar" a última linha
             content_h += self.DESC_BOTTOM_PAD + self.DESC_BOTTOM_EXTRA
@@ -514,71 +528,10 @@ class Menu(AnimatedPopup):
 
     def _render_description_block(self, dish: "Dish") -> None:
         inner = self.ZONE_DESC.inflate(-self.DESC_PAD * 2, -self.DESC_PAD * 2)
-        reserved = self.desc_scroll.default_width + self.DESC_SCROLL_GUTTER
-        wrap_w = max(16, inner.width - reserved)
-        line_h = self.desc_font.get_linesize()
-        meta_h = self.meta_font.get_linesize()
-
-        visible_clip = pygame.Rect(inner.left, inner.top, max(0, inner.width), max(0, inner.height))
-        prev_clip = self.menu_surface.get_clip()
-        self.menu_surface.set_clip(visible_clip)
-
-        y_cursor = inner.top - self.desc_offset
-
-        # Descrição
-        lines_desc = self._wrap_text(dish.description, self.desc_font, wrap_w)
-        for ln in lines_desc:
-            surf = self.desc_font.render(ln, True, self.COLOR_TEXT_DESC)
-            self.menu_surface.blit(surf, (inner.left, y_cursor))
-            y_cursor += line_h
-
-        # Habilidades
-        if dish.abilities:
-            y_cursor += self.SEC_BEFORE_ABIL
-            label_ab = self.meta_font.render("Habilidades:", True, self.COLOR_LABEL)
-            self.menu_surface.blit(label_ab, (inner.left, y_cursor))
-            y_cursor += meta_h
-
-            for idx, ab in enumerate(dish.abilities):
-                label_surf = self.meta_font.render(f"• {ab.label}:", True, self.COLOR_TEXT_MAIN)
-                label_w = label_surf.get_width()
-                label_h = label_surf.get_height()
-                self.menu_surface.blit(label_surf, (inner.left, y_cursor))
+        visible = pygame.Rect(inner.left, inner.top, max(0, inner.width), max(0, inner.height))
 
-                after_label_gap = 6
-                first_wrap_w = max(16, wrap_w - label_w - after_label_gap)
-
-                words = ab.description.split()
-                first_line = ""
-                cut_idx = 0
-                for i, w in enumerate(words):
-                    test = (first_line + " " + w).strip()
-                    if self.desc_font.size(test)[0] <= first_wrap_w:
-                        first_line = test
-                    else:
-                        cut_idx = i
-                        break
-                else:
-                    cut_idx = len(words)
-
-                if first_line:
-                    first_desc_surf = self.desc_font.render(first_line, True, self.COLOR_TEXT_MAIN)
-                    first_y = y_cursor + (label_h - first_desc_surf.get_height()) // 2
-                    self.menu_surface.blit(first_desc_surf, (inner.left + label_w + after_label_gap, first_y))
-
-                y_cursor += line_h
-
-                remaining_text = " ".join(words[cut_idx:])
-                if remaining_text:
-                    for ln in self._wrap_text(remaining_text, self.desc_font, wrap_w):
-                        tx = self.desc_font.render(ln, True, self.COLOR_TEXT_MAIN)
-                        self.menu_surface.blit(tx, (inner.left + 16, y_cursor))
-                        y_cursor += line_h
-
-                if idx < len(dish.abilities) - 1:
-                    y_cursor += self.ABIL_BLOCK_GAP
-
-        self.menu_surface.set_clip(prev_clip)
+        # janela do bloco pré-composto na posição da rolagem: um único blit
+        self._description_block(dish).blit_window(self.menu_surface, visible, self.desc_offset)
         self.desc_scroll.render(self.menu_surface)
 
     def _render_stars_and_price(self, dish: "Dish") -> None:
@@ -606,42 +559,22 @@ class Menu(AnimatedPopup):
         if event.type == pygame.MOUSEBUTTONDOWN:
             mouse = event.pos
 
-            # Prioriza: hovered → selecionado → demais | dentro de cada grupo, do "topo" para baixo
-            indices = list(range(len(self.dish_cards)))
-            hovered_idxs = [i for i, c in enumerate(self.dish_cards) if c.hovered]
-            selected_idxs = (
-                [self.selected_index] if (self.selected_index is not None) else []
-            )
-            # remove duplicados preservando ordem
-            def uniq(seq):
-                seen = set()
-                out = []
-                for x in seq:
-                    if x not in seen:
-                        out.append(x)
-                        seen.add(x)
-                return out
-
-            base = uniq(hovered_idxs + selected_idxs + indices)
-            # Reverte para testar primeiro os últimos desenhados (maior chance de estarem “por cima”)
-            hit_order = list(reversed(base))
-
-            for i in hit_order:
-                card = self.dish_cards[i]
-                if card.fixed_rect.collidepoint(mouse):
-                    if not self._is_plus_index(i):
-                        self.selected_index = i
-                        # Atualiza estado "ativo" (rádio): só o selecionado fica ativo
-                        for j, c in enumerate(self.dish_cards):
-                            c.set_active(j == self.selected_index and not self._is_plus_index(j))
-                        # Reset da rolagem ao trocar o prato ativo
-                        self.desc_scroll.bar_rect.y = self.desc_scroll.y
-                        self.desc_offset = 0
-                    else:
-                        print("[Menu] Novo Prato: abrir tela de receitas (em breve).")
-                    break
-
-            if self.go_back.rect.collidepoint(mouse):
+            # Card mais alto sob o clique: hovered → selecionado (ativo) → último desenhado
+            card = HIT_TEST.topmost(mouse, among=self._card_index)
+            if card is not None:
+                i = self._card_index[card]
+                if not self._is_plus_index(i):
+                    self.selected_index = i
+                    # Atualiza estado "ativo" (rádio): só o selecionado fica ativo
+                    for j, c in enumerate(self.dish_cards):
+                        c.set_active(j == self.selected_index and not self._is_plus_index(j))
+                    # Reset da rolagem ao trocar o prato ativo
+                    self.desc_scroll.bar_rect.y = self.desc_scroll.y
+                    self.desc_offset = 0
+                else:
+                    print("[Menu] Novo Prato: abrir tela de receitas (em breve).")
+
+            if HIT_TEST.topmost(mouse, among=(self.go_back,)) is not None:
                 self.start_closing()
 
         self.scrollbar.handle_event(event)
@@ -10,13 +10,15 @@ import pygame
 import random
 
 from settings import Settings
-from utils.audio_manager import audio_manager
+from utils.input_state import HIT_TEST, INPUT
 from core.states.calendar import Calendar
 from core.states.menu import Menu
 from core.states.supermarket import Supermarket
 from core.gui.ui_button import UIButton
+from core.effects.animations import SCHEDULER
 from core.assets.customers import CommonCustomer, ImpatientCustomer, BossCustomer
 from core.assets.furniture import Table
+from core.assets.order_generator import OrderGenerator
 from core.assets.hud import Money, Clock
 
 
@@ -80,6 +82,23 @@ class PhaseService:
             table.chair_sprites = self.chair_sprites
             table.chairs = table._generate_chairs()
 
+        # Sorteio de pedidos (pondera tipo de cliente e respeita o estoque)
+        self.order_generator = OrderGenerator(
+            self.game.player_menu,
+            restaurant_getter=lambda: self.game.player.get_active_restaurant(),
+            # sem nada viável no estoque, o cliente ainda pede um prato
+            # desbloqueado; o pedido fica esperando ingredientes (start_preparing)
+            fallback_to_owned=True,
+        )
+
+        # Autosave a cada N horas do relógio do jogo
+        self._autosave_every = max(1, int(self.config.SAVE['autosave_every_hours']))
+        self._last_autosave_slot = None
+        # Fechamento do dia (resumo do estoque) quando o relógio chega ao fim
+        self._day_closed = False
+        # stock_version da última tentativa de preparo (None = tentar de novo)
+        self._orders_stock_version = None
+
         # Sistema de spawn de clientes
         self.customer_id = 1
         self.spawn_timer = 0
@@ -112,6 +131,9 @@ class PhaseService:
                                 hover_sound='hover', click_sound='click', enable_scale=True),
         }
 
+        # card -> nome, para rotear cliques pelo índice de hit-test
+        self._card_names = {card: name for name, card in self.cards.items()}
+
         # Flags de telas ativas (controla as janelas flutuantes)
         self.game.menu = None
         self.game.supermarket = None
@@ -120,6 +142,10 @@ class PhaseService:
         # fila para abrir um overlay assim que os cards terminarem de desaparecer
         self._pending_overlay = None  # tuple (name_str, factory_callable)
 
+        # Snapshot congelado do salão enquanto um overlay está aberto:
+        # (overlay, salão puro, salão já escurecido pelo fundo da popup)
+        self._frozen_bg = None
+
         # Deixa todos os botões invisíveis ANTES de qualquer render
         for card in self.cards.values():
             card.anim_scale = 0.75
@@ -135,9 +161,6 @@ class PhaseService:
         self.cursor_image = pygame.transform.scale(self.cursor_image, (57, 40))
         pygame.mouse.set_visible(False)
 
-        # Música de fundo
-        audio_manager.play_music("gameplay")
-
     def create_random_client(self, id):
         """
         Cria um cliente aleatório (comum, impaciente ou chefe).
@@ -149,7 +172,7 @@ class PhaseService:
             [CommonCustomer, ImpatientCustomer, BossCustomer],
             weights=[0.7, 0.25, 0.05]
         )[0]
-        return tipo(id, self.game.player_menu)
+        return tipo(id, self.game.player_menu, self.order_generator)
 
     def spawn_customer_group(self):
         """
@@ -162,6 +185,8 @@ class PhaseService:
         for table in self.tables:
             if table.is_available() and table.capacity >= group_size:
                 table.seat_customers(group)
+                # pedidos novos vão para a cozinha no próximo `_update_orders`
+                self._orders_stock_version = None
                 return
             
     def _ui_should_be_visible(self) -> bool:
@@ -212,6 +237,52 @@ class PhaseService:
         # dispara imediatamente o disappear dos cards
         self._sync_ui_visibility(force=True)
 
+    def _check_autosave(self):
+        """Dispara um autosave quando o relógio do jogo vira a hora."""
+        hours, _ = self.game.clock.time
+        slot = hours // self._autosave_every
+        if self._last_autosave_slot is None:
+            self._last_autosave_slot = slot
+        elif slot != self._last_autosave_slot:
+            self._last_autosave_slot = slot
+            self.game.request_autosave()
+
+    def _check_day_end(self):
+        """No fim do expediente, fecha o dia do restaurante (uma única vez)."""
+        clock = self.game.clock
+        if self._day_closed or clock.elapsed_time < clock.total_duration:
+            return
+        restaurant = self.game.player.get_active_restaurant() if self.game.player else None
+        if restaurant is None:
+            return
+        self._day_closed = True
+        restaurant.advance_day()
+        self.game.request_autosave()
+
+    def _update_orders(self, dt):
+        """
+        Cozinha: pedidos esperando tentam consumir o estoque e os em preparo
+        avançam. A nova tentativa só acontece quando chega pedido novo ou o
+        estoque muda (ex.: compra no Supermercado).
+        """
+        restaurant = self.game.player.get_active_restaurant() if self.game.player else None
+        stock_version = getattr(restaurant, "stock_version", None)
+        retry = restaurant is not None and stock_version != self._orders_stock_version
+        self._orders_stock_version = stock_version
+
+        for table in self.tables:
+            for customer in table.customers:
+                order = customer.order
+                if order.status == "waiting":
+                    if retry and customer.status == "waiting":
+                        order.start_preparing(restaurant)
+                else:
+                    order.update(dt)  # preparing -> ready
+
+    def on_exit(self):
+        """Ao sair da fase, libera a pausa do grupo "gameplay" (overlay aberto)."""
+        SCHEDULER.set_paused("gameplay", False)
+
     def update(self, dt):
         """
         Atualiza os elementos da fase de atendimento.
@@ -226,10 +297,13 @@ class PhaseService:
         #    - ou quando há overlay PENDENTE (durante o disappear dos cards)
         paused = (self._pending_overlay is not None) or (not self._ui_should_be_visible())
         dt_gameplay = 0.0 if paused else dt
+        SCHEDULER.set_paused("gameplay", paused)  # animações do salão (ex.: paciência)
 
         # 3) Gameplay só avança quando não está pausado
         if not paused:
             self.game.clock.update(dt_gameplay)
+            self._check_autosave()
+            self._check_day_end()
 
             # Lógica de aparição automática de clientes
             self.spawn_timer += dt_gameplay
@@ -239,6 +313,7 @@ class PhaseService:
 
             for table in self.tables:
                 table.update(dt_gameplay)
+            self._update_orders(dt_gameplay)
 
         # 4) Botões SEMPRE atualizam animação; input só quando não pausado
         for card in self.cards.values():
@@ -266,6 +341,28 @@ class PhaseService:
 
         :param screen: Surface principal onde tudo será desenhado.
         """
+        overlay = self._open_overlay()
+        if overlay is not None and self._all_cards_hidden():
+            # Salão parado sob o overlay: um único blit do snapshot
+            self._render_frozen_background(screen, overlay)
+        else:
+            self._frozen_bg = None
+            self._render_salon(screen)
+
+        # Renderiza sobreposições se estiverem ativas
+        if overlay is not None:
+            overlay.render(screen)
+
+        # Cursor customizado do mouse
+        mouse_pos = INPUT.current.mouse_pos
+        screen.blit(self.cursor_image, mouse_pos)
+
+    def _open_overlay(self):
+        """Overlay aberto no momento (menu, mercado ou calendário), se houver."""
+        return self.game.menu or self.game.supermarket or self.game.calendar
+
+    def _render_salon(self, screen):
+        """Desenha o salão: fundo, HUD, cards e mesas."""
         screen.blit(self.bg_image, (0, 0))
 
         paused = not self._ui_should_be_visible()
@@ -284,17 +381,36 @@ class PhaseService:
             for table in self.tables:
                 table.render(screen, self.font)
 
-        # Renderiza sobreposições se estiverem ativas
-        if self.game.menu:
-            self.game.menu.render(screen)
-        elif self.game.supermarket:
-            self.game.supermarket.render(screen)
-        elif self.game.calendar:
-            self.game.calendar.render(screen)
+    def _render_frozen_background(self, screen, overlay):
+        """
+        Desenha o salão congelado sob um overlay aberto.
 
-        # Cursor customizado do mouse
-        mouse_pos = pygame.mouse.get_pos()
-        screen.blit(self.cursor_image, mouse_pos)
+        Com o overlay aberto nada muda no salão (HUD e mesas ocultos, cards
+        sumidos), então ele é composto UMA vez numa surface. Depois que o
+        fade da popup termina, usa-se a versão já escurecida e a popup deixa
+        de blitar o próprio fundo: o frame custa um blit de tela cheia mais
+        o conteúdo da popup.
+
+        :param screen: Surface principal.
+        :param overlay: Popup aberta (AnimatedPopup).
+        """
+        if self._frozen_bg is None or self._frozen_bg[0] is not overlay:
+            salon = pygame.Surface(screen.get_size()).convert()
+            self._render_salon(salon)
+            self._frozen_bg = (overlay, salon, None)
+
+        _, salon, darkened = self._frozen_bg
+        if overlay.backdrop_settled:
+            if darkened is None:
+                darkened = salon.copy()
+                darkened.blit(overlay.bg_surface, (0, 0))
+                self._frozen_bg = (overlay, salon, darkened)
+            screen.blit(darkened, (0, 0))
+            overlay.backdrop_baked = True
+        else:
+            # fade de entrada/saída: salão puro + fundo da popup com alpha
+            screen.blit(salon, (0, 0))
+            overlay.backdrop_baked = False
 
     def handle_event(self, event):
         """
@@ -307,24 +423,26 @@ class PhaseService:
         if (not self.game.calendar and not self.game.menu and not self.game.supermarket
             and self._pending_overlay is None):
             if event.type == pygame.MOUSEBUTTONDOWN:
-                for card_name, card in self.cards.items():
-                    if card.rect.collidepoint(event.pos):
-                        if card_name == 'waiter':
-                            print("A tela de contratação de garçons foi aberta!")
-                        elif card_name == 'cook':
-                            print("A tela de contratação de cozinheiros foi aberta!")
-                        elif card_name == 'manager':
-                            print("A tela do RH foi aberta!")
-                        elif card_name == 'menu':
-                            # agenda abrir Menu após os cards sumirem
-                            self._request_open_overlay('menu', lambda: Menu(self.game))
-                        elif card_name == 'market':
-                            self._request_open_overlay('supermarket', lambda: Supermarket(self.game))
-                        elif card_name == 'calendar':
-                            self._request_open_overlay('calendar', lambda: Calendar(self.game))
-
-                        # Som de clique do botão
-                        card.handle_event(event)
+                # card sob o clique, resolvido pelo índice de hit-test
+                card = HIT_TEST.topmost(event.pos, among=self._card_names)
+                if card is not None:
+                    card_name = self._card_names[card]
+                    if card_name == 'waiter':
+                        print("A tela de contratação de garçons foi aberta!")
+                    elif card_name == 'cook':
+                        print("A tela de contratação de cozinheiros foi aberta!")
+                    elif card_name == 'manager':
+                        print("A tela do RH foi aberta!")
+                    elif card_name == 'menu':
+                        # agenda abrir Menu após os cards sumirem
+                        self._request_open_overlay('menu', lambda: Menu(self.game))
+                    elif card_name == 'market':
+                        self._request_open_overlay('supermarket', lambda: Supermarket(self.game))
+                    elif card_name == 'calendar':
+                        self._request_open_overlay('calendar', lambda: Calendar(self.game))
+
+                    # Som de clique do botão
+                    card.handle_event(event)
 
         # Encaminha os eventos para janelas abertas
         if self.game.menu:
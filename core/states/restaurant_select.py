@@ -10,6 +10,8 @@ from settings import Settings
 from core.gui.ui_button import UIButton
 from core.states.tutorial import Tutorial
 from core.assets.player import Player  # Player gerencia múltiplos restaurantes
+from core.assets.slot_index import SlotSummary
+from utils.input_state import HIT_TEST, INPUT
 
 
 # -------------------- helpers visuais --------------------
@@ -87,8 +89,12 @@ class RestaurantCard(UIButton):
     - Hover sutil (max_scale baixo);
     - Título do card preenchido ("Meu Restaurante") no MESMO estilo do "Slot vazio"
       (contorno preto + fill semelhante à cor de fundo do card).
+    - Conteúdo composto uma vez por (tipo, dados); hover/appear só escalam a base.
     """
 
+    # Nº máximo de variantes escaladas guardadas (appear passa por várias)
+    FRAME_CACHE_SIZE = 24
+
     def __init__(
         self, x, y, bg_image, *,
         slot_index: int,
@@ -123,6 +129,11 @@ class RestaurantCard(UIButton):
         # cor do texto do slot vazio e do título preenchido, próxima ao fundo do card (tom amadeirado)
         self._wood_tone = (92, 64, 44)
 
+        # Cache de render: base no tamanho natural + variantes escaladas
+        self._base_key = None
+        self._base = None
+        self._frames = {}
+
     # ---------- helpers de layout ----------
     def _metrics(self, scaled_size: tuple[int, int]):
         """Calcula medidas proporcionais ao tamanho ATUAL do card."""
@@ -151,22 +162,19 @@ class RestaurantCard(UIButton):
         self.kind = "empty"
         self.data = {}
 
-    def render(self, screen):
-        """Desenha o card + conteúdo (nome, dia, dinheiro, estrelas...)."""
-        if self.anim_alpha <= 0.01:
-            return
-
-        eff_scale = self.anim_scale * self.current_scale
-        scaled_size = (int(self.original_size[0] * eff_scale), int(self.original_size[1] * eff_scale))
-        draw_x = self.x + self.original_size[0] // 2 - scaled_size[0] // 2
-        draw_y = self.y + self.original_size[1] // 2 - scaled_size[1] // 2
+    def _content_key(self):
+        """Identifica o conteúdo desenhado (tipo + dados do slot + imagem base)."""
+        base_image = self.hover_image if (self.hovered and self.hover_image) else self.bg_image
+        return self.kind, tuple(sorted(self.data.items())), id(base_image)
 
-        # compõe em surface própria para aplicar alpha global
-        composed = pygame.Surface(scaled_size, pygame.SRCALPHA)
+    def _build_base(self) -> pygame.Surface:
+        """Compõe o card no tamanho natural: fundo + conteúdo (nome, dia, dinheiro, estrelas...)."""
+        size = self.original_size
+        composed = pygame.Surface(size, pygame.SRCALPHA)
         base_image = self.hover_image if (self.hovered and self.hover_image) else self.bg_image
-        composed.blit(pygame.transform.smoothscale(base_image, scaled_size), (0, 0))
+        composed.blit(base_image, (0, 0))
 
-        inner, content_scale, star_r, gap = self._metrics(scaled_size)
+        inner, content_scale, star_r, gap = self._metrics(size)
 
         if self.kind == "filled":
             # TÍTULO no mesmo estilo do "Slot vazio": contorno preto + fill em tom amadeirado
@@ -206,12 +214,48 @@ class RestaurantCard(UIButton):
             t1 = self._render_text_scaled(t1, content_scale)
             t2 = self._render_text_scaled(t2, content_scale)
 
-            composed.blit(t1, t1.get_rect(center=(scaled_size[0] // 2, scaled_size[1] // 2 - int(gap * 0.4))))
-            composed.blit(t2, t2.get_rect(center=(scaled_size[0] // 2, scaled_size[1] // 2 + int(gap * 0.9))))
+            composed.blit(t1, t1.get_rect(center=(size[0] // 2, size[1] // 2 - int(gap * 0.4))))
+            composed.blit(t2, t2.get_rect(center=(size[0] // 2, size[1] // 2 + int(gap * 0.9))))
+
+        return composed
+
+    def _frame(self, scaled_size: tuple[int, int]) -> pygame.Surface:
+        """
+        Card pronto no tamanho pedido.
+
+        O conteúdo é composto uma vez por (tipo, dados); hover e appear só
+        escalam essa base, e cada tamanho escalado fica guardado — parado, o
+        card não gera nenhuma surface nova.
+        """
+        key = self._content_key()
+        if key != self._base_key:
+            self._base_key = key
+            self._base = self._build_base()
+            self._frames = {}
+
+        if scaled_size == self.original_size:
+            return self._base
+        frame = self._frames.get(scaled_size)
+        if frame is None:
+            if len(self._frames) >= self.FRAME_CACHE_SIZE:
+                self._frames.clear()
+            frame = self._frames[scaled_size] = pygame.transform.smoothscale(self._base, scaled_size)
+        return frame
+
+    def render(self, screen):
+        """Desenha o card + conteúdo a partir da base cacheada."""
+        if self.anim_alpha <= 0.01:
+            return
+
+        eff_scale = self.anim_scale * self.current_scale
+        scaled_size = (int(self.original_size[0] * eff_scale), int(self.original_size[1] * eff_scale))
+        draw_x = self.x + self.original_size[0] // 2 - scaled_size[0] // 2
+        draw_y = self.y + self.original_size[1] // 2 - scaled_size[1] // 2
 
-        if self.anim_alpha < 1.0:
-            composed.set_alpha(int(255 * self.anim_alpha))
-        screen.blit(composed, (draw_x, draw_y))
+        frame = self._frame(scaled_size)
+        # a surface é compartilhada entre frames: o alpha global é sempre redefinido
+        frame.set_alpha(int(255 * self.anim_alpha) if self.anim_alpha < 1.0 else 255)
+        screen.blit(frame, (draw_x, draw_y))
 
 
 # -------------------- Tela --------------------
@@ -224,6 +268,7 @@ class RestaurantSelect:
         self.config = Settings()
         self.mode = "select"
         self.selected_slot = None
+        self._slot_cache = None  # (chave da origem, [SlotSummary])
 
         # --------- fontes (mockup) ----------
         self.title_font = _load_font_chain(
@@ -288,6 +333,8 @@ class RestaurantSelect:
                 scale_speed=10.0
             )
             self.cards.append(card)
+        # card -> índice do slot, para rotear o clique pelo HIT_TEST
+        self._card_slots = {card: i for i, card in enumerate(self.cards)}
 
         # --------- formulário (modo create) – mantido como está ---------
         form_w, form_h = 740, 300
@@ -317,10 +364,12 @@ class RestaurantSelect:
                                    text="Criar", font=self.small_font)
         self.btn_cancel = UIButton(self.form_rect.centerx - 200, self.form_rect.bottom + 46, btn_img_small,
                                    text="Cancelar", font=self.small_font)
+        self._form_buttons = {self.btn_cancel: "cancel", self.btn_create: "create"}
 
     # ---------- helpers de dados ----------
     def _ensure_player(self):
-        if not hasattr(self.game, "player") or self.game.player is None:
+        # com save em disco, carrega o jogador salvo; só cria um novo sem save
+        if self._player() is None:
             self.game.player = Player(nickname="Player", restaurant_name="Meu Restaurante")
             if self.inputs["player_name"]["text"]:
                 self.game.player.nickname = self.inputs["player_name"]["text"]
@@ -328,11 +377,31 @@ class RestaurantSelect:
                 self.game.player.restaurants[0].name = self.inputs["restaurant_name"]["text"]
 
     def _player(self):
+        # save existente ainda não carregado: carrega agora (slot escolhido/criação)
+        if getattr(self.game, "player", None) is None and getattr(self.game, "slot_index", None):
+            self.game.load_player()
         return getattr(self.game, "player", None)
 
-    def _restaurants(self):
-        p = self._player()
-        return p.restaurants if p else []
+    def _slots(self):
+        """
+        Resumos dos slots: do jogador em memória ou do índice em disco.
+
+        Refeitos só quando a origem muda (outro jogador/índice ou nº de
+        restaurantes); criação e troca de slot invalidam com `_slots_dirty`.
+        """
+        p = getattr(self.game, "player", None)
+        index = getattr(self.game, "slot_index", None)
+        key = (id(p), len(p.restaurants)) if p is not None else (None, id(index))
+        if self._slot_cache is None or self._slot_cache[0] != key:
+            if p is not None:
+                slots = [SlotSummary.from_restaurant(r) for r in p.restaurants]
+            else:
+                slots = list(index.slots) if index else []
+            self._slot_cache = (key, slots)
+        return self._slot_cache[1]
+
+    def _slots_dirty(self):
+        self._slot_cache = None
 
     def _active_restaurant_id(self):
         p = self._player()
@@ -342,6 +411,7 @@ class RestaurantSelect:
         p = self._player()
         if p:
             p.switch_restaurant(restaurant_id)
+            self._slots_dirty()
 
     def _create_restaurant_from_form(self):
         nickname = self.inputs["player_name"]["text"].strip() or "Player"
@@ -352,7 +422,9 @@ class RestaurantSelect:
             self.game.player = Player(nickname=nickname, restaurant_name=rname)
             new_restaurant = self.game.player.get_active_restaurant()
         else:
-            self._player().nickname = nickname
+            # campo vazio não sobrescreve o apelido do save
+            if self.inputs["player_name"]["text"].strip():
+                self._player().nickname = nickname
             self._player().add_restaurant(rname)
             new_restaurant = self._player().get_active_restaurant()
 
@@ -363,6 +435,9 @@ class RestaurantSelect:
 
         self.mode = "select"
         self.selected_slot = None
+        self._slots_dirty()
+        if hasattr(self.game, "request_autosave"):
+            self.game.request_autosave()
 
     # ---------- ciclo ----------
     def update(self, dt):
@@ -402,23 +477,16 @@ class RestaurantSelect:
             self._render_form(screen)
 
         # cursor
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = INPUT.current.mouse_pos
         screen.blit(self.cursor_image, mouse_pos)
 
     def _render_slots(self, screen):
-        """Preenche cada card com dados do player e renderiza."""
-        restaurants = self._restaurants()
+        """Preenche cada card com o resumo do slot (sem carregar o save completo)."""
+        slots = self._slots()
 
         for i, card in enumerate(self.cards):
-            if i < len(restaurants):
-                r = restaurants[i]
-                data = {
-                    "name": r.name,
-                    "day": getattr(r, "day", 1),
-                    "money": getattr(r, "money", 0.0),
-                    "level": getattr(r, "level", getattr(r, "rating", 0))  # aceita level ou rating
-                }
-                card.set_filled(data)
+            if i < len(slots):
+                card.set_filled(slots[i].card_data())
             else:
                 card.set_empty()
             card.render(screen)
@@ -468,25 +536,27 @@ class RestaurantSelect:
                 return
 
             if self.mode == "select":
-                # detecção por rect do botão (pós-escala)
-                for idx, card in enumerate(self.cards):
-                    if card.rect.collidepoint((mx, my)):
-                        p = self._player()
-                        if p and idx < len(p.restaurants):
-                            # Slot ocupado: selecionar e seguir
-                            self._switch_active(p.restaurants[idx].restaurant_id)
-                            self.game.change_state(Tutorial(self.game))
-                        else:
-                            # Slot vazio: abrir formulário
-                            self.mode = "create"
-                            self.selected_slot = idx
-                            if not self.inputs["player_name"]["text"]:
-                                self.inputs["player_name"]["text"] = "Player"
-                            if not self.inputs["restaurant_name"]["text"]:
-                                self.inputs["restaurant_name"]["text"] = f"Restaurante {idx + 1}"
-                        # Som de clique do botão (reaproveita UIButton)
-                        card.handle_event(event)
-                        return
+                # card sob o clique, resolvido pelo índice de hit-test
+                card = HIT_TEST.topmost(event.pos, among=self._card_slots)
+                if card is not None:
+                    idx = self._card_slots[card]
+                    slots = self._slots()
+                    if idx < len(slots):
+                        # Slot ocupado: carrega o save (se preciso), seleciona e segue
+                        self._player()
+                        self._switch_active(slots[idx].restaurant_id)
+                        self.game.change_state(Tutorial(self.game))
+                    else:
+                        # Slot vazio: abrir formulário
+                        self.mode = "create"
+                        self.selected_slot = idx
+                        if not self.inputs["player_name"]["text"]:
+                            self.inputs["player_name"]["text"] = "Player"
+                        if not self.inputs["restaurant_name"]["text"]:
+                            self.inputs["restaurant_name"]["text"] = f"Restaurante {idx + 1}"
+                    # Som de clique do botão (reaproveita UIButton)
+                    card.handle_event(event)
+                    return
 
             elif self.mode == "create":
                 # focos
@@ -503,13 +573,15 @@ class RestaurantSelect:
                         self.diff_index = i
                         break
 
-                # botões
-                if self.btn_cancel.rect.collidepoint((mx, my)):
+                # botões (campos e dificuldade acima são retângulos fixos, não widgets)
+                button = HIT_TEST.topmost(event.pos, among=self._form_buttons)
+                action = self._form_buttons.get(button)
+                if action == "cancel":
                     self.mode = "select"
                     self.selected_slot = None
                     return
 
-                if self.btn_create.rect.collidepoint((mx, my)):
+                if action == "create":
                     self._ensure_player()
                     self._create_restaurant_from_form()
                     return
@@ -11,6 +11,10 @@ Refatorado para manter estética e layout compatíveis com a tela de Cardápio:
 - Mesma paleta de cores e tipografia
 - Zonas de layout espelhando o cardápio (lista à esquerda, preview e descrição à direita)
 - Scrollbar e espaçamentos alinhados
+
+Desempenho:
+- Lista virtualizada: só os cards dentro da área visível são desenhados
+- Cada card cacheia sua parte estática; a quantidade só é re-renderizada quando muda
 """
 
 from __future__ import annotations
@@ -21,31 +25,19 @@ import pygame
 
 from settings import Settings
 from core.effects.animated_popup import AnimatedPopup
+from core.gui.digit_atlas import get_atlas
+from core.gui.text_layout import TextBlock
 from core.gui.ui_button import UIButton
 from core.gui.ui_scrollbar import UIScrollbar
+from core.assets.menu_query import MENU_QUERY
+from utils.input_state import HIT_TEST
+from utils.spatial_hash import SpatialHash
 from utils.functions import render_text_with_outline
 
 
 Color = Tuple[int, int, int]
 
 
-# ---------- util: quebra de linha simples ----------
-def wrap_text(text: str, font: pygame.font.Font, max_width: int) -> List[str]:
-    """Quebra de linha ingênua baseada na largura do texto renderizado."""
-    lines, line = [], ""
-    for w in text.split():
-        t = (line + " " + w).strip()
-        if font.size(t)[0] <= max_width:
-            line = t
-        else:
-            if line:
-                lines.append(line)
-            line = w
-    if line:
-        lines.append(line)
-    return lines
-
-
 class IngredientCard:
     """Carta de ingrediente (ícone à esquerda, infos e controles à direita)."""
 
@@ -82,17 +74,40 @@ class IngredientCard:
         self.original_size = bg_image.get_size()
         self.rect = pygame.Rect(x, y, *self.original_size)
 
-        # rects interativos (coords locais da list_surface)
-        self.minus_rect = pygame.Rect(0, 0, 0, 0)
-        self.plus_rect = pygame.Rect(0, 0, 0, 0)
-        self.draw_rect = pygame.Rect(0, 0, *self.original_size)
-
         # layout interno
         self.pad = 10
         self.gap_x = 10
         self.ctrl_w = 140
         self.ctrl_h = 40
 
+        # rects dos controles em coords LOCAIS do card (calculados uma única vez)
+        self._build_layout()
+
+        # rects interativos (coords locais da list_surface)
+        self.minus_rect = pygame.Rect(0, 0, 0, 0)
+        self.plus_rect = pygame.Rect(0, 0, 0, 0)
+        self.draw_rect = pygame.Rect(0, 0, *self.original_size)
+
+        # caches de render: parte estática montada sob demanda (só quando o card
+        # entra na área visível) e texto da quantidade refeito só quando muda
+        self._static_surf: Optional[pygame.Surface] = None
+        self._qty_surf: Optional[pygame.Surface] = None
+        self._qty_cached: Optional[int] = None
+
+    def _build_layout(self) -> None:
+        """Calcula os rects locais de [-] [qty] [+] relativos ao topo-esquerdo do card."""
+        bg_w, bg_h = self.original_size
+        self.text_x = bg_w + self.gap_x
+        ctrl_x = self.text_x + 175
+        ctrl_y = (bg_h - self.ctrl_h) // 2
+        self.ctrl_local = pygame.Rect(ctrl_x, ctrl_y, self.ctrl_w, self.ctrl_h)
+
+        btn_w = 40
+        qty_w = self.ctrl_w - (btn_w * 2)
+        self.minus_local = pygame.Rect(ctrl_x, ctrl_y, btn_w, self.ctrl_h)
+        self.qty_local = pygame.Rect(ctrl_x + btn_w, ctrl_y, qty_w, self.ctrl_h)
+        self.plus_local = pygame.Rect(ctrl_x + btn_w + qty_w, ctrl_y, btn_w, self.ctrl_h)
+
     def update_position(self, x: int, y: int) -> None:
         self.x = x
         self.y = y
@@ -102,76 +117,73 @@ class IngredientCard:
     def _fmt_price(v: float) -> str:
         return f"Preço: {v:.2f}".replace(".", ",")
 
-    def draw(self, surface: pygame.Surface, scroll_offset: int = 0) -> None:
-        draw_x = self.x
-        draw_y = self.y - scroll_offset
-
-        # BG do card
-        surface.blit(self.bg_image, (draw_x, draw_y))
-
-        # Ícone centralizado no BG
-        bg_w, bg_h = self.bg_image.get_size()
-        icon_w, icon_h = self.icon_image.get_size()
-        icon_x = draw_x + (bg_w - icon_w) // 2
-        icon_y = draw_y + (bg_h - icon_h) // 2
-        surface.blit(self.icon_image, (icon_x, icon_y))
-
-        # Infos à direita do BG
-        text_start_x = draw_x + self.original_size[0] + self.gap_x
-        text_area_top = draw_y + self.pad
-
+    def _build_static_surface(self) -> pygame.Surface:
+        """
+        Monta numa única surface tudo que não muda entre frames:
+        fundo, ícone, nome, preço e a moldura dos controles (sem a quantidade).
+        """
         name_surf = self.name_font.render(self.name, True, self.COLOR_TEXT_MAIN)
-        surface.blit(name_surf, (text_start_x, text_area_top))
-
         price_surf = self.price_font.render(
             self._fmt_price(self.price), True, self.COLOR_TEXT_SUB
         )
-        surface.blit(
-            price_surf, (text_start_x, text_area_top + name_surf.get_height() + 6)
-        )
+        price_y = self.pad + name_surf.get_height() + 6
 
-        # Controles quantidade ([-] [qty] [+])
-        ctrl_x = text_start_x + 175
-        ctrl_y = draw_y + (self.original_size[1] - self.ctrl_h) // 2
-        ctrl_rect = pygame.Rect(ctrl_x, ctrl_y, self.ctrl_w, self.ctrl_h)
+        bg_w, bg_h = self.original_size
+        width = max(self.ctrl_local.right, self.text_x + name_surf.get_width())
+        height = max(bg_h, price_y + price_surf.get_height(), self.ctrl_local.bottom)
+        surf = pygame.Surface((width, height), pygame.SRCALPHA)
 
-        pygame.draw.rect(surface, self.COLOR_BOX, ctrl_rect, border_radius=10)
-        pygame.draw.rect(
-            surface, self.COLOR_BOX_DARK, ctrl_rect, width=2, border_radius=10
-        )
+        # BG do card + ícone centralizado
+        surf.blit(self.bg_image, (0, 0))
+        icon_w, icon_h = self.icon_image.get_size()
+        surf.blit(self.icon_image, ((bg_w - icon_w) // 2, (bg_h - icon_h) // 2))
 
-        btn_w = 40
-        qty_w = self.ctrl_w - (btn_w * 2)
-        minus_rect = pygame.Rect(ctrl_rect.x, ctrl_rect.y, btn_w, self.ctrl_h)
-        qty_rect = pygame.Rect(ctrl_rect.x + btn_w, ctrl_rect.y, qty_w, self.ctrl_h)
-        plus_rect = pygame.Rect(
-            ctrl_rect.x + btn_w + qty_w, ctrl_rect.y, btn_w, self.ctrl_h
-        )
+        # Infos à direita do BG
+        surf.blit(name_surf, (self.text_x, self.pad))
+        surf.blit(price_surf, (self.text_x, price_y))
 
-        pygame.draw.rect(surface, self.COLOR_BTN, minus_rect, border_radius=8)
-        pygame.draw.rect(
-            surface, self.COLOR_BTN_DARK, minus_rect, width=2, border_radius=8
-        )
-        pygame.draw.rect(surface, self.COLOR_BTN, plus_rect, border_radius=8)
-        pygame.draw.rect(
-            surface, self.COLOR_BTN_DARK, plus_rect, width=2, border_radius=8
-        )
+        # Controles quantidade ([-] [qty] [+])
+        pygame.draw.rect(surf, self.COLOR_BOX, self.ctrl_local, border_radius=10)
+        pygame.draw.rect(surf, self.COLOR_BOX_DARK, self.ctrl_local, width=2, border_radius=10)
+        for r in (self.minus_local, self.plus_local):
+            pygame.draw.rect(surf, self.COLOR_BTN, r, border_radius=8)
+            pygame.draw.rect(surf, self.COLOR_BTN_DARK, r, width=2, border_radius=8)
+        pygame.draw.rect(surf, self.COLOR_BOX, self.qty_local, border_radius=8)
+        pygame.draw.rect(surf, self.COLOR_BOX_DARK, self.qty_local, width=2, border_radius=8)
+
+        atlas = get_atlas(self.name_font, self.COLOR_TEXT_MAIN)
+        atlas.blit(surf, "−", self.minus_local.center, anchor="center")
+        atlas.blit(surf, "+", self.plus_local.center, anchor="center")
+        return surf
+
+    def _quantity_surface(self) -> pygame.Surface:
+        """Texto da quantidade; recomposto pelo atlas só quando `quantity` muda."""
+        if self._qty_surf is None or self._qty_cached != self.quantity:
+            self._qty_surf = get_atlas(self.name_font, self.COLOR_TEXT_MAIN).render(str(self.quantity))
+            self._qty_cached = self.quantity
+        return self._qty_surf
+
+    def release_cache(self) -> None:
+        """Descarta as surfaces cacheadas (recriadas no próximo draw)."""
+        self._static_surf = None
+        self._qty_surf = None
+        self._qty_cached = None
+
+    def draw(self, surface: pygame.Surface, scroll_offset: int = 0) -> None:
+        draw_x = self.x
+        draw_y = self.y - scroll_offset
 
-        minus_sign = self.name_font.render("−", True, self.COLOR_TEXT_MAIN)
-        plus_sign = self.name_font.render("+", True, self.COLOR_TEXT_MAIN)
-        surface.blit(minus_sign, minus_sign.get_rect(center=minus_rect.center))
-        surface.blit(plus_sign, plus_sign.get_rect(center=plus_rect.center))
+        if self._static_surf is None:
+            self._static_surf = self._build_static_surface()
+        surface.blit(self._static_surf, (draw_x, draw_y))
 
-        qty_text = self.name_font.render(str(self.quantity), True, self.COLOR_TEXT_MAIN)
-        pygame.draw.rect(surface, self.COLOR_BOX, qty_rect, border_radius=8)
-        pygame.draw.rect(
-            surface, self.COLOR_BOX_DARK, qty_rect, width=2, border_radius=8
-        )
+        qty_text = self._quantity_surface()
+        qty_rect = self.qty_local.move(draw_x, draw_y)
         surface.blit(qty_text, qty_text.get_rect(center=qty_rect.center))
 
         # atualiza rects interativos
-        self.minus_rect = minus_rect
-        self.plus_rect = plus_rect
+        self.minus_rect = self.minus_local.move(draw_x, draw_y)
+        self.plus_rect = self.plus_local.move(draw_x, draw_y)
         self.draw_rect = pygame.Rect(
             draw_x, draw_y, self.original_size[0], self.original_size[1]
         )
@@ -220,6 +232,10 @@ class Supermarket(AnimatedPopup):
     DESC_BOTTOM_PAD = 10
     DESC_BOTTOM_EXTRA = 12  # folga para não “grudar” no fim
 
+    # Lista virtualizada: só os cards visíveis são desenhados; os caches de
+    # surface são mantidos apenas numa janela de +/- N linhas ao redor deles
+    LIST_CACHE_MARGIN = 4
+
     # -------------------- ZONAS DE LAYOUT (espelha o cardápio) -------------------- #
     # Lista (coluna à esquerda)
     LIST_ZONE = pygame.Rect(142, 98, 390, 380)  # mesma área visível do cardápio
@@ -272,6 +288,7 @@ class Supermarket(AnimatedPopup):
         self.name_font = pygame.font.Font("fonts/LuckiestGuy-Regular.ttf", 28)
         self.price_font = pygame.font.Font("fonts/LuckiestGuy-Regular.ttf", 22)
         self.ui_font = pygame.font.Font("fonts/LuckiestGuy-Regular.ttf", 30)
+        self._totals_cache = None  # ((texto total, texto dinheiro), (surfaces))
         self.ui_small = pygame.font.Font("fonts/LuckiestGuy-Regular.ttf", 24)
 
         # ---------- Itens da lista ----------
@@ -319,6 +336,7 @@ class Supermarket(AnimatedPopup):
             for i, icon in enumerate(icons)
         ]
         self.selected_index = 0
+        self._desc_text = None  # ((índice, restaurante, stock_version), texto)
 
         # ---------- Scroll da lista ----------
         _, card_h = self.card_bg.get_size()
@@ -346,6 +364,11 @@ class Supermarket(AnimatedPopup):
             bg_color=self.SCROLLBAR_BG,
         )
         self.scroll_offset = 0
+        self._row_h = card_h + self.item_gap
+        self._cached_range: Tuple[int, int] = (0, 0)
+        # Hit-test da lista (coords da list_surface): (índice, parte) -> rect;
+        # os controles [-]/[+] ficam numa camada acima do corpo do card
+        self._list_hits = SpatialHash(cell_size=64)
 
         # ---------- Scroll da descrição do preview ----------
         inner_h = max(0, self.PREVIEW_DESC_ZONE.height - self.DESC_PAD * 2)
@@ -361,6 +384,8 @@ class Supermarket(AnimatedPopup):
             bg_color=self.SCROLLBAR_BG,
         )
         self.desc_offset = 0
+        # (chave, TextBlock) da descrição do preview
+        self._desc_block = None
 
         # ---------- Botões ----------
         button_image = pygame.image.load("graphics/sprites/go_back.png").convert_alpha()
@@ -393,6 +418,17 @@ class Supermarket(AnimatedPopup):
     def _money_fmt(v: float) -> str:
         return f"{v:.2f}".replace(".", ",")
 
+    def _totals_surfaces(self) -> Tuple[pygame.Surface, pygame.Surface]:
+        """Rótulos de total/dinheiro; recompostos pelo atlas só quando os valores mudam."""
+        texts = (
+            f"Total: {self._money_fmt(self.get_total_value())}",
+            f"Dinheiro: {self._money_fmt(self.get_remaining_money())}",
+        )
+        if self._totals_cache is None or self._totals_cache[0] != texts:
+            atlas = get_atlas(self.ui_font, self.COLOR_TEXT_MAIN)
+            self._totals_cache = (texts, (atlas.render(texts[0]), atlas.render(texts[1])))
+        return self._totals_cache[1]
+
     def get_total_value(self) -> float:
         return sum(card.quantity * card.price for card in self.ingredient_cards)
 
@@ -411,15 +447,59 @@ class Supermarket(AnimatedPopup):
             card.update_position(x, y)
             y += card_h + self.item_gap
 
-    def _update_desc_scroll_geometry(self, text: str) -> None:
-        """Recalcula a altura de conteúdo da descrição para o scrollbar do preview."""
+    def _visible_range(self) -> Tuple[int, int]:
+        """
+        Índices [first, last) dos cards que intersectam a área visível da lista.
+        Como todos os cards têm a mesma altura, é O(1) a partir do scroll.
+        """
+        n = len(self.ingredient_cards)
+        if n == 0 or self._row_h <= 0:
+            return 0, 0
+        top = self.scroll_offset - self.margin_top
+        bottom = top + self.LIST_ZONE.height
+        first = max(0, top // self._row_h)
+        last = min(n, bottom // self._row_h + 1)
+        return first, max(first, last)
+
+    def _recycle_card_caches(self, first: int, last: int) -> None:
+        """Libera as surfaces de cards que saíram da janela de cache."""
+        lo = max(0, first - self.LIST_CACHE_MARGIN)
+        hi = min(len(self.ingredient_cards), last + self.LIST_CACHE_MARGIN)
+        old_lo, old_hi = self._cached_range
+        for i in range(old_lo, old_hi):
+            if i < lo or i >= hi:
+                self.ingredient_cards[i].release_cache()
+        self._cached_range = (lo, hi)
+
+    def _index_card(self, i: int, card: IngredientCard) -> None:
+        """Atualiza no índice da lista os rects desenhados do card `i`."""
+        for part, rect, layer in (
+            ("card", card.draw_rect, 0),
+            ("minus", card.minus_rect, 1),
+            ("plus", card.plus_rect, 1),
+        ):
+            key = (i, part)
+            if key in self._list_hits:
+                self._list_hits.move(key, rect)
+            else:
+                self._list_hits.insert(key, rect, layer)
+
+    def _desc_block_for(self, text: str) -> TextBlock:
+        """Descrição do preview quebrada e composta uma vez (cache por texto/largura)."""
         inner = self.PREVIEW_DESC_ZONE.inflate(-self.DESC_PAD * 2, -self.DESC_PAD * 2)
         reserved = self.desc_scroll.default_width + self.DESC_SCROLL_GUTTER
         wrap_w = max(16, inner.width - reserved)
 
-        lines = wrap_text(text, self.desc_font, wrap_w)
-        line_h = self.desc_font.get_linesize()
-        content_h = len(lines) * line_h + self.DESC_BOTTOM_PAD + self.DESC_BOTTOM_EXTRA
+        key = (text, wrap_w)
+        if self._desc_block is None or self._desc_block[0] != key:
+            block = TextBlock(inner.width)
+            block.paragraph(self.desc_font, text, self.COLOR_TEXT_DESC, wrap_w)
+            self._desc_block = (key, block)
+        return self._desc_block[1]
+
+    def _update_desc_scroll_geometry(self, text: str) -> None:
+        """Recalcula a altura de conteúdo da descrição para o scrollbar do preview."""
+        content_h = self._desc_block_for(text).height + self.DESC_BOTTOM_PAD + self.DESC_BOTTOM_EXTRA
 
         inner_h = max(0, self.PREVIEW_DESC_ZONE.height - self.DESC_PAD * 2)
         self.desc_scroll.height = inner_h
@@ -463,13 +543,26 @@ class Supermarket(AnimatedPopup):
 
     # ---------- preview (lado direito) ----------
     def _current_desc_text(self) -> str:
+        """Descrição do item selecionado, refeita só quando seleção ou estoque mudam."""
         if not self.ingredient_cards:
             return ""
+        r = self._active_restaurant()
+        key = (self.selected_index, id(r), getattr(r, "stock_version", 0))
+        if self._desc_text is not None and self._desc_text[0] == key:
+            return self._desc_text[1]
+
         card = self.ingredient_cards[self.selected_index]
-        return (
+        text = (
             f"{card.name} fresco, ideal para várias receitas. "
             f"{IngredientCard._fmt_price(card.price)}."
         )
+        # pratos que passam a ser viáveis com a compra (consulta por bitset)
+        stock = getattr(r, "owned_ingredients", {}) if r else {}
+        unlocked = MENU_QUERY.unlocked_by(card.name, stock)
+        if unlocked:
+            text += " Libera: " + ", ".join(d.name for d in unlocked) + "."
+        self._desc_text = (key, text)
+        return text
 
     def _draw_preview(self, screen: pygame.Surface) -> None:
         if not self.ingredient_cards:
@@ -493,21 +586,10 @@ class Supermarket(AnimatedPopup):
         name_rect = name_surf.get_rect(center=self.PREVIEW_TITLE_ZONE.center)
         screen.blit(name_surf, name_rect.topleft)
 
-        # Caixa de descrição com rolagem (estilo cardápio)
+        # Caixa de descrição com rolagem (estilo cardápio): um blit do bloco pré-composto
         inner = self.PREVIEW_DESC_ZONE.inflate(-self.DESC_PAD * 2, -self.DESC_PAD * 2)
-        reserved = self.desc_scroll.default_width + self.DESC_SCROLL_GUTTER
-        wrap_w = max(16, inner.width - reserved)
-
-        prev_clip = screen.get_clip()
-        screen.set_clip(pygame.Rect(inner.left, inner.top, inner.width, inner.height))
-
-        y_cursor = inner.top - self.desc_offset
-        for line in wrap_text(self._current_desc_text(), self.desc_font, wrap_w):
-            ts = self.desc_font.render(line, True, self.COLOR_TEXT_DESC)
-            screen.blit(ts, (inner.left, y_cursor))
-            y_cursor += self.desc_font.get_linesize()
-
-        screen.set_clip(prev_clip)
+        block = self._desc_block_for(self._current_desc_text())
+        block.blit_window(screen, pygame.Rect(inner.left, inner.top, inner.width, inner.height), self.desc_offset)
         self.desc_scroll.render(screen)
 
     # ---------- render principal ----------
@@ -519,8 +601,12 @@ class Supermarket(AnimatedPopup):
 
             # Lista (lado esquerdo)
             self.list_surface.fill((0, 0, 0, 0))
-            for card in self.ingredient_cards:
+            first, last = self._visible_range()
+            for i in range(first, last):
+                card = self.ingredient_cards[i]
                 card.draw(self.list_surface, self.scroll_offset)
+                self._index_card(i, card)
+            self._recycle_card_caches(first, last)
             screen.blit(self.list_surface, self.LIST_ZONE.topleft)
             self.scrollbar.render(screen)
 
@@ -535,14 +621,7 @@ class Supermarket(AnimatedPopup):
             txt = self.ui_font.render("COMPRAR", True, self.BUY_TEXT_COLOR)
             screen.blit(txt, txt.get_rect(center=self.buy_rect.center))
 
-            total_val = self.get_total_value()
-            money_left = self.get_remaining_money()
-            total_label = self.ui_font.render(
-                f"Total: {self._money_fmt(total_val)}", True, self.COLOR_TEXT_MAIN
-            )
-            money_label = self.ui_font.render(
-                f"Dinheiro: {self._money_fmt(money_left)}", True, self.COLOR_TEXT_MAIN
-            )
+            total_label, money_label = self._totals_surfaces()
             totals_y = (
                 self.buy_rect.y + (self.buy_rect.height - total_label.get_height()) // 2 + 2
             )
@@ -564,7 +643,7 @@ class Supermarket(AnimatedPopup):
                 mx, my = event.pos
 
                 # voltar
-                if self.go_back.rect.collidepoint((mx, my)):
+                if HIT_TEST.topmost(event.pos, among=(self.go_back,)) is not None:
                     self.start_closing()
                     return
 
@@ -576,21 +655,19 @@ class Supermarket(AnimatedPopup):
                 # cliques na lista
                 lx, ly = mx - self.LIST_ZONE.x, my - self.LIST_ZONE.y
                 if 0 <= lx < self.list_surface.get_width() and 0 <= ly < self.list_surface.get_height():
-                    clicked_control = False
-                    for card in self.ingredient_cards:
-                        res = card.handle_click((lx, ly))
-                        if res in ("minus", "plus"):
-                            clicked_control = True
-                            break
-                    if not clicked_control:
-                        # selecionar para preview
-                        for i, card in enumerate(self.ingredient_cards):
-                            if card.draw_rect.collidepoint((lx, ly)):
-                                self.selected_index = i
-                                # Ao trocar item, reinicia rolagem da descrição
-                                self.desc_scroll.bar_rect.y = self.desc_scroll.y
-                                self.desc_offset = 0
-                                break
+                    # só os cards visíveis têm rects atualizados no último draw
+                    first, last = self._visible_range()
+                    hit = self._list_hits.topmost((lx, ly), accept=lambda key: first <= key[0] < last)
+                    if hit is not None:
+                        i, part = hit
+                        if part in ("minus", "plus"):
+                            self.ingredient_cards[i].handle_click((lx, ly))
+                        else:
+                            # selecionar para preview
+                            self.selected_index = i
+                            # Ao trocar item, reinicia rolagem da descrição
+                            self.desc_scroll.bar_rect.y = self.desc_scroll.y
+                            self.desc_offset = 0
 
     # ---------- compra ----------
     def _confirm_purchase(self) -> None:
@@ -605,20 +682,24 @@ class Supermarket(AnimatedPopup):
             # opcional: feedback de falta de dinheiro
             return
 
-        # debita e adiciona ao estoque
-        r.money -= total
+        cart = {}
         for card in self.ingredient_cards:
             if card.quantity > 0:
-                if hasattr(r, "update_ingredient"):
-                    r.update_ingredient(card.name, card.quantity)
-                else:
-                    # compatibilidade simples
-                    if not hasattr(r, "owned_ingredients"):
-                        r.owned_ingredients = {}
-                    r.owned_ingredients[card.name] = (
-                        r.owned_ingredients.get(card.name, 0) + card.quantity
-                    )
-                card.quantity = 0
+                cart[card.name] = cart.get(card.name, 0) + card.quantity
+
+        # debita e adiciona ao estoque (uma transação para o carrinho inteiro)
+        if hasattr(r, "record_purchase"):
+            r.record_purchase(cart, total)
+        else:
+            # compatibilidade simples
+            r.money -= total
+            if not hasattr(r, "owned_ingredients"):
+                r.owned_ingredients = {}
+            for name, qty in cart.items():
+                r.owned_ingredients[name] = r.owned_ingredients.get(name, 0) + qty
+
+        for card in self.ingredient_cards:
+            card.quantity = 0
 
     def on_close(self) -> None:
         """
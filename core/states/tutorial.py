@@ -5,6 +5,7 @@ import pygame
 from settings import Settings
 from core.gui.ui_button import UIButton
 from core.states.phase_service import PhaseService
+from utils.input_state import HIT_TEST, INPUT
 
 
 class Tutorial:
@@ -35,11 +36,11 @@ class Tutorial:
         self.buttom.render(screen)
 
         # Desenha o cursor na posição do mouse
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = INPUT.current.mouse_pos
         screen.blit(self.cursor_image, mouse_pos)
 
     def handle_event(self, event):
         """Processa eventos do mouse."""
         if event.type == pygame.MOUSEBUTTONDOWN:
-            if self.buttom.rect.collidepoint(event.pos):
+            if HIT_TEST.topmost(event.pos, among=(self.buttom,)) is not None:
                 self.game.change_state(PhaseService(self.game))
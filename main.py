@@ -4,12 +4,16 @@ import pygame
 
 from settings import Settings
 from core.game import Game
+from utils.input_state import INPUT
+from utils.audio_manager import audio_manager
 
 
 def main():
     """Função do jogo."""
-    pygame.init()
     config = Settings()
+    # Buffer do mixer e canais reservados precisam valer antes de o mixer abrir
+    audio_manager.configure(config.AUDIO)
+    pygame.init()
     screen = pygame.display.set_mode((config.SCREEN['width'], config.SCREEN['height']))
     pygame.display.set_caption("Kitchen Rush")
     clock = pygame.time.Clock()
@@ -22,15 +26,21 @@ def main():
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
+            INPUT.feed(event)
             game.handle_event(event)
 
+        # Entrada do frame capturada uma única vez (mouse, teclado, hover)
+        frame_input = INPUT.capture()
         # Atualiza os elementos do jogo
-        game.update(dt)
+        game.update(dt, frame_input)
         # Renderiza os elementos do jogo
         game.render(screen)
         # Atualiza a tela a cada loop
         pygame.display.flip()
+        # Depois do primeiro frame na tela, decodifica os sons em segundo plano
+        audio_manager.start_loading()
 
+    game.shutdown()
     pygame.quit()
 
 if __name__ == "__main__":
@@ -21,4 +21,26 @@ class Settings:
             'image': 'graphics/sprites/clock_1.png',
             'font': 'fonts/Baloo2-Bold.ttf',
             'font_size': 36,
+        }
+        self.SAVE = {
+            'path': 'saves/player.krs',
+            'autosave_every_hours': 1,  # horas do relógio do jogo
+            'journal_compact_kb': 256,  # journal maior que isso vira snapshot novo
+        }
+        self.AUDIO = {
+            'frequency': 44100,
+            'size': -16,
+            'channels': 2,
+            'buffer': 512,       # amostras por bloco do mixer (menor = menos latência)
+            'groups': {          # canais reservados por categoria
+                'ui': 4,
+                'gameplay': 8,
+                'ambience': 2,
+                # 2 canais do crossfade da música (faixas como Sound, não stream);
+                # entram na soma dos grupos que `VoiceManager.setup` reserva, então
+                # `Sound.play()` avulso nunca os pega
+                'music': 2,
+            },
+            'free_channels': 4,  # canais sem reserva
+            'crossfade': 2.0,    # segundos de transição entre faixas
         }
\ No newline at end of file
@@ -1,5 +1,10 @@
+import threading
+import time
+
 import pygame
 
+from utils.voice_manager import VoiceManager
+
 
 class AudioManager:
     """
@@ -7,11 +12,24 @@ class AudioManager:
     
     Essa classe centraliza o carregamento e reprodução de sons, garantindo que os mesmos
     não sejam carregados repetidamente durante o jogo.
+
+    Os sons são só REGISTRADOS (nome -> caminho) na importação; o mixer é
+    iniciado e os arquivos decodificados numa thread de fundo depois do
+    primeiro frame (`start_loading`). Um som pedido antes de ficar pronto
+    simplesmente não toca.
+
+    Cada som pertence a uma categoria (grupo de canais reservados do
+    `VoiceManager`) e tem limite de vozes e intervalo mínimo entre disparos.
     """
 
+    # Configuração padrão do mixer (sobrescrita por `configure`)
+    MIXER = {'frequency': 44100, 'size': -16, 'channels': 2, 'buffer': 512}
+    GROUPS = {'ui': 4, 'gameplay': 8, 'ambience': 2, 'music': 2}
+
     def __init__(self):
-        pygame.mixer.init()
-        self.sounds = {}         # Dicionário de efeitos sonoros
+        self.sounds = {}         # Dicionário de efeitos sonoros (já decodificados)
+        self.sound_paths = {}    # Sons registrados: nome -> caminho
+        self.sound_specs = {}    # nome -> (categoria, máx. de vozes, intervalo mínimo)
         self.musics = {}         # Dicionário de trilhas musicais
         self.current_music = None  # Nome da música atual
 
@@ -19,25 +37,142 @@ class AudioManager:
         self.music_volume = 0.6
         self.sound_volume = 0.7
 
+        # Mixer e canais reservados
+        self.mixer_config = dict(self.MIXER)
+        self.voices = VoiceManager(self.GROUPS)
+
+        # Carga em segundo plano
+        self._loader = None
+        self._lock = threading.Lock()
+        self.load_times = {}     # nome -> segundos de decodificação
+        self.load_errors = {}    # nome -> mensagem de erro
+        self.load_started_at = None
+        self.load_finished_at = None
+
+    # ------------------------------------------------------------------ #
+    # Mixer e carregamento
+    # ------------------------------------------------------------------ #
+    def configure(self, audio):
+        """
+        Aplica as configurações de áudio (`Settings.AUDIO`).
+
+        Deve ser chamado antes de `pygame.init()`: o tamanho do buffer só
+        vale se passado ao `pre_init`, antes de o mixer abrir o dispositivo.
+
+        :param audio: Dicionário com frequency, size, channels, buffer,
+            groups e free_channels.
+        """
+        for key in self.MIXER:
+            if key in audio:
+                self.mixer_config[key] = audio[key]
+        self.voices = VoiceManager(audio.get('groups', self.GROUPS),
+                                   audio.get('free_channels', self.voices.free_channels))
+        pygame.mixer.pre_init(**self.mixer_config)
+
+    def ensure_mixer(self):
+        """Inicia o mixer se ainda não estiver ativo. Retorna False se não houver áudio."""
+        if not pygame.mixer.get_init():
+            try:
+                pygame.mixer.init(**self.mixer_config)
+            except pygame.error:
+                return False
+        if not self.voices.ready:
+            self.voices.setup()
+        return True
+
+    def register_sound(self, name, path, group='ui', max_voices=2, cooldown=0.0):
+        """
+        Registra um efeito sonoro pelo caminho, sem decodificar.
+
+        :param name: Nome identificador do som.
+        :param path: Caminho para o arquivo de som.
+        :param group: Categoria (grupo de canais): 'ui', 'gameplay' ou 'ambience'.
+        :param max_voices: Cópias simultâneas do som.
+        :param cooldown: Segundos mínimos entre dois disparos.
+        """
+        self.sound_paths[name] = path
+        self.sound_specs[name] = (group, max_voices, cooldown)
+
     def load_sound(self, name, path):
         """
-        Carrega um efeito sonoro a partir do caminho fornecido.
+        Carrega (decodifica) um efeito sonoro imediatamente.
         
         :param name: Nome identificador do som.
         :param path: Caminho para o arquivo de som.
         """
-        sound = pygame.mixer.Sound(path)
-        sound.set_volume(self.sound_volume)
-        self.sounds[name] = pygame.mixer.Sound(sound)
+        self.sound_paths[name] = path
+        self.sound_specs.setdefault(name, ('ui', 2, 0.0))
+        self._decode(name, path)
+
+    def _decode(self, name, path):
+        start = time.perf_counter()
+        try:
+            sound = pygame.mixer.Sound(path)
+        except (pygame.error, FileNotFoundError) as exc:
+            self.load_errors[name] = str(exc)
+            return
+        with self._lock:
+            sound.set_volume(self.sound_volume)
+            self.sounds[name] = sound
+        self.load_times[name] = time.perf_counter() - start
+
+    def start_loading(self):
+        """
+        Inicia (uma única vez) a decodificação dos sons registrados numa
+        thread de fundo. Chamado pelo laço principal após o primeiro frame.
+        """
+        if self._loader is not None:
+            return
+        if not self.ensure_mixer():
+            self._loader = False  # sem dispositivo de áudio: fica em silêncio
+            return
+        self.load_started_at = time.perf_counter()
+        self._loader = threading.Thread(target=self._load_all, name="audio-loader", daemon=True)
+        self._loader.start()
+
+    def _load_all(self):
+        for name, path in list(self.sound_paths.items()):
+            if name not in self.sounds:
+                self._decode(name, path)
+        self.load_finished_at = time.perf_counter()
+
+    def wait_loaded(self, timeout=None):
+        """Bloqueia até a carga de fundo terminar (útil em ferramentas e benchmarks)."""
+        if self._loader:
+            self._loader.join(timeout)
+        return self.loaded
+
+    @property
+    def loaded(self):
+        return self.load_finished_at is not None
+
+    def load_stats(self):
+        """Tempos da carga de fundo: total, por som e falhas."""
+        total = None
+        if self.loaded:
+            total = self.load_finished_at - self.load_started_at
+        return {
+            "total": total,
+            "sounds": dict(self.load_times),
+            "errors": dict(self.load_errors),
+            "pending": [n for n in self.sound_paths if n not in self.sounds and n not in self.load_errors],
+        }
 
     def play_sound(self, name):
         """
         Reproduz um efeito sonoro previamente carregado.
         
         :param name: Nome do som a ser reproduzido.
+        :return: Canal usado, ou None se o som foi descartado (não carregado,
+            dentro do intervalo mínimo).
         """
-        if name in self.sounds:
-            self.sounds[name].play()
+        sound = self.sounds.get(name)
+        if sound is not None:
+            group, max_voices, cooldown = self.sound_specs.get(name, ('ui', 2, 0.0))
+            return self.voices.play(name, sound, group, max_voices, cooldown)
+        if self._loader is None and name in self.sound_paths:
+            # tocado antes do primeiro frame: dispara a carga e fica em silêncio
+            self.start_loading()
 
     def load_music(self, name, path):
         """
@@ -57,6 +192,8 @@ class AudioManager:
         :param loop: Se True, a música toca em loop.
         """
         if name in self.musics:
+            if not self.ensure_mixer():
+                return
             if self.current_music == name and pygame.mixer.music.get_busy():
                 return  # Música já está tocando
             pygame.mixer.music.stop()
@@ -69,7 +206,8 @@ class AudioManager:
         """
         Interrompe a música atual, se estiver tocando.
         """
-        pygame.mixer.music.stop()
+        if pygame.mixer.get_init():
+            pygame.mixer.music.stop()
         self.current_music = None
 
     def set_music_volume(self, volume):
@@ -78,7 +216,8 @@ class AudioManager:
         :param volume: Valor entre 0.0 e 1.0
         """
         self.music_volume = max(0.0, min(1.0, volume))
-        pygame.mixer.music.set_volume(self.music_volume)
+        if pygame.mixer.get_init():
+            pygame.mixer.music.set_volume(self.music_volume)
 
     def set_sound_volume(self, volume):
         """
@@ -86,8 +225,9 @@ class AudioManager:
         :param volume: Valor entre 0.0 e 1.0
         """
         self.sound_volume = max(0.0, min(1.0, volume))
-        for sound in self.sounds.values():
-            sound.set_volume(self.sound_volume)
+        with self._lock:
+            for sound in self.sounds.values():
+                sound.set_volume(self.sound_volume)
 
     def get_music_volume(self):
         """Retorna o volume atual da música."""
@@ -101,17 +241,17 @@ class AudioManager:
 # Instância global do gerenciador de áudio
 audio_manager = AudioManager()
 
-# === Carregamento inicial dos sons do jogo ===
+# === Registro dos sons do jogo (decodificados em segundo plano) ===
 
 # Efeitos sonoros
-audio_manager.load_sound("hover", "audio/sounds/effects/hover_effect.wav")
-audio_manager.load_sound("click", "audio/sounds/effects/ui_click.wav")
-audio_manager.load_sound("swipe", "audio/sounds/effects/swipe_effect_2.wav")
-#audio_manager.load_sound("open_menu", "audio/sounds/effects/open_menu.wav")
-#audio_manager.load_sound("close_menu", "audio/sounds/effects/close_menu.wav")
-#audio_manager.load_sound("coin", "audio/sounds/effects/coin.wav")
-#audio_manager.load_sound("bell", "audio/sounds/effects/bell.wav")
-#audio_manager.load_sound("error", "audio/sounds/effects/error.wav")
+audio_manager.register_sound("hover", "audio/sounds/effects/hover_effect.wav", max_voices=2, cooldown=0.04)
+audio_manager.register_sound("click", "audio/sounds/effects/ui_click.wav", max_voices=2)
+audio_manager.register_sound("swipe", "audio/sounds/effects/swipe_effect_2.wav", max_voices=1, cooldown=0.1)
+#audio_manager.register_sound("open_menu", "audio/sounds/effects/open_menu.wav")
+#audio_manager.register_sound("close_menu", "audio/sounds/effects/close_menu.wav")
+#audio_manager.register_sound("coin", "audio/sounds/effects/coin.wav")
+#audio_manager.register_sound("bell", "audio/sounds/effects/bell.wav")
+#audio_manager.register_sound("error", "audio/sounds/effects/error.wav")
 
 # Músicas de fundo
 #audio_manager.load_music("menu", "sounds/bgm/menu_theme.mp3")
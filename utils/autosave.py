@@ -0,0 +1,195 @@
+"""
+Salvamento assíncrono e atômico do progresso do jogador.
+
+Fluxo de um autosave:
+1. Thread principal: `request_save(player)` tira um snapshot barato
+   (`player.to_dict()`, só cópia de contêineres) e o deixa como pendente.
+2. Thread de gravação: serializa o snapshot mais recente, grava num arquivo
+   temporário no mesmo diretório, faz fsync e troca pelo arquivo final com
+   `os.replace` (atômico). Um crash no meio deixa o save antigo intacto.
+3. Pedidos que chegam enquanto um save está pendente são COALESCIDOS: só o
+   snapshot mais novo é gravado.
+4. Com um `store` (ex.: `core.assets.save_journal.SaveJournal`), a gravação
+   é delegada a ele, que decide entre anexar um delta ou compactar.
+5. Se houver `index_encoder`, um arquivo de índice pequeno é gravado logo
+   depois do save (ex.: resumo dos slots para a tela de seleção).
+
+As métricas de latência ficam em `AutosaveManager.stats`.
+"""
+
+import os
+import tempfile
+import threading
+import time
+from typing import Callable, Optional
+
+
+def atomic_write_bytes(filepath: str, data: bytes) -> None:
+    """
+    Grava `data` em `filepath` de forma atômica (temp + fsync + rename).
+
+    :param filepath: Caminho final do arquivo
+    :param data: Conteúdo já serializado
+    """
+    directory = os.path.dirname(os.path.abspath(filepath))
+    os.makedirs(directory, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp_", suffix=".save", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    # garante que o rename também chegou ao disco (POSIX)
+    if hasattr(os, "O_DIRECTORY"):
+        try:
+            dir_fd = os.open(directory, os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+        except OSError:
+            pass
+
+
+class SaveStats:
+    """Métricas do pipeline de salvamento (em segundos)."""
+
+    def __init__(self):
+        self.requests = 0           # pedidos recebidos
+        self.coalesced = 0          # pedidos descartados por um snapshot mais novo
+        self.completed = 0          # saves gravados com sucesso
+        self.failed = 0
+        self.last_snapshot_time = 0.0   # custo na thread principal
+        self.last_write_time = 0.0      # serialização + gravação (thread de fundo)
+        self.last_latency = 0.0         # do pedido até o arquivo durável
+        self.max_latency = 0.0
+        self.last_size = 0              # bytes gravados
+        self.last_error: Optional[BaseException] = None
+
+
+class AutosaveManager:
+    """
+    Gerencia saves em segundo plano para um único arquivo.
+
+    :param filepath: Caminho do save
+    :param encoder: Função snapshot -> bytes (executada na thread de gravação)
+    :param writer: Função (caminho, bytes) -> None; padrão `atomic_write_bytes`
+    :param store: Objeto com `write(snapshot) -> bytes gravados`; substitui
+                  `encoder` + `writer` (opcional)
+    :param index_path: Caminho do índice gravado após cada save (opcional)
+    :param index_encoder: Função (snapshot, caminho do save) -> bytes do índice
+    """
+
+    def __init__(
+        self,
+        filepath: str,
+        encoder: Optional[Callable[[dict], bytes]] = None,
+        writer: Callable[[str, bytes], None] = atomic_write_bytes,
+        index_path: Optional[str] = None,
+        index_encoder: Optional[Callable[[dict, str], bytes]] = None,
+        store=None,
+    ):
+        self.filepath = filepath
+        self.encoder = encoder
+        self.writer = writer
+        self.store = store
+        self.index_path = index_path
+        self.index_encoder = index_encoder
+        self.stats = SaveStats()
+
+        self._cond = threading.Condition()
+        self._pending = None            # (snapshot, encoder, instante do pedido)
+        self._busy = False
+        self._running = True
+        self._thread = threading.Thread(target=self._worker, name="autosave", daemon=True)
+        self._thread.start()
+
+    # ------------------------------------------------------------------ #
+    # API (thread principal)
+    # ------------------------------------------------------------------ #
+    def request_save(self, player) -> None:
+        """Tira o snapshot do jogador e agenda a gravação em segundo plano."""
+        t0 = time.perf_counter()
+        snapshot = player.to_dict()
+        encoder = self.encoder or type(player).encode
+        self.stats.last_snapshot_time = time.perf_counter() - t0
+
+        with self._cond:
+            self.stats.requests += 1
+            if self._pending is not None:
+                self.stats.coalesced += 1
+            self._pending = (snapshot, encoder, t0)
+            self._cond.notify_all()
+
+    def is_idle(self) -> bool:
+        with self._cond:
+            return self._pending is None and not self._busy
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Bloqueia até não haver saves pendentes. Retorna False em timeout."""
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        with self._cond:
+            while self._pending is not None or self._busy:
+                remaining = None if deadline is None else deadline - time.perf_counter()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def stop(self, flush: bool = True, timeout: Optional[float] = 5.0) -> None:
+        """Encerra a thread de gravação (gravando o pendente, se `flush`)."""
+        if flush:
+            self.flush(timeout)
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        self._thread.join(timeout)
+
+    # ------------------------------------------------------------------ #
+    # Thread de gravação
+    # ------------------------------------------------------------------ #
+    def _worker(self) -> None:
+        while True:
+            with self._cond:
+                while self._pending is None and self._running:
+                    self._cond.wait()
+                if self._pending is None:
+                    return
+                snapshot, encoder, requested_at = self._pending
+                self._pending = None
+                self._busy = True
+
+            t0 = time.perf_counter()
+            try:
+                if self.store is not None:
+                    size = self.store.write(snapshot)
+                else:
+                    data = encoder(snapshot)
+                    self.writer(self.filepath, data)
+                    size = len(data)
+                # o índice vem DEPOIS do save: se faltar, é reconstruído na carga
+                if self.index_path and self.index_encoder:
+                    self.writer(self.index_path, self.index_encoder(snapshot, self.filepath))
+            except Exception as exc:  # não derruba o jogo por causa de um save
+                self.stats.failed += 1
+                self.stats.last_error = exc
+            else:
+                done = time.perf_counter()
+                self.stats.completed += 1
+                self.stats.last_size = size
+                self.stats.last_write_time = done - t0
+                self.stats.last_latency = done - requested_at
+                self.stats.max_latency = max(self.stats.max_latency, self.stats.last_latency)
+
+            with self._cond:
+                self._busy = False
+                self._cond.notify_all()
@@ -0,0 +1,93 @@
+"""
+Benchmark de latência dos efeitos sonoros: tempo do clique até o som.
+
+Para cada tamanho de buffer do mixer (`pre_init`), mede:
+- o custo de `audio_manager.play_sound` no laço (despacho até o canal);
+- o tempo até o canal reportar o som tocando;
+- a latência do bloco do mixer (buffer / frequência), que o dispositivo
+  soma a isso antes de o som sair.
+
+Em seguida simula uma varredura de hover sobre os cards (rajada de
+disparos) e mostra quantos viraram voz, quantos foram segurados pelo
+intervalo mínimo e quantos reiniciaram uma voz existente.
+
+Uso (a partir da raiz do projeto):
+    python -m utils.bench_audio_latency [--buffers 256 512 1024] [--plays 200]
+"""
+
+import argparse
+import time
+
+import pygame
+
+from settings import Settings
+from utils.audio_manager import audio_manager
+from utils.voice_manager import VoiceManager
+
+
+def _reopen(buffer):
+    pygame.mixer.quit()
+    audio_manager.mixer_config['buffer'] = buffer
+    audio_manager.voices = VoiceManager(audio_manager.voices.group_sizes,
+                                        audio_manager.voices.free_channels)
+    if not audio_manager.ensure_mixer():
+        raise SystemExit("Sem dispositivo de áudio (tente SDL_AUDIODRIVER=dummy).")
+    audio_manager.sounds.clear()
+    for name, path in audio_manager.sound_paths.items():
+        audio_manager.load_sound(name, path)
+
+
+def bench_latency(buffer: int, plays: int):
+    _reopen(buffer)
+    dispatch, start = [], []
+    for _ in range(plays):
+        audio_manager.voices.stop_group('ui')
+        audio_manager.voices.last_played.clear()
+        t0 = time.perf_counter()
+        channel = audio_manager.play_sound("click")
+        t1 = time.perf_counter()
+        while channel is not None and not channel.get_busy() and time.perf_counter() - t0 < 0.5:
+            pass
+        dispatch.append(t1 - t0)
+        start.append(time.perf_counter() - t0)
+    freq = pygame.mixer.get_init()[0]
+    return (sum(dispatch) / plays, sum(start) / plays, buffer / freq)
+
+
+def bench_burst(cards: int = 6, sweeps: int = 10, step: float = 0.008):
+    """Varredura: o cursor cruza `cards` cards a cada `step` segundos."""
+    voices = audio_manager.voices
+    voices.stats = dict.fromkeys(voices.stats, 0)
+    voices.last_played.clear()
+    requests = 0
+    for _ in range(sweeps):
+        for _ in range(cards):
+            audio_manager.play_sound("hover")
+            requests += 1
+            time.sleep(step)
+    ui = voices.groups['ui']
+    busy = sum(1 for ch in ui.channels if ch.get_busy())
+    return requests, dict(voices.stats), busy, len(ui.channels)
+
+
+def run(buffers, plays: int) -> None:
+    print(f"{'buffer':>8}{'play_sound (µs)':>18}{'até tocar (µs)':>17}{'bloco (ms)':>12}")
+    for buffer in buffers:
+        dispatch, start, block = bench_latency(buffer, plays)
+        print(f"{buffer:>8}{dispatch * 1e6:>18.1f}{start * 1e6:>17.1f}{block * 1000:>12.2f}")
+
+    requests, stats, busy, size = bench_burst()
+    print(f"\nrajada de hover: {requests} pedidos -> {stats['played']} tocados, "
+          f"{stats['cooldown']} no intervalo mínimo, {stats['retriggered']} reiniciados, "
+          f"{stats['stolen']} canais roubados; {busy}/{size} canais de UI ocupados")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--buffers", type=int, nargs="+", default=[256, 512, 1024, 2048])
+    parser.add_argument("--plays", type=int, default=200)
+    args = parser.parse_args()
+    audio_manager.configure(Settings().AUDIO)
+    pygame.init()
+    run(args.buffers, args.plays)
+    pygame.quit()
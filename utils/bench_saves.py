@@ -0,0 +1,105 @@
+"""
+Benchmark do formato de save: JSON x binário (`core.assets.save_format`).
+
+Gera um jogador sintético com vários restaurantes e históricos longos de
+estoque e mede tamanho em disco, tempo de gravação e tempo de carga.
+
+Uso (a partir da raiz do projeto):
+    python -m utils.bench_saves [--restaurants 20] [--days 365] [--orders 40]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from core.assets.player import Player
+from core.assets.menu_query import MENU_QUERY
+from core.assets.restaurant import Restaurant
+from core.assets.save_format import decode_player, encode_player
+
+# Bytes que uma transação de um único ingrediente acrescenta ao save:
+# tipo (b=1) + dia (q=8) + nº de entradas (q=8) + índice (q=8) + delta (q=8)
+# + dinheiro (d=8) + separador da referência (1). Igual em qualquer SO.
+TXN_BYTES = 1 + 8 + 8 + 8 + 8 + 8 + 1
+
+
+def build_player(restaurants: int, days: int, orders_per_day: int, seed: int = 7) -> Player:
+    """Jogador com `restaurants` restaurantes jogados por `days` dias."""
+    rng = random.Random(seed)
+    keys = list(MENU_QUERY.ingredient_keys)
+    dishes = list(MENU_QUERY.dishes)
+
+    player = Player("Bench", "Restaurante 0")
+    for i in range(1, restaurants):
+        player.add_restaurant(f"Restaurante {i}")
+
+    for r in player.restaurants:
+        for _ in range(days):
+            cart = {k: rng.randint(1, 6) for k in rng.sample(keys, min(len(keys), 8))}
+            r.money += 500
+            r.record_purchase(cart, cost=rng.uniform(50, 300))
+            for _ in range(orders_per_day):
+                r.consume_dish(rng.choice(dishes))
+            r.total_clients_served += orders_per_day
+            r.advance_day()
+    return player
+
+
+def _time(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def check_layout() -> None:
+    """Round-trip do binário e largura fixa das colunas do ledger."""
+    key = MENU_QUERY.ingredient_keys[0]
+    player = Player("Layout", "Restaurante")
+    r = player.restaurants[0]
+    r.record_purchase({key: 3}, cost=10.0)
+    before = encode_player(player.to_dict())
+    r.record_purchase({key: 2}, cost=5.0)
+    after = encode_player(player.to_dict())
+    assert len(after) - len(before) == TXN_BYTES, (len(after) - len(before), TXN_BYTES)
+
+    back = decode_player(after, Player, Restaurant)
+    assert encode_player(back.to_dict()) == after
+    assert back.restaurants[0].inventory.transactions == r.inventory.transactions
+
+
+def run(restaurants: int, days: int, orders: int, repeat: int) -> None:
+    check_layout()
+    player = build_player(restaurants, days, orders)
+    txns = sum(len(r.inventory.transactions) for r in player.restaurants)
+    print(f"{restaurants} restaurantes, {days} dias, {txns} transações no total\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = {"json": os.path.join(tmp, "player.json"), "binário": os.path.join(tmp, "player.krs")}
+        print(f"{'formato':<9}{'tamanho':>12}{'save (ms)':>12}{'load (ms)':>12}")
+        for label, path in paths.items():
+            save = _time(lambda: player.save_to_file(path), repeat)
+            load = _time(lambda: Player.load_from_file(path), repeat)
+            size = os.path.getsize(path)
+            print(f"{label:<9}{size / 1024:>10.1f}KB{save * 1000:>12.1f}{load * 1000:>12.1f}")
+
+        # sanidade: os dois formatos carregam o mesmo estado
+        a = Player.load_from_file(paths["json"])
+        b = Player.load_from_file(paths["binário"])
+        for ra, rb in zip(a.restaurants, b.restaurants):
+            assert ra.owned_ingredients == rb.owned_ingredients
+            assert ra.inventory.transactions == rb.inventory.transactions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--restaurants", type=int, default=20)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--orders", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.restaurants, args.days, args.orders, args.repeat)
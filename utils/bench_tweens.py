@@ -0,0 +1,78 @@
+"""
+Benchmark de tweens: `Tween` (um objeto + closure por animação) x
+`BatchTweenEngine` (arrays NumPy, avaliação em lote por easing).
+
+Mede o custo médio de um frame com N animações simultâneas, misturando os
+easings usados pela interface.
+
+Uso (a partir da raiz do projeto):
+    python -m utils.bench_tweens [--counts 1000 10000] [--frames 120]
+"""
+
+import argparse
+import time
+
+from core.effects.animations import Tween, ease_in_cubic, ease_out_back, ease_out_sine
+from core.effects.batch_tween import BatchTweenEngine, np
+
+DT = 1 / 60
+EASINGS = (
+    ("out_sine", ease_out_sine),
+    ("in_cubic", ease_in_cubic),
+    ("out_back", lambda x: ease_out_back(x, 1.5)),
+)
+
+
+class _Target:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+
+def bench_objects(n: int, frames: int) -> float:
+    targets = [_Target() for _ in range(n)]
+    tweens = []
+    for i, tgt in enumerate(targets):
+        _, fn = EASINGS[i % len(EASINGS)]
+
+        def on_update(t, tgt=tgt):
+            tgt.value = 0.75 + (1.08 - 0.75) * t
+
+        tweens.append(Tween(duration=10.0, easing=fn, on_update=on_update))
+
+    t0 = time.perf_counter()
+    for _ in range(frames):
+        for tw in tweens:
+            tw.update(DT)
+    return (time.perf_counter() - t0) / frames
+
+
+def bench_batch(n: int, frames: int) -> float:
+    engine = BatchTweenEngine(capacity=n)
+    for i in range(n):
+        name, _ = EASINGS[i % len(EASINGS)]
+        engine.add(0.75, 1.08, 10.0, easing=name, param=1.5)
+
+    t0 = time.perf_counter()
+    for _ in range(frames):
+        engine.step(DT)
+    return (time.perf_counter() - t0) / frames
+
+
+def run(counts, frames: int) -> None:
+    backend = "numpy " + np.__version__ if np is not None else "python puro (sem numpy)"
+    print(f"BatchTweenEngine: {backend}; {frames} frames\n")
+    print(f"{'tweens':>8}{'Tween (ms/frame)':>20}{'lote (ms/frame)':>18}{'ganho':>8}")
+    for n in counts:
+        obj = bench_objects(n, frames)
+        batch = bench_batch(n, frames)
+        print(f"{n:>8}{obj * 1000:>20.3f}{batch * 1000:>18.3f}{obj / batch:>7.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--counts", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--frames", type=int, default=120)
+    args = parser.parse_args()
+    run(args.counts, args.frames)
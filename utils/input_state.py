@@ -0,0 +1,158 @@
+"""
+Módulo que armazena o estado de entrada do frame.
+
+Em vez de cada widget consultar `pygame.mouse.get_pos()` e testar o próprio
+retângulo no `update`, o laço principal captura UMA vez por frame um
+`InputSnapshot` (mouse, botões, roda, teclado) e o passa a `Game.update`.
+Na captura, o `HIT_TEST` (grade hash, ver `spatial_hash`) resolve de uma vez
+quais widgets registrados estão sob o cursor; cada widget só consulta
+`snapshot.hovering(self)`. As telas usam o mesmo índice para rotear cliques
+(`HIT_TEST.topmost(pos, among=...)`).
+"""
+
+import weakref
+
+import pygame
+
+from utils.spatial_hash import SpatialHash
+
+
+class HitTester:
+    """
+    Índice espacial dos widgets que reagem ao cursor.
+
+    Widgets se registram na criação e avisam com `move` quando o retângulo
+    muda (movimento, escala); a grade só é refeita quando o widget troca de
+    células. O registro é fraco: widgets de telas descartadas saem sozinhos.
+
+    A ordem de empilhamento é (camada, ordem de registro) — widgets criados
+    depois (ex.: os de uma popup) ficam por cima; `set_layer` eleva um widget
+    (ex.: botão em hover/ativo, desenhado por cima dos vizinhos).
+    """
+
+    def __init__(self, cell_size=64):
+        self._index = SpatialHash(cell_size)
+        self._widgets = weakref.WeakValueDictionary()   # id -> widget
+
+    def register(self, widget, layer=0):
+        key = id(widget)
+        self._widgets[key] = widget
+        weakref.finalize(widget, self._forget, key)
+        self._index.insert(key, widget.hit_rect or pygame.Rect(0, 0, 0, 0), layer)
+
+    def _forget(self, key):
+        # id() pode ter sido reaproveitado por um widget novo já registrado
+        if key not in self._widgets:
+            self._index.remove(key)
+
+    def unregister(self, widget):
+        self._widgets.pop(id(widget), None)
+        self._index.remove(id(widget))
+
+    def move(self, widget, rect):
+        """Atualiza o retângulo de um widget registrado."""
+        self._index.move(id(widget), rect if rect is not None else pygame.Rect(0, 0, 0, 0))
+
+    def set_layer(self, widget, layer):
+        self._index.set_layer(id(widget), layer)
+
+    def __len__(self):
+        return len(self._widgets)
+
+    def resolve(self, pos):
+        """Conjunto (por id) dos widgets cujo retângulo contém `pos`."""
+        return set(self._index.at(pos, self._widgets.__contains__))
+
+    def at(self, pos, among=None):
+        """
+        Widgets sob `pos`, do mais alto para o mais baixo.
+
+        Args:
+            among (Container | None): Restringe aos widgets contidos aqui
+                (ex.: os cards de uma tela), ignorando os de outras telas.
+        """
+        widgets = []
+        for key in self._index.at(pos):
+            widget = self._widgets.get(key)
+            if widget is not None and (among is None or widget in among):
+                widgets.append(widget)
+        return widgets
+
+    def topmost(self, pos, among=None):
+        """Widget mais alto sob `pos` (ou None)."""
+        hits = self.at(pos, among)
+        return hits[0] if hits else None
+
+
+class InputSnapshot:
+    """
+    Estado de entrada de um frame (imutável depois de capturado).
+
+    Args:
+        frame (int): Nº do frame da captura.
+        mouse_pos (tuple): Posição do cursor.
+        mouse_buttons (tuple): Botões pressionados (esquerdo, meio, direito).
+        wheel (tuple): Rolagem acumulada no frame (x, y).
+        keys (ScancodeWrapper | tuple): Teclas pressionadas.
+        hits (set): ids dos widgets sob o cursor.
+    """
+    __slots__ = ("frame", "mouse_pos", "mouse_buttons", "wheel", "keys", "_hits")
+
+    def __init__(self, frame, mouse_pos, mouse_buttons, wheel, keys, hits):
+        self.frame = frame
+        self.mouse_pos = mouse_pos
+        self.mouse_buttons = mouse_buttons
+        self.wheel = wheel
+        self.keys = keys
+        self._hits = hits
+
+    def hovering(self, widget):
+        """True se o cursor estava sobre `widget` na captura."""
+        return id(widget) in self._hits
+
+
+class InputManager:
+    """Acumula os eventos do frame e gera o `InputSnapshot`."""
+
+    def __init__(self, hit_test):
+        self.hit_test = hit_test
+        self.frame = 0
+        self._wheel = [0, 0]
+        self._current = None
+
+    def feed(self, event):
+        """Registra um evento do frame (hoje só a roda do mouse acumula)."""
+        if event.type == pygame.MOUSEWHEEL:
+            self._wheel[0] += event.x
+            self._wheel[1] += event.y
+
+    def capture(self):
+        """Captura o estado do frame; chamado uma vez pelo laço principal."""
+        self.frame += 1
+        mouse_pos = pygame.mouse.get_pos()
+        keys = pygame.key.get_pressed() if pygame.display.get_init() else ()
+        self._current = InputSnapshot(
+            frame=self.frame,
+            mouse_pos=mouse_pos,
+            mouse_buttons=pygame.mouse.get_pressed(),
+            wheel=tuple(self._wheel),
+            keys=keys,
+            hits=self.hit_test.resolve(mouse_pos),
+        )
+        self._wheel = [0, 0]
+        return self._current
+
+    def use(self, snapshot):
+        """Publica um snapshot capturado por fora (ex.: recebido em `Game.update`)."""
+        self._current = snapshot
+
+    @property
+    def current(self):
+        """Snapshot do frame corrente (captura um se ainda não houver)."""
+        if self._current is None:
+            return self.capture()
+        return self._current
+
+
+HIT_TEST = HitTester()
+INPUT = InputManager(HIT_TEST)
@@ -0,0 +1,275 @@
+"""
+Módulo que armazena o gerenciador de música com playlists por tela.
+
+`pygame.mixer.music` tem um único stream e `music.load` abre o arquivo e
+inicia o decodificador no frame que o chama. Aqui:
+
+- as faixas são abertas e decodificadas numa thread de fundo (a próxima da
+  playlist é pré-carregada enquanto a atual toca, assim que a anterior
+  terminou de sair e foi descartada);
+- cada faixa é decodificada INTEIRA num `pygame.mixer.Sound` (PCM na
+  memória), não em stream: com o mixer em 44,1 kHz/16 bits/estéreo são
+  ~10 MB por minuto, ~30 MB numa faixa de 3 min, e até duas (três durante
+  uma troca de estado no meio do crossfade) ficam carregadas. É o preço de
+  ter dois canais tocando ao mesmo tempo: o stream único de
+  `mixer.music` não faz crossfade. Prefira faixas curtas em loop;
+- a troca de faixa é um crossfade entre DOIS canais reservados (grupo
+  'music' do `VoiceManager`): a faixa nova sobe enquanto a antiga desce;
+- o laço principal só dispara canais e ajusta volumes em `update`, nunca
+  espera por disco ou decodificador.
+
+Cada tela (nome da classe do estado) pode ter sua playlist; ao trocar de
+estado, `Game.change_state` chama `enter`. Telas sem playlist mantêm a
+música que já estiver tocando.
+"""
+
+import queue
+import threading
+import time
+from collections import OrderedDict
+
+import pygame
+
+from utils.audio_manager import audio_manager
+
+# Faixas decodificadas (PCM inteiro, ver docstring do módulo) mantidas em
+# memória: a atual + a próxima (ou a que ainda está saindo no crossfade).
+# Trocar de estado no meio de um crossfade pode somar a faixa pedida por um
+# instante.
+TRACK_CACHE_SIZE = 2
+
+
+class _Slot:
+    """Um dos dois canais de música e o que está tocando nele."""
+    __slots__ = ("channel", "name", "sound", "started", "level", "target")
+
+    def __init__(self, channel):
+        self.channel = channel
+        self.name = None
+        self.sound = None
+        self.started = 0.0
+        self.level = 0.0    # volume relativo atual (0..1)
+        self.target = 0.0   # volume relativo desejado
+
+
+class MusicManager:
+    """
+    Playlists por estado com crossfade entre dois canais.
+
+    Args:
+        audio (AudioManager): Onde as faixas estão registradas (`load_music`)
+            e de onde vêm o mixer, os canais e o volume da música.
+        fade (float): Duração do crossfade em segundos.
+    """
+
+    def __init__(self, audio, fade=2.0):
+        self.audio = audio
+        self.fade = fade
+        self.playlists = {}      # estado -> lista de faixas
+        self.state = None
+
+        self._playlist = None
+        self._index = 0
+        self._wanted = None      # faixa aguardando decodificação para entrar
+        self._slots = None
+        self._current = None     # slot tocando a faixa atual
+
+        # Decodificação em segundo plano
+        self._decoded = OrderedDict()   # nome -> Sound
+        self._requested = set()
+        self.errors = {}                # nome -> mensagem de erro
+        self._lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._worker = None
+
+    # ------------------------------------------------------------------ #
+    # Playlists
+    # ------------------------------------------------------------------ #
+    def set_playlist(self, state, tracks):
+        """
+        Define a playlist de um estado.
+
+        :param state: Nome da classe do estado (ex.: "PhaseService").
+        :param tracks: Nomes das faixas registradas com `load_music`, em ordem.
+        """
+        self.playlists[state] = list(tracks)
+
+    def enter(self, state):
+        """Troca para a playlist de `state` (se houver) com crossfade."""
+        self.state = state
+        playlist = self.playlists.get(state)
+        if not playlist or playlist is self._playlist:
+            return
+        self._playlist = playlist
+        self._index = 0
+        self.play(playlist[0])
+
+    def play(self, name):
+        """Pede a faixa `name`; ela entra em crossfade assim que estiver decodificada."""
+        self._wanted = name
+        self.prefetch(name)
+
+    def stop(self):
+        """Abaixa a música atual até o silêncio."""
+        self._playlist = None
+        self._wanted = None
+        if self._slots:
+            for slot in self._slots:
+                slot.target = 0.0
+
+    # ------------------------------------------------------------------ #
+    # Carga em segundo plano
+    # ------------------------------------------------------------------ #
+    def prefetch(self, name):
+        """Agenda a decodificação de `name` na thread de fundo (sem bloquear)."""
+        if name in self._requested or name in self.errors:
+            return
+        path = self.audio.musics.get(name)
+        if path is None:
+            self.errors[name] = "faixa não registrada"
+            return
+        if not self.audio.ensure_mixer():
+            return  # sem mixer ainda: tenta de novo num próximo frame
+        self._requested.add(name)
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._work, name="music-loader", daemon=True)
+            self._worker.start()
+        self._queue.put((name, path))
+
+    def _work(self):
+        while True:
+            name, path = self._queue.get()
+            try:
+                sound = pygame.mixer.Sound(path)
+            except (pygame.error, FileNotFoundError) as exc:
+                if pygame.mixer.get_init():
+                    self.errors[name] = str(exc)
+                else:
+                    # mixer fechado no meio do caminho: não é erro da faixa
+                    self._requested.discard(name)
+                continue
+            with self._lock:
+                self._decoded[name] = sound
+
+    def _take(self, name):
+        with self._lock:
+            return self._decoded.get(name)
+
+    def _evict(self, name):
+        """Descarta a faixa decodificada `name` (ex.: terminou de sair no crossfade)."""
+        if name in (self._wanted, self._next_name()):
+            return
+        if any(slot.name == name for slot in self._slots or ()):
+            return
+        with self._lock:
+            self._decoded.pop(name, None)
+        self._requested.discard(name)
+
+    def _trim(self):
+        """Descarta faixas decodificadas que não estão tocando nem na fila."""
+        keep = {self._wanted, self._next_name()}
+        keep.update(slot.name for slot in self._slots or () if slot.name is not None)
+        with self._lock:
+            for name in list(self._decoded):
+                if len(self._decoded) <= TRACK_CACHE_SIZE:
+                    break
+                if name not in keep:
+                    del self._decoded[name]
+                    self._requested.discard(name)
+
+    # ------------------------------------------------------------------ #
+    # Reprodução
+    # ------------------------------------------------------------------ #
+    def _channels(self):
+        if self._slots is None and self.audio.ensure_mixer():
+            group = self.audio.voices.groups.get('music')
+            if group is not None and len(group.channels) >= 2:
+                self._slots = [_Slot(ch) for ch in group.channels[:2]]
+        return self._slots
+
+    def _next_name(self):
+        if not self._playlist or len(self._playlist) < 2:
+            return None
+        return self._playlist[(self._index + 1) % len(self._playlist)]
+
+    def _start(self, name, sound):
+        slots = self._channels()
+        if not slots:
+            return
+        current = slots[self._current] if self._current is not None else None
+        if current is not None and current.name == name and current.target > 0:
+            return  # a mesma faixa já está tocando
+        # faixa tocada pelo stream (ex.: abertura) sai em fade também
+        if pygame.mixer.music.get_busy():
+            pygame.mixer.music.fadeout(int(self.fade * 1000))
+            self.audio.current_music = None
+
+        index = 0 if self._current is None else 1 - self._current
+        incoming = slots[index]
+        incoming.channel.stop()
+        single = not self._playlist or len(self._playlist) < 2
+        incoming.channel.set_volume(0.0)
+        incoming.channel.play(sound, loops=-1 if single else 0)
+        incoming.name = name
+        incoming.sound = sound
+        incoming.started = time.perf_counter()
+        incoming.level = 0.0
+        incoming.target = 1.0
+        if current is not None:
+            current.target = 0.0
+        self._current = index
+
+    def update(self, dt):
+        """Avança crossfades e playlist; chamado uma vez por frame."""
+        if self._wanted is not None:
+            self.prefetch(self._wanted)  # reenvia se a carga anterior não rolou
+            sound = self._take(self._wanted)
+            if sound is not None:
+                self._start(self._wanted, sound)
+                self._wanted = None
+            elif self._wanted in self.errors:
+                self._wanted = None  # arquivo ausente ou inválido: segue em silêncio
+
+        if not self._slots:
+            return
+
+        step = dt / self.fade if self.fade > 0 else 1.0
+        volume = self.audio.music_volume
+        for slot in self._slots:
+            if slot.name is None:
+                continue
+            if slot.level < slot.target:
+                slot.level = min(slot.target, slot.level + step)
+            elif slot.level > slot.target:
+                slot.level = max(slot.target, slot.level - step)
+            if slot.level <= 0.0 and slot.target <= 0.0:
+                slot.channel.stop()
+                name, slot.name, slot.sound = slot.name, None, None
+                self._evict(name)
+                continue
+            slot.channel.set_volume(slot.level * volume)
+
+        following = self._next_name()
+        fading = any(slot.name is not None and slot.target <= 0.0 for slot in self._slots)
+        if following is not None and not fading:
+            # a anterior já saiu: a próxima da playlist decodifica em segundo plano
+            self.prefetch(following)
+
+        # fim da faixa se aproximando: crossfade para a próxima da playlist
+        if following is not None and self._wanted is None and self._current is not None:
+            current = self._slots[self._current]
+            if current.name is not None:
+                remaining = current.sound.get_length() - (time.perf_counter() - current.started)
+                if remaining <= self.fade:
+                    self._index = (self._index + 1) % len(self._playlist)
+                    self.play(following)
+
+        self._trim()
+
+
+# Instância global do gerenciador de música
+music_manager = MusicManager(audio_manager)
+
+# === Playlists por estado ===
+#music_manager.set_playlist("MainMenu", ["menu"])
+music_manager.set_playlist("PhaseService", ["gameplay"])
@@ -0,0 +1,129 @@
+"""
+Módulo que armazena o índice espacial (grade hash) de retângulos interativos.
+
+Cada item (qualquer chave hashável) ocupa as células da grade cobertas pelo
+seu retângulo. A consulta por ponto só olha a célula do ponto, então o
+custo médio é O(1) independente de quantos widgets existem na tela.
+
+A ordem de empilhamento é (camada, ordem de inserção): em camadas iguais, o
+item inserido por último fica "por cima", como no desenho.
+"""
+
+import pygame
+
+
+class SpatialHash:
+    """
+    Grade hash de retângulos com ordem de empilhamento.
+
+    Args:
+        cell_size (int): Lado da célula em pixels.
+    """
+
+    def __init__(self, cell_size=64):
+        self.cell_size = int(cell_size)
+        self._cells = {}      # (cx, cy) -> set de chaves
+        self._entries = {}    # chave -> [rect, span, camada, ordem]
+        self._next_order = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    # ------------------------------------------------------------------ #
+    # Manutenção
+    # ------------------------------------------------------------------ #
+    def _span(self, rect):
+        if rect.width <= 0 or rect.height <= 0:
+            return None
+        cs = self.cell_size
+        return (rect.left // cs, rect.top // cs, (rect.right - 1) // cs, (rect.bottom - 1) // cs)
+
+    def _link(self, key, span, add):
+        if span is None:
+            return
+        x0, y0, x1, y1 = span
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                if add:
+                    self._cells.setdefault((cx, cy), set()).add(key)
+                else:
+                    bucket = self._cells.get((cx, cy))
+                    if bucket is not None:
+                        bucket.discard(key)
+                        if not bucket:
+                            del self._cells[(cx, cy)]
+
+    def insert(self, key, rect, layer=0):
+        """Adiciona (ou reinsere no topo da camada) `key` com o retângulo `rect`."""
+        self.remove(key)
+        rect = pygame.Rect(rect)
+        span = self._span(rect)
+        self._entries[key] = [rect, span, layer, self._next_order]
+        self._next_order += 1
+        self._link(key, span, True)
+
+    def move(self, key, rect):
+        """
+        Atualiza o retângulo de `key` (movimento, escala).
+
+        Só refaz as células quando o conjunto de células coberto muda.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return
+        rect = pygame.Rect(rect)
+        span = self._span(rect)
+        if span != entry[1]:
+            self._link(key, entry[1], False)
+            self._link(key, span, True)
+            entry[1] = span
+        entry[0] = rect
+
+    def set_layer(self, key, layer):
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry[2] = layer
+
+    def remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._link(key, entry[1], False)
+
+    def clear(self):
+        self._cells.clear()
+        self._entries.clear()
+
+    # ------------------------------------------------------------------ #
+    # Consultas
+    # ------------------------------------------------------------------ #
+    def rect_of(self, key):
+        entry = self._entries.get(key)
+        return entry[0] if entry is not None else None
+
+    def at(self, pos, accept=None):
+        """
+        Chaves cujo retângulo contém `pos`, da mais alta para a mais baixa.
+
+        Args:
+            pos (tuple): Ponto consultado.
+            accept (callable | None): Filtro opcional `accept(chave) -> bool`.
+        """
+        cs = self.cell_size
+        bucket = self._cells.get((int(pos[0]) // cs, int(pos[1]) // cs))
+        if not bucket:
+            return []
+        hits = []
+        for key in bucket:
+            rect, _, layer, order = self._entries[key]
+            if rect.collidepoint(pos) and (accept is None or accept(key)):
+                hits.append((layer, order, key))
+        hits.sort(key=lambda h: (h[0], h[1]), reverse=True)
+        return [key for _, _, key in hits]
+
+    def topmost(self, pos, accept=None):
+        """Chave mais alta sob `pos` (ou None)."""
+        hits = self.at(pos, accept)
+        return hits[0] if hits else None
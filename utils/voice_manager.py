@@ -0,0 +1,128 @@
+"""
+Módulo que armazena o gerenciador de vozes dos efeitos sonoros.
+
+`Sound.play()` pega qualquer canal livre do mixer (ou rouba um ao acaso);
+numa varredura rápida de hover sobre os cards, dezenas de "hover" se
+sobrepõem e disputam canais com o resto do jogo. Aqui os canais são
+RESERVADOS em grupos por categoria (UI, gameplay, ambiente) e cada som
+tem limite de vozes simultâneas e intervalo mínimo entre disparos.
+"""
+
+import time
+
+import pygame
+
+
+class ChannelGroup:
+    """
+    Conjunto fixo de canais reservados para uma categoria.
+
+    Args:
+        name (str): Nome da categoria.
+        channels (list[pygame.mixer.Channel]): Canais do grupo.
+    """
+
+    def __init__(self, name, channels):
+        self.name = name
+        self.channels = channels
+        self.started = [0.0] * len(channels)   # instante do último disparo por canal
+        self.playing = [None] * len(channels)  # nome do som disparado em cada canal
+
+    def voices_of(self, sound_name):
+        """Índices dos canais ainda tocando `sound_name` (mais antigo primeiro)."""
+        voices = [i for i, ch in enumerate(self.channels)
+                  if self.playing[i] == sound_name and ch.get_busy()]
+        voices.sort(key=self.started.__getitem__)
+        return voices
+
+    def free_channel(self):
+        """Índice de um canal livre; se não houver, o de disparo mais antigo."""
+        for i, ch in enumerate(self.channels):
+            if not ch.get_busy():
+                return i, False
+        return min(range(len(self.channels)), key=self.started.__getitem__), True
+
+
+class VoiceManager:
+    """
+    Distribui os disparos de efeitos pelos grupos de canais reservados.
+
+    Args:
+        groups (dict): Categoria -> nº de canais reservados.
+        free_channels (int): Canais sem reserva (para `Sound.play` avulso).
+    """
+
+    def __init__(self, groups, free_channels=4):
+        self.group_sizes = dict(groups)
+        self.free_channels = free_channels
+        self.groups = {}
+        self.last_played = {}  # nome do som -> instante do último disparo
+        self.stats = {"played": 0, "cooldown": 0, "retriggered": 0, "stolen": 0}
+
+    @property
+    def ready(self):
+        return bool(self.groups) or not self.group_sizes
+
+    def setup(self):
+        """Reserva os canais dos grupos (com o mixer já iniciado)."""
+        reserved = sum(self.group_sizes.values())
+        total = reserved + self.free_channels
+        if pygame.mixer.get_num_channels() < total:
+            pygame.mixer.set_num_channels(total)
+        # canais 0..reserved-1 deixam de ser escolhidos por Sound.play()
+        pygame.mixer.set_reserved(reserved)
+        first = 0
+        for name, size in self.group_sizes.items():
+            channels = [pygame.mixer.Channel(i) for i in range(first, first + size)]
+            self.groups[name] = ChannelGroup(name, channels)
+            first += size
+
+    def play(self, name, sound, group, max_voices=1, cooldown=0.0, now=None):
+        """
+        Dispara `sound` no grupo `group` respeitando os limites do som.
+
+        Args:
+            name (str): Nome do som (chave dos limites).
+            max_voices (int): Vozes simultâneas do mesmo som; no limite, a
+                mais antiga é reiniciada em vez de abrir outra.
+            cooldown (float): Segundos mínimos entre dois disparos do som.
+
+        Returns:
+            pygame.mixer.Channel | None: Canal usado (None se descartado).
+        """
+        now = time.perf_counter() if now is None else now
+        last = self.last_played.get(name)
+        if last is not None and now - last < cooldown:
+            self.stats["cooldown"] += 1
+            return None
+
+        chans = self.groups.get(group)
+        if chans is None:
+            # categoria sem canais reservados: cai no comportamento padrão
+            self.last_played[name] = now
+            self.stats["played"] += 1
+            return sound.play()
+
+        voices = chans.voices_of(name)
+        if len(voices) >= max_voices:
+            index = voices[0]
+            self.stats["retriggered"] += 1
+        else:
+            index, stolen = chans.free_channel()
+            if stolen:
+                self.stats["stolen"] += 1
+
+        channel = chans.channels[index]
+        channel.play(sound)
+        chans.started[index] = now
+        chans.playing[index] = name
+        self.last_played[name] = now
+        self.stats["played"] += 1
+        return channel
+
+    def stop_group(self, group):
+        """Silencia todos os canais de uma categoria."""
+        chans = self.groups.get(group)
+        if chans is not None:
+            for ch in chans.channels:
+                ch.stop()